@@ -1,9 +1,77 @@
 import speech_recognition as sr
-from docx import Document
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from scipy.io.wavfile import write
 import numpy as np
+from stt_backends import get_stt_backend
+
+
+class RecognizerPool:
+    """
+    One sr.Recognizer per input device, shared across SpeechToText instances.
+
+    A device's energy threshold is calibrated against ambient noise the
+    first time it is opened. After that, dynamic_energy_threshold keeps the
+    threshold tracking the room as audio comes in, so no call pays for
+    another second of calibration.
+    """
+    def __init__(self, pause_threshold=0.8, calibration_seconds=1):
+        """Initialize an empty pool."""
+        self.pause_threshold = pause_threshold
+        self.calibration_seconds = calibration_seconds
+        self._recognizers = {}
+        self._calibrated = set()
+        self._calibration_locks = {}  # device_index -> lock held while that device calibrates
+        self._lock = threading.Lock()
+
+    def recognizer(self, device_index=None):
+        """Returns the shared recognizer for a device (None is the default microphone)."""
+        with self._lock:
+            if device_index not in self._recognizers:
+                recognizer = sr.Recognizer()
+                recognizer.pause_threshold = self.pause_threshold
+                recognizer.dynamic_energy_threshold = True
+                self._recognizers[device_index] = recognizer
+            return self._recognizers[device_index]
+
+    def calibrate(self, source, device_index=None):
+        """
+        Calibrates the device's recognizer on an open source, once per device.
+
+        The device counts as calibrated only once adjust_for_ambient_noise
+        has succeeded. Calibration holds a lock of that device only, so a
+        concurrent caller for the same device waits for the result instead
+        of listening uncalibrated, while other devices and recognizer
+        lookups go ahead.
+        """
+        recognizer = self.recognizer(device_index)
+        with self._lock:
+            if device_index in self._calibrated:
+                return
+            device_lock = self._calibration_locks.setdefault(device_index, threading.Lock())
+        with device_lock:
+            with self._lock:
+                if device_index in self._calibrated:
+                    return  # Calibrated while this call waited
+            recognizer.adjust_for_ambient_noise(source, duration=self.calibration_seconds)
+            with self._lock:
+                self._calibrated.add(device_index)
+        print(f"Calibrated microphone {device_index if device_index is not None else '(default)'}: "
+              f"energy threshold {recognizer.energy_threshold:.0f}")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_recognizer_pool():
+    """Returns the process-wide RecognizerPool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = RecognizerPool()
+        return _pool
+
 
 class SpeechToText:
     """
@@ -13,6 +81,11 @@ class SpeechToText:
     -----------
     language : str
         The language code for speech recognition.
+    backend : object
+        The recognition backend (see stt_backends): the shared local Whisper
+        model by default, or Google.
+    device_index : int or None
+        The microphone to listen on; its recognizer comes from the RecognizerPool.
     stop_listening : bool
         Flag to control the listening loop.
     recognized_text_storage : str
@@ -20,10 +93,12 @@ class SpeechToText:
     
     Methods:
     --------
-    recognize_speech():
-        Captures audio from the microphone and returns the recognized text.
+    recognize_speech(source=None):
+        Captures audio from the microphone (or an already open source) and returns the recognized text.
     recognize_speech_from_file(audio_file):
         Processes audio from a file-like object and returns the recognized text.
+    recognize_speech_from_samples(samples, sample_rate):
+        Transcribes int16 samples in memory and returns the recognized text.
     continuous_speech_to_text():
         Continuously performs speech recognition until stopped.
     start_listening():
@@ -36,33 +111,40 @@ class SpeechToText:
         Returns the recognized text.
     """
     
-    def __init__(self, language='en-US'):
-        """Initialize the speech recognizer and default settings."""
-        self.recognizer = sr.Recognizer()
+    def __init__(self, language='en-US', backend=None, device_index=None):
+        """Initialize the speech recognizer and default settings.
+        backend is a backend name ('whisper', 'google') or instance; models are shared process-wide."""
+        self.device_index = device_index
+        self.recognizer = get_recognizer_pool().recognizer(device_index)
+        if backend is None or isinstance(backend, str):
+            backend = get_stt_backend(backend)
+        self.backend = backend
         self.stop_listening = False
         self.recognized_text_storage = ""
         self.language = language  # Set the language based on input
 
-    def recognize_speech(self):
+    def recognize_speech(self, source=None):
         """
         Captures audio from the microphone and returns recognized text.
         
+        Parameters:
+        -----------
+        source : sr.Microphone, optional
+            An already open microphone; without one, the device is opened for this phrase.
+        
         Returns:
         --------
         str : Recognized text or error message.
         """
-        mic = sr.Microphone()
-
         try:
-            with mic as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
-                self.recognizer.energy_threshold = 300
-                self.recognizer.pause_threshold = 0.8
-
-                print("Listening...")
-                audio = self.recognizer.listen(source, phrase_time_limit=8)
+            print("Listening...")
+            if source is None:
+                with sr.Microphone(device_index=self.device_index) as source:
+                    audio = self.listen(source)
+            else:
+                audio = self.listen(source)
 
-            text = self.recognizer.recognize_google(audio, language=self.language)
+            text = self.backend.transcribe(audio, self.language)
             return text
 
         except sr.RequestError:
@@ -72,6 +154,11 @@ class SpeechToText:
         except Exception as e:
             return f"[Error: {str(e)}]"
 
+    def listen(self, source, timeout=None):
+        """Calibrates the device once, then records one phrase from an open source."""
+        get_recognizer_pool().calibrate(source, self.device_index)
+        return self.recognizer.listen(source, timeout=timeout, phrase_time_limit=8)
+
     def recognize_speech_from_file(self, audio_file):
         """
         Processes audio from a file-like object and returns recognized text.
@@ -88,8 +175,33 @@ class SpeechToText:
         try:
             with sr.AudioFile(audio_file) as source:
                 audio = self.recognizer.record(source)
-                text = self.recognizer.recognize_google(audio, language=self.language)
-                return text
+            text = self.backend.transcribe(audio, self.language)
+            return text
+        except sr.RequestError:
+            return "[Error: Unable to reach the speech recognition service]"
+        except sr.UnknownValueError:
+            return "[Error: Could not understand audio]"
+        except Exception as e:
+            return f"[Error: {str(e)}]"
+
+    def recognize_speech_from_samples(self, samples, sample_rate=16000):
+        """
+        Transcribes int16 mono samples directly, without writing a WAV file.
+        
+        Parameters:
+        -----------
+        samples : numpy.ndarray
+            int16 mono audio, e.g. one segment from audio_capture.MicrophoneCapture.
+        sample_rate : int
+            The sample rate of the audio.
+        
+        Returns:
+        --------
+        str : Recognized text or error message.
+        """
+        try:
+            audio = sr.AudioData(np.ascontiguousarray(samples, dtype=np.int16).tobytes(), sample_rate, 2)
+            return self.backend.transcribe(audio, self.language)
         except sr.RequestError:
             return "[Error: Unable to reach the speech recognition service]"
         except sr.UnknownValueError:
@@ -98,12 +210,33 @@ class SpeechToText:
             return f"[Error: {str(e)}]"
 
     def continuous_speech_to_text(self):
-        """Continuously performs speech recognition until stopped."""
-        while not self.stop_listening:
-            recognized_text = self.recognize_speech()
-            if recognized_text and not recognized_text.startswith("[Error"):
-                print(f"Recognized: {recognized_text}")
-                self.recognized_text_storage += recognized_text + " "
+        """
+        Continuously performs speech recognition until stopped.
+
+        The microphone stays open for the whole session, and each phrase is
+        transcribed on a background thread while the next one is recorded.
+        """
+        transcriber = ThreadPoolExecutor(max_workers=1)  # One worker keeps phrases in order
+        with sr.Microphone(device_index=self.device_index) as source:
+            while not self.stop_listening:
+                try:
+                    # The timeout lets the loop notice stop_listening during silence
+                    audio = self.listen(source, timeout=1)
+                except sr.WaitTimeoutError:
+                    continue
+                transcriber.submit(self._store_phrase, audio)
+        transcriber.shutdown(wait=True)
+
+    def _store_phrase(self, audio):
+        try:
+            recognized_text = self.backend.transcribe(audio, self.language)
+        except (sr.RequestError, sr.UnknownValueError):
+            return
+        except Exception as e:
+            print(f"[Error: {str(e)}]")
+            return
+        print(f"Recognized: {recognized_text}")
+        self.recognized_text_storage += recognized_text + " "
 
     def start_listening(self):
         """Starts the speech-to-text conversion in a separate thread."""
@@ -126,6 +259,8 @@ class SpeechToText:
             The name of the file to save the document as.
         """
         if self.recognized_text_storage.strip():
+            from docx import Document
+
             doc = Document()
             doc.add_heading(f'{self.language} Speech to Text', 0)
             doc.add_paragraph(self.recognized_text_storage.strip())
@@ -157,6 +292,8 @@ if __name__ == "__main__":
         print("Invalid choice, defaulting to English.")
         language_code = 'en-US'
 
+    from scipy.io.wavfile import write
+
     stt = SpeechToText(language=language_code)
     audio_data = np.zeros((44100 * 5,), dtype=np.int16)  # Example audio data
     audio_buffer = BytesIO()
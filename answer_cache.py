@@ -0,0 +1,111 @@
+import threading
+import time
+
+import numpy as np
+
+
+class SemanticAnswerCache:
+    """
+    A semantic cache of generated answers.
+
+    Answers are stored per resolved state with the L2-normalized embedding
+    of the query that produced them. A later query for the same state is
+    served from the cache when its cosine similarity to a stored query is at
+    least `threshold` and the state's collection fingerprint is unchanged.
+    Entries expire after `ttl` seconds, and the least recently used entries
+    are evicted beyond `max_entries`.
+    """
+    def __init__(self, threshold=0.92, ttl=24 * 3600, max_entries=512):
+        """
+        Initialize an empty cache.
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}  # state -> {"fingerprint", "matrix", "answers", "created", "last_used"}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @staticmethod
+    def _normalize(embedding):
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, state, embedding, fingerprint):
+        """
+        Return a cached answer for a semantically similar query, or None.
+        """
+        query = self._normalize(embedding)
+        now = time.time()
+        with self._lock:
+            bucket = self._bucket(state, fingerprint)
+            self._expire(bucket, now)
+            if bucket["answers"]:
+                similarities = bucket["matrix"] @ query
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.threshold:
+                    bucket["last_used"][best] = now
+                    self.stats["hits"] += 1
+                    return bucket["answers"][best]
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, state, embedding, fingerprint, answer):
+        """
+        Store an answer for a query embedding.
+        """
+        now = time.time()
+        with self._lock:
+            bucket = self._bucket(state, fingerprint)
+            bucket["matrix"] = np.vstack([bucket["matrix"], self._normalize(embedding)[None, :]]) \
+                if bucket["answers"] else self._normalize(embedding)[None, :]
+            bucket["answers"].append(answer)
+            bucket["created"].append(now)
+            bucket["last_used"].append(now)
+            while sum(len(b["answers"]) for b in self._entries.values()) > self.max_entries:
+                self._evict_lru()
+
+    def invalidate(self, state=None):
+        """
+        Drop cached answers for one state, or for all states.
+        """
+        with self._lock:
+            if state is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(state, None)
+            self.stats["invalidations"] += 1
+
+    def hit_rate(self):
+        """Returns the fraction of lookups served from the cache."""
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+    def _bucket(self, state, fingerprint):
+        bucket = self._entries.get(state)
+        if bucket is None or bucket["fingerprint"] != fingerprint:
+            if bucket is not None:
+                self.stats["invalidations"] += 1  # The collection changed since these answers were made
+            bucket = {"fingerprint": fingerprint, "matrix": None, "answers": [], "created": [], "last_used": []}
+            self._entries[state] = bucket
+        return bucket
+
+    def _expire(self, bucket, now):
+        keep = [i for i, created in enumerate(bucket["created"]) if now - created < self.ttl]
+        if len(keep) != len(bucket["answers"]):
+            self._keep(bucket, keep)
+
+    def _evict_lru(self):
+        state, index = min(((state, i) for state, bucket in self._entries.items()
+                            for i in range(len(bucket["answers"]))),
+                           key=lambda entry: self._entries[entry[0]]["last_used"][entry[1]])
+        bucket = self._entries[state]
+        self._keep(bucket, [i for i in range(len(bucket["answers"])) if i != index])
+        self.stats["evictions"] += 1
+
+    @staticmethod
+    def _keep(bucket, indices):
+        bucket["matrix"] = bucket["matrix"][indices] if indices else None
+        for field in ("answers", "created", "last_used"):
+            bucket[field] = [bucket[field][i] for i in indices]
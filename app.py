@@ -1,11 +1,15 @@
 import streamlit as st
-import sounddevice as sd
-import numpy as np
-from scipy.io.wavfile import write
-from io import BytesIO
-from deep_translator import GoogleTranslator
-from SpeechToText import SpeechToText  # Import your SpeechToText class
-from rag_llama_chroma import get_response
+from translation_service import get_translation_service
+
+@st.cache_resource
+def load_rag_engine():
+    """Build the RAG engine once per process and share it across sessions and reruns."""
+    # Chroma, the embedding model and the Ollama client load on the first query, not the first render
+    from rag_llama_chroma import get_engine
+
+    engine = get_engine()
+    engine.warm_up()
+    return engine
 
 # Path to the generated logo (Ensure it's in the same directory or adjust the path)
 LOGO_PATH = "logo.png"
@@ -13,49 +17,62 @@ LOGO_PATH = "logo.png"
 # Initialize session state variables
 if "recording" not in st.session_state:
     st.session_state.recording = False
-    st.session_state.audio_data = []
+    st.session_state.capture = None  # MicrophoneCapture while recording
 if "show_tasks" not in st.session_state:
     st.session_state.show_tasks = False  # Controls task list visibility
 if "task_list" not in st.session_state:
     st.session_state.task_list = {}
 if "gen_ai_response" not in st.session_state:
     st.session_state.gen_ai_response = None  # Stores AI response
-
-def start_recording(samplerate=44100):
-    """Start recording audio."""
+if "pending_query" not in st.session_state:
+    st.session_state.pending_query = None  # Query whose response is streamed below
+
+def get_speech_to_text(language):
+    """Reuse one SpeechToText per session and language; recognizers and models are shared process-wide."""
+    processors = st.session_state.setdefault("stt_processors", {})
+    if language not in processors:
+        from SpeechToText import SpeechToText  # Speech recognition is only loaded for voice input
+        processors[language] = SpeechToText(language=language)
+    return processors[language]
+
+def start_recording(language):
+    """Start recording audio in the background; speech is transcribed while the user talks."""
+    from audio_capture import MicrophoneCapture
+
+    stt_processor = get_speech_to_text(language)
+
+    def transcribe(samples, sample_rate):
+        text = stt_processor.recognize_speech_from_samples(samples, sample_rate)
+        if text.startswith("[Error"):
+            print(f"Segment not transcribed: {text}")
+            return ""
+        return text
+
+    capture = MicrophoneCapture(transcribe)
+    capture.start()
+    st.session_state.capture = capture
     st.session_state.recording = True
-    st.session_state.audio_data = []  # Store audio chunks
-
-    with sd.InputStream(samplerate=samplerate, channels=1, dtype="int16") as stream:
-        st.info("Recording... Click 'Stop Recording' to end.")
-        while st.session_state.recording:
-            audio_chunk, _ = stream.read(1024)
-            st.session_state.audio_data.append(audio_chunk)
+    st.info("Recording... Click 'Stop Recording' to end.")
 
 def stop_recording(language):
-    """Stop recording and process audio."""
+    """Stop recording and process the transcript."""
     st.session_state.recording = False
-    if st.session_state.audio_data:
-        audio_data = np.concatenate(st.session_state.audio_data, axis=0)
-        process_audio(audio_data, language)
-
-def process_audio(audio_data, language):
-    """Process recorded audio and generate AI response."""
-    audio_buffer = BytesIO()
-    write(audio_buffer, 44100, audio_data)  # Save as WAV
-    audio_buffer.seek(0)
-
-    stt_processor = SpeechToText(language=language)
-    transcribed_text = stt_processor.recognize_speech_from_file(audio_buffer)
-    
+    capture, st.session_state.capture = st.session_state.capture, None
+    if capture is not None:
+        process_audio(capture.stop(), language)
+
+def process_audio(transcribed_text, language):
+    """Process the transcript of a recording and generate AI response."""
+    transcribed_text = transcribed_text or "[Error: Could not understand audio]"
+
     st.text_area("Transcribed Text", transcribed_text, height=150)
 
     if transcribed_text and not transcribed_text.startswith("[Error"):
         if language == 'kn-IN':
             # Translate to English for processing
-            transcribed_text = GoogleTranslator(source='kn', target='en').translate(transcribed_text)
+            transcribed_text = get_translation_service().translate(transcribed_text, 'kn', 'en')
       
-        st.session_state.gen_ai_response = get_response(transcribed_text) # Placeholder
+        st.session_state.pending_query = transcribed_text
         st.session_state.show_tasks = True  # Show task list after response
 
 # Streamlit app setup
@@ -90,7 +107,7 @@ if input_mode == "🎙️ Voice Input":
     col1, col2 = st.columns(2)
     with col1:
         if st.button("🎙️ Start Recording"):
-            start_recording()
+            start_recording(language=language_code)
 
     with col2:
         if st.button("🛑 Stop Recording"):
@@ -101,7 +118,7 @@ elif input_mode == "⌨️ Text Input":
         user_text = st.text_area("Enter your text:", "")
         if st.button("Submit Text"):
             if user_text:
-                st.session_state.gen_ai_response = get_response(user_text)  # Placeholder
+                st.session_state.pending_query = user_text
                 st.session_state.show_tasks = True  # Show task list after response
             else:
                 st.warning("Please enter some text before submitting.")
@@ -113,12 +130,18 @@ st.markdown("<hr>", unsafe_allow_html=True)
 # "New Chat" button to reset everything
 if st.button("🆕 New Chat"):
     st.session_state.gen_ai_response = None
+    st.session_state.pending_query = None
     st.session_state.show_tasks = False
     st.session_state.task_list = {f"task_{i}": False for i in range(7)}
     st.rerun()  # Refresh UI
 
 # Display AI Response if available
-if st.session_state.gen_ai_response:
+if st.session_state.pending_query:
+    # Stream tokens live; the full text is kept for later reruns
+    st.subheader("AI Response")
+    query, st.session_state.pending_query = st.session_state.pending_query, None
+    st.session_state.gen_ai_response = st.write_stream(load_rag_engine().stream_response(query))
+elif st.session_state.gen_ai_response:
     st.text_area("AI Response", st.session_state.gen_ai_response, height=150)
 
 # Define task list
@@ -0,0 +1,165 @@
+import asyncio
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+
+import ollama
+
+from rag_llama_chroma import get_engine
+from translation_service import get_translation_service
+
+
+class ModelScheduler:
+    """
+    A bounded-concurrency gate in front of the single local model.
+
+    Ollama serves one generation at a time on CPU, so extra requests wait
+    here instead of piling up inside the server. queue_depth and active are
+    exposed for monitoring. asyncio primitives belong to one event loop, so
+    each running loop (e.g. every asyncio.run call, or Streamlit's per-session
+    loops) gets its own semaphore.
+    """
+    def __init__(self, max_concurrent=1):
+        """
+        Initialize the scheduler with the number of generations allowed at once.
+        """
+        self.max_concurrent = max_concurrent
+        self._semaphores = weakref.WeakKeyDictionary()  # event loop -> asyncio.Semaphore
+        self.waiting = 0
+        self.active = 0
+        self.stats = {"completed": 0, "total_wait": 0.0, "max_queue_depth": 0}
+
+    @property
+    def queue_depth(self):
+        """Number of requests waiting for a model slot."""
+        return self.waiting
+
+    def _semaphore(self):
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphores[loop]
+
+    @asynccontextmanager
+    async def slot(self):
+        """Wait for and hold a model slot."""
+        semaphore = self._semaphore()
+        start = time.perf_counter()
+        self.waiting += 1
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self.waiting)
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.stats["total_wait"] += time.perf_counter() - start
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.stats["completed"] += 1
+            semaphore.release()
+
+
+class AsyncRagEngine:
+    """
+    An asyncio query path built on a RagEngine.
+
+    Blocking work (translation, state routing, query embedding and the
+    Chroma query) runs in a thread pool, and the Ollama calls use the async
+    client. Every model call goes through a ModelScheduler. Answers share
+    the engine's semantic cache. Like the scheduler's semaphore, the async
+    client is created per running event loop, on first use.
+    """
+    def __init__(self, engine=None, max_concurrent_generations=1, executor_workers=8, host=None):
+        """
+        Initialize the async engine around a (shared) RagEngine.
+        """
+        self.engine = engine or get_engine()
+        self.host = host
+        self._clients = weakref.WeakKeyDictionary()  # event loop -> ollama.AsyncClient
+        self.scheduler = ModelScheduler(max_concurrent_generations)
+        self._executor = ThreadPoolExecutor(max_workers=executor_workers)
+
+    @property
+    def client(self):
+        """The ollama.AsyncClient of the running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop not in self._clients:
+            self._clients[loop] = ollama.AsyncClient(host=self.host)
+        return self._clients[loop]
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking call in the engine's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def translate(self, text, src, dest='en'):
+        """
+        Translate text with the shared TranslationService without blocking the loop.
+        """
+        return await self._run(get_translation_service().translate, text, src, dest)
+
+    async def route_and_embed(self, user_query):
+        """
+        Resolve the states and embed the query concurrently, both off the loop.
+        """
+        states, query_embeddings = await asyncio.gather(self._run(self.engine.resolve_states, user_query),
+                                                        self._run(self.engine.embed_query, user_query))
+        print(f"States extracted from user query: {states or 'all'}")
+        return states, query_embeddings
+
+    async def get_response(self, user_query, src_lang=None):
+        """
+        Get a response from the AI model based on user input.
+        Pass src_lang (e.g. 'kn') to translate the query to English first.
+        """
+        if src_lang and src_lang != 'en':
+            user_query = await self.translate(user_query, src_lang)
+
+        states, query_embeddings = await self.route_and_embed(user_query)
+        cached = await self._run(self.engine.cached_answer, states, query_embeddings)
+        if cached is not None:
+            return cached
+
+        context = await self._run(self.engine.retrieve_context, user_query, states, query_embeddings)
+        if context is None:
+            return "No relevant information found in the database."
+
+        messages = self.engine.ollama_model.build_messages(user_query, context)
+        async with self.scheduler.slot():
+            response = await self.client.chat(model=self.engine.ollama_model.model_name, messages=messages)
+        answer = response['message']['content'].replace("**", "").replace("*", "")
+        await self._run(self.engine.cache_answer, states, query_embeddings, answer)
+        return answer
+
+    async def stream_response(self, user_query, src_lang=None):
+        """
+        Stream a response from the AI model token by token.
+        """
+        if src_lang and src_lang != 'en':
+            user_query = await self.translate(user_query, src_lang)
+
+        states, query_embeddings = await self.route_and_embed(user_query)
+        cached = await self._run(self.engine.cached_answer, states, query_embeddings)
+        if cached is not None:
+            yield cached
+            return
+
+        context = await self._run(self.engine.retrieve_context, user_query, states, query_embeddings)
+        if context is None:
+            yield "No relevant information found in the database."
+            return
+
+        messages = self.engine.ollama_model.build_messages(user_query, context)
+        tokens = []
+        async with self.scheduler.slot():
+            async for chunk in await self.client.chat(model=self.engine.ollama_model.model_name,
+                                                      messages=messages, stream=True):
+                token = chunk['message']['content'].replace("*", "")
+                if token:
+                    tokens.append(token)
+                    yield token
+        await self._run(self.engine.cache_answer, states, query_embeddings, "".join(tokens))
@@ -0,0 +1,300 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy.signal import firwin, lfilter
+
+STT_RATE = 16000  # What the speech recognizers expect
+
+
+class RingBuffer:
+    """
+    A preallocated, thread-safe ring buffer of float32 samples.
+
+    The audio callback writes into it and a single reader drains it. Samples
+    are addressed by their absolute index since the start of the stream, so
+    the reader can tell when it fell behind and samples were overwritten.
+    """
+    def __init__(self, capacity):
+        """
+        Initialize a buffer holding `capacity` samples.
+        """
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.float32)
+        self._written = 0  # Absolute index of the next sample to write
+        self._read = 0     # Absolute index of the next sample to read
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def write(self, samples):
+        """Append samples, overwriting the oldest ones when full."""
+        samples = samples[-self.capacity:]
+        with self._lock:
+            start = self._written % self.capacity
+            first = min(len(samples), self.capacity - start)
+            self._data[start:start + first] = samples[:first]
+            self._data[:len(samples) - first] = samples[first:]
+            self._written += len(samples)
+
+    def read(self):
+        """Return every sample written since the last read (possibly empty)."""
+        with self._lock:
+            if self._written - self._read > self.capacity:
+                self.dropped += self._written - self._read - self.capacity
+                self._read = self._written - self.capacity
+            count = self._written - self._read
+            start = self._read % self.capacity
+            first = min(count, self.capacity - start)
+            samples = np.concatenate([self._data[start:start + first], self._data[:count - first]])
+            self._read = self._written
+        return samples
+
+
+class StreamingResampler:
+    """
+    Resamples a mono stream block by block without seams between blocks.
+
+    A low-pass FIR filter (with its state carried across blocks) removes
+    content above the target Nyquist frequency, then samples are taken by
+    linear interpolation at a fractional position that also carries over.
+    """
+    def __init__(self, from_rate, to_rate=STT_RATE, taps=63):
+        """
+        Initialize the resampler for a rate conversion.
+        """
+        self.from_rate = from_rate
+        self.to_rate = to_rate
+        self.step = from_rate / to_rate
+        self._passthrough = from_rate == to_rate
+        if not self._passthrough and from_rate > to_rate:
+            self._taps = firwin(taps, 0.45 * to_rate, fs=from_rate).astype(np.float32)
+            self._state = np.zeros(taps - 1, dtype=np.float32)
+        else:
+            self._taps = None
+        # Fractional index of the next output sample, counted from the last
+        # sample of the previous block (index 0 of the next signal)
+        self._position = 1.0
+        self._last = np.zeros(1, dtype=np.float32)
+
+    def process(self, samples):
+        """Resample one block; returns float32 samples at to_rate."""
+        if self._passthrough or not len(samples):
+            return samples.astype(np.float32, copy=False)
+        if self._taps is not None:
+            samples, self._state = lfilter(self._taps, 1.0, samples, zi=self._state)
+        signal = np.concatenate([self._last, samples.astype(np.float32, copy=False)])
+        end = len(signal) - 1
+        positions = np.arange(self._position, end + 1e-9, self.step)
+        out = np.interp(positions, np.arange(len(signal)), signal).astype(np.float32)
+        self._position = (positions[-1] + self.step if len(positions) else self._position) - end
+        self._last = signal[-1:]
+        return out
+
+
+class EnergyVAD:
+    """
+    Splits a 16 kHz stream into speech segments by frame energy.
+
+    The noise floor adapts to the room: it follows quiet frames down
+    quickly and creeps up slowly. A frame is speech when it is ratio times
+    louder than the floor. A segment ends after hangover_seconds of silence
+    or at max_segment_seconds, and keeps preroll_seconds before the
+    first speech frame so word onsets are not clipped.
+    """
+    def __init__(self, rate=STT_RATE, frame_ms=30, ratio=3.0, min_level=0.003, hangover_seconds=0.6,
+                 preroll_seconds=0.3, min_speech_seconds=0.25, max_segment_seconds=15):
+        """
+        Initialize the detector with its thresholds.
+        """
+        self.frame = rate * frame_ms // 1000
+        self.rate = rate
+        self.ratio = ratio
+        self.min_level = min_level
+        self.hangover_frames = int(hangover_seconds * 1000 / frame_ms)
+        self.preroll_frames = int(preroll_seconds * 1000 / frame_ms)
+        self.min_speech_frames = int(min_speech_seconds * 1000 / frame_ms)
+        # Preallocated segment storage bounds memory per segment
+        self._segment = np.zeros(int(max_segment_seconds * rate), dtype=np.float32)
+        self._length = 0
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._preroll = []
+        # Start at the absolute threshold, so speech from the first frame is not taken for noise
+        self._noise = min_level / ratio
+        self._speech_frames = 0
+        self._silent_frames = 0
+        self.in_speech = False
+
+    def process(self, samples):
+        """Feed samples; returns the list of segments (float32 arrays) completed by them."""
+        samples = np.concatenate([self._pending, samples]) if len(self._pending) else samples
+        frames = len(samples) // self.frame
+        self._pending = samples[frames * self.frame:]
+        segments = []
+        for i in range(frames):
+            frame = samples[i * self.frame:(i + 1) * self.frame]
+            level = float(np.sqrt(np.mean(frame * frame)))
+            if level < self._noise:
+                self._noise = 0.5 * self._noise + 0.5 * level
+            else:
+                self._noise *= 1.002
+            speech = level > max(self.ratio * self._noise, self.min_level)
+            segment = self._step(frame, speech)
+            if segment is not None:
+                segments.append(segment)
+        return segments
+
+    def _step(self, frame, speech):
+        if not self.in_speech:
+            self._preroll.append(frame)
+            if len(self._preroll) > self.preroll_frames + 1:
+                self._preroll.pop(0)
+            if speech:
+                self.in_speech = True
+                self._speech_frames, self._silent_frames = 1, 0
+                self._length = 0
+                for earlier in self._preroll:
+                    self._append(earlier)
+                self._preroll = []
+            return None
+
+        self._speech_frames += speech
+        self._silent_frames = 0 if speech else self._silent_frames + 1
+        if not self._append(frame):
+            # Segment is full: close it and continue the speech in a new one
+            segment = self._close()
+            self.in_speech = True
+            self._speech_frames, self._silent_frames, self._length = int(speech), 0, 0
+            self._append(frame)
+            return segment
+        if self._silent_frames > self.hangover_frames:
+            return self._close()
+        return None
+
+    def _append(self, frame):
+        if self._length + len(frame) > len(self._segment):
+            return False
+        self._segment[self._length:self._length + len(frame)] = frame
+        self._length += len(frame)
+        return True
+
+    def _close(self):
+        self.in_speech = False
+        if self._speech_frames < self.min_speech_frames:
+            return None  # A click or cough, not speech
+        return self._segment[:self._length].copy()
+
+    def flush(self):
+        """Close the segment in progress, if any; returns it or None."""
+        if not self.in_speech:
+            return None
+        return self._close()
+
+
+def to_int16(samples):
+    """Converts float32 samples in [-1, 1] to int16."""
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+class MicrophoneCapture:
+    """
+    Non-blocking microphone capture with incremental transcription.
+
+    A callback-driven sounddevice.InputStream writes mono samples into a
+    RingBuffer. A worker thread drains the buffer, resamples to 16 kHz and
+    splits speech segments with EnergyVAD. Each finished segment is handed
+    to `transcribe(int16_samples, sample_rate)` on a single transcription
+    thread while the user keeps speaking, so stop() only waits for the last
+    segment. Memory is bounded by the ring buffer and the segment limit.
+    """
+    def __init__(self, transcribe, samplerate=None, device=None, buffer_seconds=10, poll_interval=0.05, vad=None):
+        """
+        Initialize the capture; samplerate defaults to 16 kHz, or the device's rate if it refuses that.
+        """
+        self.transcribe = transcribe
+        self.samplerate = samplerate
+        self.device = device
+        self.buffer_seconds = buffer_seconds
+        self.poll_interval = poll_interval
+        self.vad = vad or EnergyVAD()
+        self._stream = None
+        self._worker = None
+        self._stop = threading.Event()
+        self._transcriber = ThreadPoolExecutor(max_workers=1)
+        self._results = []  # Futures, in segment order
+        self.status = queue.Queue()  # PortAudio overflow notices
+        self.stats = {"segments": 0, "audio_seconds": 0.0, "stop_latency": None}
+
+    def _open_stream(self):
+        import sounddevice as sd
+
+        rates = [self.samplerate] if self.samplerate else [STT_RATE, None]
+        for rate in rates:
+            try:
+                return sd.InputStream(samplerate=rate, device=self.device, channels=1, dtype="float32",
+                                      callback=self._callback)
+            except sd.PortAudioError:
+                if rate is rates[-1]:
+                    raise
+
+    def _callback(self, indata, frames, time_info, status):
+        if status:
+            self.status.put(str(status))
+        self.buffer.write(indata[:, 0] if indata.ndim > 1 else indata)
+
+    def start(self):
+        """Open the microphone and start segmenting; returns immediately."""
+        self._stream = self._open_stream()
+        rate = int(self._stream.samplerate)
+        self.buffer = RingBuffer(int(self.buffer_seconds * rate))
+        self.resampler = StreamingResampler(rate, STT_RATE)
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+        self._stream.start()
+        print(f"Recording at {rate} Hz, transcribing at {STT_RATE} Hz")
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._drain()
+            time.sleep(self.poll_interval)
+        self._drain()
+
+    def _drain(self):
+        samples = self.buffer.read()
+        if len(samples):
+            for segment in self.vad.process(self.resampler.process(samples)):
+                self._submit(segment)
+
+    def _submit(self, segment):
+        self.stats["segments"] += 1
+        self.stats["audio_seconds"] += len(segment) / STT_RATE
+        self._results.append(self._transcriber.submit(self.transcribe, to_int16(segment), STT_RATE))
+
+    def partial_transcript(self):
+        """Text of the segments transcribed so far."""
+        return " ".join(future.result() for future in self._results if future.done() and future.result())
+
+    def stop(self):
+        """
+        Stop recording and return the full transcript.
+        """
+        start = time.perf_counter()
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join()
+        segment = self.vad.flush()
+        if segment is not None:
+            self._submit(segment)
+        texts = [future.result() for future in self._results]
+        self._transcriber.shutdown()
+        self.stats["stop_latency"] = time.perf_counter() - start
+        if self.buffer.dropped:
+            print(f"Warning: {self.buffer.dropped} samples dropped; the segmenter fell behind")
+        print(f"{self.stats['segments']} segments, {self.stats['audio_seconds']:.1f}s of speech, "
+              f"transcript ready {self.stats['stop_latency']:.2f}s after stop")
+        return " ".join(text for text in texts if text)
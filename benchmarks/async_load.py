@@ -0,0 +1,143 @@
+"""
+Load test of the async query path against a local mock Ollama server.
+
+The mock serves /api/chat one request at a time, like a single local model
+on CPU, with a fixed prompt-evaluation delay and per-token delay. A
+temporary Chroma database is seeded with a few documents, so only the mock
+replaces a real service.
+
+Usage:
+    python -m benchmarks.async_load [concurrent_users] [queries_per_user]
+"""
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import ollama
+
+from async_rag import AsyncRagEngine
+from rag_llama_chroma import RagEngine
+
+PROMPT_DELAY = 0.2   # Seconds of simulated prompt evaluation
+TOKEN_DELAY = 0.01   # Seconds per generated token
+TOKENS = 40
+
+QUERIES = [
+    "Elephant crop damage compensation in Karnataka",
+    "How do I report a leopard attack near Bandipur?",
+    "Compensation for cattle killed by tiger in Telangana",
+    "Wild elephant entered a house in Wayanad",
+]
+
+DOCUMENTS = [
+    "Compensation for crop loss caused by elephants is paid per acre as notified by the government.",
+    "Leopard attacks must be reported to the nearest Range Forest Officer within 48 hours.",
+    "Ex-gratia for human death due to wildlife attack is revised by government order.",
+    "Cattle killed by tigers are compensated at the market value assessed by a veterinary officer.",
+]
+
+
+class MockOllamaHandler(BaseHTTPRequestHandler):
+    """Minimal /api/chat endpoint that serializes generations like a single local model."""
+    model_lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        stream = body.get("stream", False)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson" if stream else "application/json")
+        self.end_headers()
+
+        with self.model_lock:
+            time.sleep(PROMPT_DELAY)
+            tokens = []
+            for i in range(TOKENS):
+                time.sleep(TOKEN_DELAY)
+                token = f"token{i} "
+                tokens.append(token)
+                if stream:
+                    self._write_json(body["model"], token, done=False)
+        if stream:
+            self._write_json(body["model"], "", done=True)
+        else:
+            self._write_json(body["model"], "".join(tokens), done=True)
+
+    def _write_json(self, model, content, done):
+        message = {"model": model, "created_at": "2025-01-01T00:00:00Z",
+                   "message": {"role": "assistant", "content": content}, "done": done}
+        self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server():
+    """Starts the mock server on a free port and returns its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockOllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def summarize(name, latencies, elapsed):
+    latencies = sorted(latencies)
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(f"{name:<28} {len(latencies) / elapsed:6.2f} req/s  "
+          f"p50 {statistics.median(latencies):6.2f}s  p95 {p95:6.2f}s")
+
+
+def run_sync(engine, queries, users):
+    """Baseline: the synchronous get_response called from a thread per user."""
+    def timed(query):
+        start = time.perf_counter()
+        engine.get_response(query)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as executor:
+        latencies = list(executor.map(timed, queries))
+    return latencies, time.perf_counter() - start
+
+
+async def run_async(async_engine, queries):
+    """All queries issued at once through AsyncRagEngine."""
+    async def timed(query):
+        start = time.perf_counter()
+        await async_engine.get_response(query)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(timed(query) for query in queries))
+    return latencies, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    per_user = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    queries = [QUERIES[i % len(QUERIES)] for i in range(users * per_user)]
+
+    host = start_mock_server()
+    with tempfile.TemporaryDirectory() as db_path:
+        engine = RagEngine(db_path=db_path, cache_answers=False)
+        engine.ollama_model.client = ollama.Client(host=host)
+        for state_name in ("karnataka", "kerala", "telangana"):
+            engine.store.add_documents(DOCUMENTS, source=f"{state_name}.pdf", metadata={"state": state_name})
+        engine.discover_states()
+        engine.warm_up()
+
+        print(f"{len(queries)} queries from {users} concurrent users against {host}")
+        summarize("sync (thread per user)", *run_sync(engine, queries, users))
+
+        async_engine = AsyncRagEngine(engine=engine, host=host)
+        latencies, elapsed = asyncio.run(run_async(async_engine, queries))
+        summarize("async (scheduler, 1 slot)", latencies, elapsed)
+        stats = async_engine.scheduler.stats
+        print(f"max queue depth {stats['max_queue_depth']}, "
+              f"mean wait {stats['total_wait'] / max(stats['completed'], 1):.2f}s")
+
@@ -0,0 +1,106 @@
+"""
+Time from "stop" to transcript, and peak memory, for the old capture loop
+against MicrophoneCapture.
+
+A synthetic 44.1 kHz recording (speech-like bursts separated by pauses)
+is fed in real time in 1024-sample blocks. The recognizer is simulated
+with a latency of 0.3s plus 0.15s per second of audio, roughly a
+cloud STT round trip, so no microphone or network is needed.
+
+- old: blocks appended to a list, one np.concatenate and WAV write at
+  stop, then the whole recording transcribed
+- new: ring buffer, 16 kHz resampling and VAD segments transcribed
+  while "speaking"
+
+Usage:
+    python -m benchmarks.audio_capture [seconds]
+"""
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+
+import numpy as np
+from scipy.io.wavfile import write
+
+from audio_capture import MicrophoneCapture
+
+RATE = 44100
+BLOCK = 1024
+
+
+def synthetic_recording(seconds, seed=0):
+    """Alternating 2.5s 'utterances' and 1s pauses over low background noise, as int16."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * RATE)) / RATE
+    voice = 0.3 * np.sin(2 * np.pi * 180 * t) * (1 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    speaking = (t % 3.5) < 2.5
+    audio = np.where(speaking, voice, 0.0) + 0.003 * rng.standard_normal(len(t))
+    return (np.clip(audio, -1, 1) * 32767).astype(np.int16)
+
+
+def fake_transcribe(samples, sample_rate):
+    time.sleep(0.3 + 0.15 * len(samples) / sample_rate)
+    return f"<{len(samples) / sample_rate:.1f}s>"
+
+
+def feed(recording, write_block):
+    """Deliver the recording in real time, block by block."""
+    start = time.perf_counter()
+    for i in range(0, len(recording), BLOCK):
+        write_block(recording[i:i + BLOCK])
+        delay = start + (i + BLOCK) / RATE - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def run_old(recording):
+    chunks = []
+    feed(recording, lambda block: chunks.append(block.reshape(-1, 1).copy()))
+    stop = time.perf_counter()
+    audio = np.concatenate(chunks, axis=0)
+    buffer = BytesIO()
+    write(buffer, RATE, audio)
+    text = fake_transcribe(audio, RATE)
+    return time.perf_counter() - stop, text
+
+
+class FakeStream:
+    samplerate = RATE
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def run_new(recording):
+    capture = MicrophoneCapture(fake_transcribe)
+    capture._open_stream = FakeStream  # Blocks are delivered through the callback below
+    capture.start()
+    feed(recording, lambda block: capture._callback((block.astype(np.float32) / 32768).reshape(-1, 1),
+                                                    len(block), None, None))
+    stop = time.perf_counter()
+    text = capture.stop()
+    return time.perf_counter() - stop, text
+
+
+def measure(name, run, recording):
+    tracemalloc.start()
+    latency, text = run(recording)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<4} transcript ready {latency:5.2f}s after stop, peak memory {peak / 2**20:6.1f} MiB, "
+          f"{len(text.split())} pieces")
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    recording = synthetic_recording(seconds)
+    print(f"{seconds:.0f}s recording at {RATE} Hz")
+    measure("old", run_old, recording)
+    measure("new", run_new, recording)
@@ -0,0 +1,81 @@
+"""
+Index size, query latency and prompt length before and after TextChunker.
+
+"before" reproduces the old behaviour: paragraph splitting on blank lines,
+with translated pages stored as one document each. "after" uses the
+default TextChunker for both. OCR and translations come from the OCR
+cache, so run benchmarks.corpus_ingest (or any ingestion) first to prime it.
+
+Usage:
+    python -m benchmarks.chunking
+"""
+import os
+import statistics
+import tempfile
+import time
+
+import chromadb
+
+from benchmarks.corpus_ingest import CORPUS
+from chunker import TextChunker, count_tokens
+from ocr_cache import OCRCache
+from pdf_chunk import PDFTranslator
+from vector_store import VectorStore
+
+QUERIES = [
+    "compensation for human death due to elephant attack",
+    "ex-gratia for permanent disability caused by wildlife",
+    "crop loss compensation per acre",
+    "cattle killed by tiger or leopard compensation amount",
+    "procedure to apply for compensation and documents required",
+    "time limit for paying compensation after the incident",
+]
+
+
+class ParagraphChunker:
+    """The original chunk_text: split on blank lines."""
+    def chunk(self, text):
+        return [para.strip() for para in text.strip().split("\n\n") if para.strip()]
+
+
+class WholePageChunker:
+    """The original translate=True path: the whole page is one document."""
+    def chunk(self, text):
+        return [text] if text.strip() else []
+
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(path) for name in files)
+
+
+def build_and_measure(name, translator, chunker_for):
+    with tempfile.TemporaryDirectory() as db_path:
+        store = VectorStore(f"{name}_benchmark", client=chromadb.PersistentClient(db_path))
+        for path, lang, translate, src_lang in CORPUS:
+            translator.chunker = chunker_for(translate)
+            pages = translator.process_pdf(path, lang, translate=translate, src_lang=src_lang, dest_lang="en", stream=True)
+            store.add_pages(pages, source=path)
+
+        documents = store.collection.get(include=["documents"])["documents"]
+        sizes = [count_tokens(doc) for doc in documents]
+
+        latencies, prompt_tokens = [], []
+        store.query_db(QUERIES[0], n_res=10)  # Warm up
+        for query in QUERIES:
+            start = time.perf_counter()
+            results = store.query_db(query, n_res=10)
+            latencies.append(time.perf_counter() - start)
+            prompt_tokens.append(count_tokens(" ".join(results["documents"][0])))
+
+        print(f"{name:<7} chunks {len(documents):6d}  median tokens {statistics.median(sizes):6.0f}  "
+              f"max {max(sizes):6d}  <5 tokens {sum(size < 5 for size in sizes):5d}  "
+              f"index {directory_size(db_path) / 2**20:6.1f} MiB  "
+              f"query {statistics.mean(latencies) * 1000:6.1f} ms  "
+              f"prompt {statistics.mean(prompt_tokens):6.0f} tokens")
+
+
+if __name__ == "__main__":
+    translator = PDFTranslator(cache=OCRCache())
+    build_and_measure("before", translator,
+                      lambda translate: WholePageChunker() if translate else ParagraphChunker())
+    build_and_measure("after", translator, lambda translate: TextChunker())
@@ -0,0 +1,70 @@
+"""
+Cold-start import profile of the Streamlit apps.
+
+Each app script is run in a fresh interpreter under `-X importtime`, the
+way Streamlit runs it for the first page view (outside a server, so
+widgets return their defaults: text input, nothing submitted). Reported
+per app:
+
+- time to first render: from the start of the script run to its end,
+  imports included, checked against TARGET_SECONDS
+- the heavy feature dependencies that were imported (none should be, as
+  the first render needs none of them)
+- the slowest top-level imports, by cumulative import time
+
+Usage:
+    python -m benchmarks.cold_start [app.py frontend.py ...]
+"""
+import subprocess
+import sys
+
+# Time to first render we aim for on a laptop CPU
+TARGET_SECONDS = 1.0
+
+# Imported only when a feature needs them: OCR, speech, retrieval, translation
+HEAVY_MODULES = ["cv2", "pytesseract", "tesserocr", "pdf2image", "pdfminer", "googletrans", "deep_translator",
+                 "chromadb", "onnxruntime", "ollama", "sounddevice", "scipy", "speech_recognition", "docx",
+                 "faster_whisper"]
+
+RUNNER = """
+import runpy, sys, time, warnings
+warnings.simplefilter("ignore")
+start = time.perf_counter()
+runpy.run_path(sys.argv[1], run_name="__main__")
+print("render_seconds", time.perf_counter() - start)
+print("heavy", ",".join(m for m in sys.argv[2].split(",") if m in sys.modules))
+"""
+
+
+def profile(script):
+    """Returns (seconds to first render, heavy modules imported, [(cumulative us, package)])."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", RUNNER, script, ",".join(HEAVY_MODULES)],
+                            capture_output=True, text=True)
+    seconds, heavy = None, []
+    for line in result.stdout.splitlines():
+        if line.startswith("render_seconds"):
+            seconds = float(line.split()[1])
+        elif line.startswith("heavy"):
+            heavy = [m for m in line[len("heavy"):].strip().split(",") if m]
+    if seconds is None:
+        raise RuntimeError(f"{script} failed:\n{result.stderr[-2000:]}")
+
+    top_level = []
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"; nested imports are indented
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, package = line[len("import time:"):].split("|")
+            if package.strip() and not package.startswith("  ") and cumulative.strip().isdigit():
+                top_level.append((int(cumulative), package.strip()))
+    return seconds, heavy, sorted(top_level, reverse=True)
+
+
+if __name__ == "__main__":
+    scripts = sys.argv[1:] or ["app.py", "frontend.py"]
+    for script in scripts:
+        seconds, heavy, imports = profile(script)
+        verdict = "OK" if seconds <= TARGET_SECONDS else "over target"
+        print(f"{script}: first render {seconds:.2f}s (target {TARGET_SECONDS:.1f}s, {verdict})")
+        print(f"  heavy modules imported: {', '.join(heavy) or 'none'}")
+        for cumulative, package in imports[:8]:
+            print(f"  {cumulative / 1e6:6.2f}s  {package}")
@@ -0,0 +1,90 @@
+"""
+Query latency of the unified knowledge_base collection (filtered by state
+metadata) against the old one-collection-per-state layout.
+
+Both layouts are built in a temporary database from the stored
+embeddings of ./chroma_db's knowledge_base, so nothing is re-embedded and
+both hold exactly the same chunks. Query embeddings are computed once up
+front; the timings cover only the Chroma (and BM25) query.
+
+Usage:
+    python -m benchmarks.collection_layout [repeats]
+"""
+import statistics
+import sys
+import tempfile
+import time
+
+import chromadb
+
+from rag_llama_chroma import RagEngine
+from vector_store import KNOWLEDGE_BASE, VectorStore
+
+QUERIES = [
+    "compensation for crop damage caused by elephants",
+    "ex-gratia for death due to wild animal attack",
+    "compensation for cattle killed by tiger or leopard",
+    "documents required to apply for compensation",
+]
+
+
+def copy_into(source, target, where=None):
+    """Copy chunks (with their embeddings) from one collection into a VectorStore."""
+    stored = source.get(where=where, include=["documents", "embeddings", "metadatas"])
+    batch_size = target.client.get_max_batch_size()
+    for i in range(0, len(stored["ids"]), batch_size):
+        target.collection.upsert(ids=stored["ids"][i:i + batch_size],
+                                 documents=stored["documents"][i:i + batch_size],
+                                 embeddings=stored["embeddings"][i:i + batch_size],
+                                 metadatas=stored["metadatas"][i:i + batch_size])
+    target.rebuild_lexical_index()
+
+
+def timed(func, repeats):
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    engine = RagEngine(cache_answers=False)
+    states = engine.state_list
+    if not states:
+        sys.exit(f"{KNOWLEDGE_BASE} is empty; ingest documents or run migrate_collections.py first.")
+    embeddings = {query: engine.embed_query(query) for query in QUERIES}
+
+    with tempfile.TemporaryDirectory() as db_path:
+        client = chromadb.PersistentClient(db_path)
+        unified = VectorStore(KNOWLEDGE_BASE, client=client, embedding_function=engine.embedding_function)
+        copy_into(engine.store.collection, unified)
+        per_state = {}
+        for state in states:
+            per_state[state] = VectorStore(state + "_knowledge_base", client=client,
+                                           embedding_function=engine.embedding_function)
+            copy_into(engine.store.collection, per_state[state], where={"state": state})
+
+        print(f"{unified.collection.count()} chunks in {len(states)} states, median of {repeats} runs")
+        for hybrid in (False, True):
+            mode = "hybrid" if hybrid else "vector"
+            for state in states:
+                unified_ms = statistics.mean(
+                    timed(lambda: unified.query_db(query, n_res=6, query_embeddings=embeddings[query], hybrid=hybrid,
+                                                   where={"state": state}), repeats) for query in QUERIES)
+                per_state_ms = statistics.mean(
+                    timed(lambda: per_state[state].query_db(query, n_res=6, query_embeddings=embeddings[query],
+                                                            hybrid=hybrid), repeats) for query in QUERIES)
+                print(f"{mode} {state:<12} unified+where {unified_ms:6.1f} ms  per-collection {per_state_ms:6.1f} ms")
+
+            if len(states) > 1:
+                # A cross-state question: one filtered query against one query per collection
+                unified_ms = statistics.mean(
+                    timed(lambda: unified.query_db(query, n_res=6, query_embeddings=embeddings[query], hybrid=hybrid,
+                                                   where=engine.state_filter(states)), repeats) for query in QUERIES)
+                per_state_ms = statistics.mean(
+                    timed(lambda: [store.query_db(query, n_res=6, query_embeddings=embeddings[query], hybrid=hybrid)
+                                   for store in per_state.values()], repeats) for query in QUERIES)
+                print(f"{mode} {'all states':<12} unified+where {unified_ms:6.1f} ms  per-collection {per_state_ms:6.1f} ms")
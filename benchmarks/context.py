@@ -0,0 +1,59 @@
+"""
+Prompt size and prompt-evaluation time with and without ContextAssembler.
+
+"before" joins all 10 retrieved chunks with spaces, as retrieve_context
+used to. "after" uses RagEngine.retrieve_context. Prompt evaluation time is
+read from Ollama's response (prompt_eval_count / prompt_eval_duration), so
+a running Ollama server with the engine's model is required for that
+column; without one, only token counts are printed.
+
+Usage:
+    python -m benchmarks.context
+"""
+import statistics
+
+from chunker import count_tokens
+from gen_ollama import SYSTEM_PROMPT
+from rag_llama_chroma import RagEngine
+
+QUERIES = [
+    "What is the compensation for crop damage caused by elephants?",
+    "Ex-gratia amount for death due to a wild animal attack",
+    "How do I apply for compensation for cattle killed by a leopard?",
+    "Compensation for a house damaged by elephants",
+    "Within how many days is compensation paid?",
+]
+
+
+def prompt_eval(engine, query, context):
+    """Returns (prompt tokens, prompt eval seconds) from Ollama, or None if it is unavailable."""
+    try:
+        response = engine.ollama_model.chat(engine.ollama_model.build_messages(query, context))
+    except Exception as e:
+        print(f"Ollama unavailable: {e}")
+        return None
+    return response['prompt_eval_count'], response['prompt_eval_duration'] / 1e9
+
+
+def measure(name, engine, contexts):
+    tokens = [count_tokens(SYSTEM_PROMPT) + count_tokens(context) for _, context in contexts]
+    line = f"{name:<7} prompt ~{statistics.mean(tokens):6.0f} tokens"
+    evals = [prompt_eval(engine, query, context) for query, context in contexts]
+    if all(evals):
+        line += (f"  ollama prompt {statistics.mean(count for count, _ in evals):6.0f} tokens"
+                 f"  eval {statistics.mean(seconds for _, seconds in evals):6.2f}s")
+    print(line)
+
+
+if __name__ == "__main__":
+    engine = RagEngine(cache_answers=False)
+    before = []
+    for query in QUERIES:
+        where = engine.state_filter(engine.resolve_states(query))
+        results = engine.store.query_db(query, n_res=10, hybrid=False, where=where)
+        before.append((query, " ".join(results["documents"][0])))
+    after = [(query, engine.retrieve_context(query, engine.resolve_states(query))) for query in QUERIES]
+    after = [(query, context) for query, context in after if context]
+
+    measure("before", engine, before)
+    measure("after", engine, after)
@@ -0,0 +1,68 @@
+"""
+Embedding and insert throughput for the full source/ corpus.
+
+OCR results are primed into the OCR cache first, so both runs measure
+chunking, embedding and Chroma writes rather than Tesseract:
+
+- per-page: VectorStore.add_pages, one add call per page
+- batched:  IngestionWriter, cross-page batches embedded on a thread pool
+
+Usage:
+    python -m benchmarks.corpus_ingest [batch_size] [embed_workers]
+"""
+import sys
+import tempfile
+import time
+
+import chromadb
+
+from ingest_writer import IngestionWriter
+from ocr_cache import OCRCache
+from pdf_chunk import PDFTranslator
+from vector_store import VectorStore
+
+# (path, tesseract lang, translate, src_lang)
+CORPUS = [
+    ("karnataka.pdf", "kan", True, "kn"),
+    ("source/crop-loss-gok.pdf", "kan", True, "kn"),
+    ("source/order-gok.pdf", "kan", True, "kn"),
+    ("source/kerala.pdf", "eng", False, "en"),
+    ("source/tamil-nadu.pdf", "tam", True, "ta"),
+    ("source/revised-tn.pdf", "tam", True, "ta"),
+    ("source/telangana.pdf", "eng", False, "te"),
+]
+
+
+def pages_for(translator, path, lang, translate, src_lang):
+    return translator.process_pdf(path, lang, translate=translate, src_lang=src_lang, dest_lang="en", stream=True)
+
+
+if __name__ == "__main__":
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    embed_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    translator = PDFTranslator(cache=OCRCache())
+    for entry in CORPUS:
+        for _ in pages_for(translator, *entry):  # Prime the OCR cache
+            pass
+
+    with tempfile.TemporaryDirectory() as db_path:
+        client = chromadb.PersistentClient(db_path)
+
+        store = VectorStore("per_page_benchmark", client=client)
+        store.embedding_function(["warm up"])
+        start = time.perf_counter()
+        for entry in CORPUS:
+            store.add_pages(pages_for(translator, *entry), source=entry[0])
+        elapsed = time.perf_counter() - start
+        chunks = store.collection.count()
+        print(f"per-page: {chunks} chunks in {elapsed:.1f}s = {chunks / elapsed:.1f} chunks/s")
+
+        store = VectorStore("batched_benchmark", client=client, embedding_function=store.embedding_function)
+        writer = IngestionWriter(store, batch_size=batch_size, embed_workers=embed_workers)
+        for entry in CORPUS:
+            writer.write_pages(pages_for(translator, *entry), source=entry[0])
+        stats = writer.stats
+        print(f"batched:  {stats['chunks']} chunks in {stats['elapsed']:.1f}s = "
+              f"{writer.chunks_per_second():.1f} chunks/s "
+              f"({stats['batches']} batches of <= {writer.batch_size}, {stats['embed_seconds']:.1f}s embedding)")
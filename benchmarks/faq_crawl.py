@@ -0,0 +1,91 @@
+"""
+FAQ crawl throughput against a local fixture server.
+
+The server serves synthetic FAQ pages with a fixed per-request latency and
+answers conditional requests with 304. Compared:
+
+- sequential: the old approach, bare requests.get and html.parser, one page
+  at a time (parsing only)
+- crawl:      FAQCrawler, pooled session and concurrent fetches, storing
+  into an in-memory knowledge base
+- recrawl:    the same crawler again; every page is unchanged
+
+Usage:
+    python -m benchmarks.faq_crawl [pages] [latency_ms] [workers]
+"""
+import hashlib
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import chromadb
+import requests
+from bs4 import BeautifulSoup
+
+from faq_crawler import CrawlState, FAQCrawler
+from vector_store import KNOWLEDGE_BASE, VectorStore
+
+
+def fixture_server(pages, latency):
+    """Starts a threaded HTTP server for {path: html}; returns (server, base_url)."""
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = pages[self.path].encode("utf-8")
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def faq_page(page, items=20):
+    filler = "<div class='nav'>" + "<a href='#'>link</a>" * 300 + "</div>"
+    faqs = "".join(f"<li><strong>How do I apply for service {page}.{i}?</strong>"
+                   f"<p class='para'>Submit form {i} at the range forest office of division {page}.</p></li>"
+                   for i in range(items))
+    return f"<html><body>{filler}<section class='faq-wrap'><ul>{faqs}</ul></section>{filler}</body></html>"
+
+
+if __name__ == "__main__":
+    num_pages = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 200) / 1000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+
+    server, base_url = fixture_server({f"/faq/{i}": faq_page(i) for i in range(num_pages)}, latency)
+    pages = [{"url": f"{base_url}/faq/{i}", "state": "karnataka"} for i in range(num_pages)]
+
+    start = time.perf_counter()
+    for page in pages:
+        soup = BeautifulSoup(requests.get(page["url"]).text, "html.parser")
+        soup.find("section", class_="faq-wrap").find_all("li")
+    sequential = time.perf_counter() - start
+
+    store = VectorStore(KNOWLEDGE_BASE, client=chromadb.EphemeralClient(), index_dir=None)
+    state = CrawlState(None)
+    start = time.perf_counter()
+    FAQCrawler(store, state, workers=workers).crawl(pages)
+    crawl = time.perf_counter() - start
+    start = time.perf_counter()
+    FAQCrawler(store, state, workers=workers).crawl(pages)
+    recrawl = time.perf_counter() - start
+    server.shutdown()
+
+    print(f"{num_pages} pages, {latency * 1000:.0f} ms server latency, {workers} workers")
+    print(f"sequential (fetch + parse only)  {sequential:6.2f}s")
+    print(f"crawl (fetch + parse + embed)    {crawl:6.2f}s")
+    print(f"recrawl (all 304)                {recrawl:6.2f}s")
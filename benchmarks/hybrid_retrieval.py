@@ -0,0 +1,64 @@
+"""
+Known-item retrieval with vector-only and hybrid (vector + BM25) search.
+
+Queries are short spans around numbers (amounts, GO numbers, dates) taken
+from chunks in an existing collection; a query succeeds when its source
+chunk is in the top n results. This is the kind of query pure cosine
+search over OCR text handles worst.
+
+Usage:
+    python -m benchmarks.hybrid_retrieval [state] [queries]
+"""
+import random
+import re
+import statistics
+import sys
+import time
+
+from lexical_index import tokenize
+from rag_llama_chroma import RagEngine
+
+
+def known_item_queries(store, count, where=None, seed=0):
+    """Returns (query, chunk_id) pairs around numeric tokens of sampled chunks."""
+    stored = store.collection.get(where=where, include=["documents"])
+    pairs = []
+    for chunk_id, document in zip(stored["ids"], stored["documents"]):
+        words = document.split()
+        numeric = [i for i, word in enumerate(words) if re.search(r"\d", word)]
+        if numeric and len(words) >= 6:
+            i = numeric[0]
+            pairs.append((" ".join(words[max(i - 2, 0):i + 3]), chunk_id))
+    random.Random(seed).shuffle(pairs)
+    return [(query, chunk_id) for query, chunk_id in pairs if tokenize(query)][:count]
+
+
+def evaluate(name, store, queries, n_res, hybrid, where=None):
+    hits, latencies = 0, []
+    for query, chunk_id in queries:
+        start = time.perf_counter()
+        results = store.query_db(query, n_res=n_res, hybrid=hybrid, where=where)
+        latencies.append(time.perf_counter() - start)
+        hits += chunk_id in results["ids"][0]
+    print(f"{name:<7} n_res {n_res:2d}  hit rate {hits / len(queries):6.1%}  "
+          f"latency {statistics.mean(latencies) * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    state_name = sys.argv[1] if len(sys.argv) > 1 else "karnataka"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    engine = RagEngine(cache_answers=False)
+    store = engine.store
+    where = engine.state_filter([state_name])
+    queries = known_item_queries(store, count, where)
+    if not queries:
+        sys.exit(f"No {state_name} chunks with numbers in {store.collection_name}; ingest them first.")
+
+    start = time.perf_counter()
+    index = store.lexical_index()
+    print(f"{len(queries)} queries; BM25 index {len(index)} chunks, {index.nbytes() / 2**20:.1f} MiB, "
+          f"ready in {time.perf_counter() - start:.2f}s")
+    store.query_db(queries[0][0])  # Warm up the embedding model
+    for n_res in (3, 6, 10):
+        evaluate("vector", store, queries, n_res, hybrid=False, where=where)
+        evaluate("hybrid", store, queries, n_res, hybrid=True, where=where)
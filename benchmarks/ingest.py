@@ -0,0 +1,49 @@
+"""
+End-to-end ingestion benchmark for PDFTranslator.process_pdf.
+
+Runs OCR over a PDF once per debug-image mode and reports wall time per
+page, plus the time saved relative to writing debug JPEGs inline. Every
+page is rasterized and OCR'd: the text layer, blank-page skip and OCR
+cache are all off, since each would bypass the debug-image path.
+
+Usage:
+    python -m benchmarks.ingest [pdf_path] [lang] [max_pages]
+"""
+import sys
+import tempfile
+import time
+
+from pdf_chunk import PDFTranslator
+
+
+def time_ingest(pdf_path, lang, max_pages, **translator_kwargs):
+    """Returns (seconds, pages) for OCR of the first max_pages pages."""
+    translator = PDFTranslator(cache=None, text_layer=False, blank_std=None, **translator_kwargs)
+    with tempfile.TemporaryDirectory() as output_folder:
+        start = time.perf_counter()
+        pages = 0
+        for _ in translator.iter_pdf(pdf_path, lang, output_folder=output_folder):
+            pages += 1
+            if pages >= max_pages:
+                break
+        translator.debug_images.flush()
+        return time.perf_counter() - start, pages
+
+
+if __name__ == "__main__":
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else "karnataka.pdf"
+    lang = sys.argv[2] if len(sys.argv) > 2 else "kan"
+    max_pages = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    modes = {
+        "debug images sync": {"debug_images": "sync"},
+        "debug images async": {"debug_images": "async"},
+        "debug images every 5th": {"debug_images": "sync", "debug_every": 5},
+        "debug images off": {"debug_images": "off"},
+    }
+    results = {name: time_ingest(pdf_path, lang, max_pages, **kwargs) for name, kwargs in modes.items()}
+
+    baseline, _ = results["debug images sync"]
+    print(f"{pdf_path} ({lang}), first {max_pages} pages")
+    for name, (seconds, pages) in results.items():
+        print(f"{name:<24} {seconds / pages * 1000:8.1f} ms/page  saved {baseline - seconds:6.2f} s")
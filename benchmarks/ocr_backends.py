@@ -0,0 +1,55 @@
+"""
+Per-page OCR latency of each OCR backend on the same preprocessed pages.
+
+Pages are rasterized and preprocessed once up front, so only the OCR call
+is timed. The first call of each backend is reported separately because
+it includes loading the traineddata. Text agreement with the pytesseract
+output (difflib ratio) checks that the backends read the same text.
+
+Usage:
+    python -m benchmarks.ocr_backends [pdf_path] [lang] [pages]
+"""
+import difflib
+import statistics
+import sys
+import time
+
+from ocr_backends import BACKENDS, make_ocr_backend
+from pdf_chunk import PDFTranslator
+
+if __name__ == "__main__":
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else "karnataka.pdf"
+    lang = sys.argv[2] if len(sys.argv) > 2 else "kan"
+    max_pages = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    translator = PDFTranslator()
+    pages = [translator.preprocess_image(translator.rasterize_page(pdf_path, page_no))
+             for page_no in range(1, min(max_pages, translator.page_count(pdf_path)) + 1)]
+    print(f"{len(pages)} pages of {pdf_path} at {translator.dpi} dpi, lang={lang}")
+
+    reference = None
+    for name in BACKENDS:
+        try:
+            backend = make_ocr_backend(name, tessdata_prefix=translator.tessdata_prefix, dpi=translator.dpi)
+            start = time.perf_counter()
+            texts = [backend.image_to_text(pages[0], lang)]
+            first = time.perf_counter() - start
+        except ImportError as e:
+            print(f"{name:<12} unavailable ({e})")
+            continue
+
+        latencies = []
+        for page in pages[1:]:
+            start = time.perf_counter()
+            texts.append(backend.image_to_text(page, lang))
+            latencies.append(time.perf_counter() - start)
+
+        line = f"{name:<12} first page {first:6.2f}s"
+        if latencies:
+            line += f"  then median {statistics.median(latencies):6.2f}s/page, mean {statistics.mean(latencies):6.2f}s/page"
+        if reference is None:
+            reference = texts
+        else:
+            agreement = statistics.mean(difflib.SequenceMatcher(None, a, b).ratio() for a, b in zip(reference, texts))
+            line += f"  text agreement {agreement:.1%}"
+        print(line)
@@ -0,0 +1,86 @@
+"""
+Accuracy and latency of StateRouter against the LLM state-detection call.
+
+Usage:
+    python -m benchmarks.state_router [--no-llm]
+"""
+import sys
+import time
+
+from gen_ollama import OllamaChat
+from state_router import get_state_router
+
+STATE_LIST = ["kerala", "karnataka", "telangana", "tamilnadu"]
+
+# The prompt of the per-query LLM state-detection call the router replaced
+STATE_PROMPT = """
+You are a Indian State Recognition AI
+I will give you a text that may contain various pieces of information. Your task is to find the name of an Indian state in it and return just the state's name. If no state is mentioned, return 'None'. Here is the text: {query}
+"""
+
+# (query, expected state); None means no state is mentioned
+LABELLED_QUERIES = [
+    ("Elephants destroyed my paddy field in Karnataka, what compensation can I get?", "karnataka"),
+    ("A leopard attacked a cow near Bandipur, how do I report it?", "karnataka"),
+    ("Wild boar damaged crops in Chamarajanagar district", "karnataka"),
+    ("Tiger sighted near Nagarhole, who should I contact?", "karnataka"),
+    ("ಕರ್ನಾಟಕದಲ್ಲಿ ಆನೆ ದಾಳಿಗೆ ಪರಿಹಾರ ಎಷ್ಟು?", "karnataka"),
+    ("ಮೈಸೂರು ಬಳಿ ಚಿರತೆ ದಾಳಿ", "karnataka"),
+    ("Crop loss from elephants in Kodagu", "karnataka"),
+    ("Compensation for snake bite death in Kerala", "kerala"),
+    ("Wild elephant entered a house in Wayanad", "kerala"),
+    ("Monkey menace in Thiruvananthapuram", "kerala"),
+    ("Human death from elephant attack in Idukki", "kerala"),
+    ("Bison attack near Munnar estate", "kerala"),
+    ("Compensation for cattle killed by tiger in Telangana", "telangana"),
+    ("Tiger straying into villages near Kawal", "telangana"),
+    ("Crop damage by wild pigs in Adilabad", "telangana"),
+    ("Bear attack in Amrabad forest", "telangana"),
+    ("Sloth bear injured a farmer in Nalgonda", "telangana"),
+    ("What is the procedure to claim compensation for crop loss?", None),
+    ("How much is paid for permanent disability after a wildlife attack?", None),
+    # Place names that are also ordinary words must not route on their own
+    ("Heavy rains erode my farm soil", None),
+    ("Can Salem help", None),
+    ("Hassan's cow was taken by a leopard", None),
+    ("Nirmal lost his goats to wild dogs", None),
+    ("Elephants raided fields in Erode district", "tamilnadu"),
+    ("Leopard attack in Salem near Mudumalai", "tamilnadu"),
+    ("Elephant crop raids in Hassan district", "karnataka"),
+]
+
+
+def evaluate(resolve, queries):
+    """Returns (accuracy, mean latency in ms) of a query -> state function."""
+    correct, elapsed = 0, 0.0
+    for query, expected in queries:
+        start = time.perf_counter()
+        predicted = resolve(query)
+        elapsed += time.perf_counter() - start
+        correct += predicted == expected
+    return correct / len(queries), elapsed / len(queries) * 1000
+
+
+def router_resolve(query):
+    return get_state_router().route(query).state
+
+
+def llm_resolve(model, query):
+    response = model.client.chat(model=model.model_name,
+                                 messages=[{'role': 'system', 'content': STATE_PROMPT.format(query=query)}])
+    state_name = response['message']['content'].lower().replace(" ", "")
+    for state in STATE_LIST:
+        if state in state_name:
+            return state
+    return None
+
+
+if __name__ == "__main__":
+    get_state_router()  # Compile the automaton outside the timed loop
+    accuracy, latency = evaluate(router_resolve, LABELLED_QUERIES)
+    print(f"StateRouter  accuracy {accuracy:6.1%}  latency {latency:10.3f} ms/query")
+
+    if "--no-llm" not in sys.argv:
+        model = OllamaChat(model_name='gemma2:2b')
+        accuracy, latency = evaluate(lambda query: llm_resolve(model, query), LABELLED_QUERIES)
+        print(f"LLM          accuracy {accuracy:6.1%}  latency {latency:10.3f} ms/query")
@@ -0,0 +1,85 @@
+"""
+Latency and real-time factor of each speech recognition backend.
+
+Runs every .wav clip in a directory through each backend. A clip's
+language comes from its name (kn_*.wav is Kannada, anything else English).
+When a clip has a reference transcript next to it (clip.txt), the word
+error rate is reported too. Model loading is timed separately from the
+first clip. Real-time factor is processing time divided by audio length,
+so below 1.0 is faster than real time.
+
+Usage:
+    python -m benchmarks.stt_backends <clips_dir> [backend ...]
+"""
+import glob
+import os
+import statistics
+import sys
+import time
+
+import speech_recognition as sr
+
+from stt_backends import BACKENDS, get_stt_backend
+
+
+def word_error_rate(reference, hypothesis):
+    """Levenshtein distance over words, divided by the reference length."""
+    ref, hyp = reference.lower().split(), hypothesis.lower().split()
+    row = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        previous, row[0] = row[0], i
+        for j, hyp_word in enumerate(hyp, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (ref_word != hyp_word))
+    return row[-1] / max(len(ref), 1)
+
+
+def load_clips(clips_dir):
+    clips = []
+    recognizer = sr.Recognizer()
+    for path in sorted(glob.glob(os.path.join(clips_dir, "*.wav"))):
+        with sr.AudioFile(path) as source:
+            audio = recognizer.record(source)
+        duration = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        language = "kn-IN" if os.path.basename(path).startswith("kn_") else "en-US"
+        reference_path = os.path.splitext(path)[0] + ".txt"
+        reference = open(reference_path, encoding="utf-8").read() if os.path.exists(reference_path) else None
+        clips.append((os.path.basename(path), audio, duration, language, reference))
+    return clips
+
+
+def run_backend(name, clips):
+    backend = get_stt_backend(name)
+    if hasattr(backend, "model"):
+        start = time.perf_counter()
+        backend.model()
+        print(f"{name}: model loaded in {time.perf_counter() - start:.1f}s")
+
+    latencies, factors, errors = [], [], []
+    for clip, audio, duration, language, reference in clips:
+        start = time.perf_counter()
+        try:
+            text = backend.transcribe(audio, language)
+        except (sr.UnknownValueError, sr.RequestError) as e:
+            text = f"[{type(e).__name__}]"
+        elapsed = time.perf_counter() - start
+        latencies.append(elapsed)
+        factors.append(elapsed / duration)
+        line = f"  {clip:<24} {duration:5.1f}s audio  {elapsed:5.2f}s  RTF {elapsed / duration:5.2f}"
+        if reference is not None:
+            errors.append(word_error_rate(reference, text))
+            line += f"  WER {errors[-1]:5.1%}"
+        print(line)
+    summary = f"{name}: mean latency {statistics.mean(latencies):.2f}s, mean RTF {statistics.mean(factors):.2f}"
+    if errors:
+        summary += f", mean WER {statistics.mean(errors):.1%}"
+    print(summary)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    clips = load_clips(sys.argv[1])
+    if not clips:
+        sys.exit(f"No .wav clips in {sys.argv[1]}")
+    for name in sys.argv[2:] or list(BACKENDS):
+        run_backend(name, clips)
@@ -0,0 +1,53 @@
+"""
+Per-page extraction path and cost for every document in the manifest.
+
+For each page the text-layer check is timed. Pages that fail it are
+rasterized and checked for blankness; the rest are OCR'd and timed, as
+are text-layer pages (to show the OCR time they avoid). The OCR cache is
+not used.
+
+Usage:
+    python -m benchmarks.text_layer [manifest] [max_pages_per_document]
+"""
+import statistics
+import sys
+import time
+
+from ingest import load_manifest
+from pdf_chunk import PDFTranslator
+
+
+def ms(seconds):
+    return f"{statistics.mean(seconds) * 1000:8.1f} ms" if seconds else "       -   "
+
+
+if __name__ == "__main__":
+    manifest = sys.argv[1] if len(sys.argv) > 1 else "manifest.json"
+    max_pages = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    translator = PDFTranslator()
+    print(f"{'document':<28} {'text layer':>10} {'blank':>6} {'ocr':>5}   {'check':>11} {'ocr':>11} {'ocr avoided':>11}")
+    for document in load_manifest(manifest):
+        path, lang = document["path"], document["lang"]
+        counts = {"text_layer": 0, "blank": 0, "ocr": 0}
+        check_times, ocr_times, avoided_times = [], [], []
+        for page_no in range(1, min(max_pages, translator.page_count(path)) + 1):
+            start = time.perf_counter()
+            text = translator.text_layer.page_text(path, page_no, lang)
+            check_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            image = translator.rasterize_page(path, page_no)
+            if text is None and translator.is_blank(image):
+                counts["blank"] += 1
+                continue
+            translator.extract_text_from_image(translator.preprocess_image(image), lang)
+            elapsed = time.perf_counter() - start
+            if text is None:
+                counts["ocr"] += 1
+                ocr_times.append(elapsed)
+            else:
+                counts["text_layer"] += 1
+                avoided_times.append(elapsed)
+        print(f"{path:<28} {counts['text_layer']:>10} {counts['blank']:>6} {counts['ocr']:>5}   "
+              f"{ms(check_times)} {ms(ocr_times)} {ms(avoided_times)}")
@@ -0,0 +1,108 @@
+import re
+
+# Sentence ends: Latin punctuation and the Devanagari danda; OCR line breaks
+# inside a paragraph are not sentence ends.
+_SENTENCE_END = re.compile(r"(?<=[.!?।])\s+")
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+def count_tokens(text):
+    """Approximates model tokens as words plus punctuation marks."""
+    return len(_TOKEN.findall(text))
+
+
+class TextChunker:
+    """
+    Splits page text into retrieval chunks of roughly target_tokens tokens.
+
+    Paragraphs are split into sentences, and sentences are packed greedily
+    into chunks without crossing a sentence boundary (sentences longer than
+    target_tokens are split on words). Each chunk repeats up to
+    overlap_tokens of trailing sentences from the previous one. A trailing
+    chunk smaller than min_tokens is merged into the one before it, so the
+    single-word table cells OCR produces never become chunks of their own.
+    """
+    def __init__(self, target_tokens=200, overlap_tokens=40, min_tokens=25, count_tokens=count_tokens):
+        """
+        Initialize the chunker with its size settings.
+        """
+        if overlap_tokens >= target_tokens:
+            raise ValueError("overlap_tokens must be smaller than target_tokens")
+        self.target_tokens = target_tokens
+        self.overlap_tokens = overlap_tokens
+        self.min_tokens = min_tokens
+        self.count_tokens = count_tokens
+
+    def settings(self):
+        """Returns the chunker settings, e.g. for logging or benchmarks."""
+        return {"target_tokens": self.target_tokens, "overlap_tokens": self.overlap_tokens,
+                "min_tokens": self.min_tokens}
+
+    def sentences(self, text):
+        """Splits text into (sentence, token_count) pairs."""
+        pieces = []
+        for paragraph in re.split(r"\n\s*\n", text):
+            # OCR wraps lines inside a paragraph; rejoin them
+            paragraph = " ".join(paragraph.split())
+            if not paragraph:
+                continue
+            for sentence in _SENTENCE_END.split(paragraph):
+                tokens = self.count_tokens(sentence)
+                if tokens <= self.target_tokens:
+                    pieces.append((sentence, tokens))
+                else:
+                    pieces.extend(self._split_words(sentence))
+        return pieces
+
+    def _split_words(self, sentence):
+        pieces, current, current_tokens = [], [], 0
+        for word in sentence.split():
+            tokens = self.count_tokens(word)
+            if current and current_tokens + tokens > self.target_tokens:
+                pieces.append((" ".join(current), current_tokens))
+                current, current_tokens = [], 0
+            current.append(word)
+            current_tokens += tokens
+        if current:
+            pieces.append((" ".join(current), current_tokens))
+        return pieces
+
+    def chunk(self, text):
+        """
+        Splits text into a list of chunk strings.
+        """
+        if not text or not text.strip():
+            return []
+
+        chunks = []  # Lists of (sentence, tokens)
+        current, current_tokens = [], 0
+        for sentence, tokens in self.sentences(text):
+            if current and current_tokens + tokens > self.target_tokens:
+                chunks.append(current)
+                current = self._overlap(current)
+                current_tokens = sum(t for _, t in current)
+                if current_tokens + tokens > self.target_tokens:
+                    current, current_tokens = [], 0  # No room for overlap before a long sentence
+            current.append((sentence, tokens))
+            current_tokens += tokens
+
+        # The final chunk may hold only overlap carried over from the previous one
+        carried = len(self._overlap(chunks[-1])) if chunks else 0
+        fresh = current[carried:] if chunks and current[:carried] == self._overlap(chunks[-1]) else current
+        if fresh:
+            if chunks and sum(t for _, t in fresh) < self.min_tokens:
+                chunks[-1] = chunks[-1] + fresh
+            else:
+                chunks.append(current)
+
+        return [" ".join(sentence for sentence, _ in chunk) for chunk in chunks]
+
+    def _overlap(self, sentences):
+        """Returns the trailing sentences that fit within overlap_tokens."""
+        carried, tokens = [], 0
+        for sentence, sentence_tokens in reversed(sentences):
+            if tokens + sentence_tokens > self.overlap_tokens:
+                break
+            carried.insert(0, (sentence, sentence_tokens))
+            tokens += sentence_tokens
+        return carried
@@ -0,0 +1,101 @@
+import re
+
+from chunker import count_tokens
+
+_WORD = re.compile(r"\w+")
+
+
+class ContextAssembler:
+    """
+    Builds the prompt context from a Chroma query result.
+
+    Chunks are taken in result order (by distance, or by fused rank for
+    hybrid results), and chunks much further from the query than the best
+    match are dropped (relative_margin, in cosine distance). Keyword matches
+    (distance None) are never trimmed as irrelevant.
+    Near-duplicates of an already chosen chunk are skipped; OCR of repeated
+    headers and overlapping chunks produce many of them. Chunks are then
+    added in order until max_tokens is reached. Prompt evaluation dominates
+    latency for small models on CPU, so a short, relevant context is faster
+    and answers no worse than ten concatenated chunks.
+    """
+    def __init__(self, max_tokens=700, relative_margin=0.15, max_distance=None, dedup_threshold=0.8,
+                 count_tokens=count_tokens):
+        """
+        Initialize the assembler with its budget and trimming settings.
+        """
+        self.max_tokens = max_tokens
+        self.relative_margin = relative_margin
+        self.max_distance = max_distance
+        self.dedup_threshold = dedup_threshold
+        self.count_tokens = count_tokens
+        self.last_stats = {}
+
+    @staticmethod
+    def _shingles(text):
+        words = _WORD.findall(text.lower())
+        if len(words) < 3:
+            return set(words)
+        return {" ".join(words[i:i + 3]) for i in range(len(words) - 2)}
+
+    def _is_duplicate(self, shingles, chosen):
+        for other in chosen:
+            union = len(shingles | other)
+            if union and len(shingles & other) / union >= self.dedup_threshold:
+                return True
+        return False
+
+    def assemble(self, documents, distances=None):
+        """
+        Return the context string for the retrieved documents, or None if nothing is kept.
+
+        documents and distances are the first rows of a Chroma query result.
+        """
+        if distances is None:
+            distances = [None] * len(documents)
+        ranked = [(distance, document) for distance, document in zip(distances, documents)
+                  if document and document.strip()]
+        if not ranked:
+            return None
+        known = [distance for distance, _ in ranked if distance is not None]
+
+        cutoff = min(known) + self.relative_margin if known else None
+        if self.max_distance is not None:
+            cutoff = self.max_distance if cutoff is None else min(cutoff, self.max_distance)
+
+        chosen, chosen_shingles, used = [], [], 0
+        trimmed = duplicates = over_budget = 0
+        for distance, document in ranked:
+            if distance is not None and cutoff is not None and distance > cutoff and chosen:
+                trimmed += 1
+                continue
+            shingles = self._shingles(document)
+            if self._is_duplicate(shingles, chosen_shingles):
+                duplicates += 1
+                continue
+            tokens = self.count_tokens(document)
+            if used + tokens > self.max_tokens:
+                if chosen:
+                    over_budget += 1
+                    continue
+                # The best chunk alone is over budget; keep its beginning
+                document = self._truncate(document, self.max_tokens)
+                tokens = self.count_tokens(document)
+            chosen.append(document)
+            chosen_shingles.append(shingles)
+            used += tokens
+
+        self.last_stats = {"retrieved": len(documents), "kept": len(chosen), "tokens": used,
+                           "trimmed": trimmed, "duplicates": duplicates, "over_budget": over_budget}
+        print(f"Context: kept {len(chosen)}/{len(documents)} chunks, {used} tokens "
+              f"({trimmed} low relevance, {duplicates} duplicates, {over_budget} over budget)")
+        return "\n\n".join(chosen)
+
+    def _truncate(self, text, max_tokens):
+        words, tokens = [], 0
+        for word in text.split():
+            tokens += self.count_tokens(word)
+            if tokens > max_tokens:
+                break
+            words.append(word)
+        return " ".join(words)
@@ -0,0 +1,181 @@
+"""
+Crawls the forest department FAQ pages into the knowledge base.
+
+Pages are fetched concurrently over one pooled, retrying HTTP session.
+Each page's ETag and Last-Modified are remembered, so a rerun sends
+conditional requests and pages the server reports as unchanged (304) are
+neither downloaded nor parsed. Every Q/A pair is stored under an id derived
+from its page and question: an edited answer replaces the old one in
+place, pairs whose text is unchanged are not re-embedded, and pairs that
+disappeared from a page are deleted.
+
+Usage:
+    python faq_crawler.py [--workers N] [--state-file faq_crawl_state.json] [--force]
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from faq_parser import parse_faqs
+from vector_store import KNOWLEDGE_BASE, VectorStore
+
+# The pages to crawl, with the state whose questions they answer
+FAQ_PAGES = [
+    {"url": "https://aranya.gov.in/aranyacms/(S(kk0ft5sbjw5x0b1cg0nycyng))/English/IndividualService.aspx?X+lcPlkH9QY=",
+     "state": "karnataka"},
+    {"url": "https://aranya.gov.in/aranyacms/(S(kk0ft5sbjw5x0b1cg0nycyng))/English/IndividualService.aspx?u15HOwzBSyuVSOgOGs9sAQ==",
+     "state": "karnataka"},
+    {"url": "https://aranya.gov.in/aranyacms/(S(kk0ft5sbjw5x0b1cg0nycyng))/English/IndividualService.aspx?SrB+W5OgJfH92gViz24j0w==",
+     "state": "karnataka"},
+]
+
+
+class CrawlState:
+    """
+    The ETag and Last-Modified validators of each crawled URL, saved as JSON.
+    """
+    def __init__(self, path="./faq_crawl_state.json"):
+        """
+        Load the state file, if any; path None keeps the state in memory only.
+        """
+        self.path = path
+        self.pages = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.pages = json.load(f)
+
+    def save(self):
+        """Writes the state atomically."""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.pages, f)
+        os.replace(tmp_path, self.path)
+
+
+class FAQCrawler:
+    """
+    Fetches FAQ pages concurrently and upserts their Q/A pairs into a VectorStore.
+
+    Fetching and parsing run on `workers` threads sharing one
+    requests.Session, whose connection pool is sized to match so
+    connections to the same host are reused. Failed requests (connection
+    errors, 429 and 5xx) are retried with exponential backoff. Vector
+    store writes stay in the calling thread.
+    """
+    def __init__(self, vector_store, state=None, workers=4, timeout=10, retries=3, backoff=0.5):
+        """
+        Initialize the crawler for a vector store.
+        """
+        self.vector_store = vector_store
+        self.state = state if state is not None else CrawlState(None)
+        self.workers = workers
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=("GET",))
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.stats = {"fetched": 0, "not_modified": 0, "failed": 0, "faqs": 0, "embedded": 0, "deleted": 0}
+
+    def fetch(self, url, force=False):
+        """
+        GET a page, conditionally unless force; returns (status, faqs, validators).
+
+        faqs is None or empty unless the page was downloaded (status 200) and has FAQs.
+        """
+        headers = {}
+        known = self.state.pages.get(url, {})
+        if not force:
+            if known.get("etag"):
+                headers["If-None-Match"] = known["etag"]
+            if known.get("last_modified"):
+                headers["If-Modified-Since"] = known["last_modified"]
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code != 200:
+            return response.status_code, None, {}
+        validators = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+        return 200, parse_faqs(response.content, url), validators
+
+    def crawl(self, pages=FAQ_PAGES, force=False):
+        """
+        Crawl the pages ({"url", "state"} dicts) and store their FAQs; returns the stats.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.fetch, page["url"], force): page for page in pages}
+            for future in as_completed(futures):
+                page = futures[future]
+                url = page["url"]
+                try:
+                    status, faqs, validators = future.result()
+                except requests.RequestException as e:
+                    self.stats["failed"] += 1
+                    print(f"Failed to fetch {url}: {e}")
+                    continue
+                if status == 304:
+                    self.stats["not_modified"] += 1
+                    continue
+                if status != 200:
+                    self.stats["failed"] += 1
+                    print(f"Failed to fetch {url} (HTTP {status})")
+                    continue
+                self.stats["fetched"] += 1
+                if not faqs:
+                    # No FAQ section, or none of its items parsed: the layout may have
+                    # changed, so keep what is stored and fetch the page in full next time
+                    continue
+                self.store(url, faqs, {"state": page["state"], "language": "en"})
+                self.state.pages[url] = validators
+                self.state.save()
+
+        if self.stats["embedded"] or self.stats["deleted"]:
+            self.vector_store.rebuild_lexical_index()
+        print(f"FAQ crawl: {self.stats['fetched']} pages fetched, {self.stats['not_modified']} unchanged, "
+              f"{self.stats['failed']} failed; {self.stats['faqs']} Q/A pairs, {self.stats['embedded']} embedded, "
+              f"{self.stats['deleted']} deleted")
+        return self.stats
+
+    def store(self, url, faqs, metadata):
+        """
+        Make the stored Q/A pairs of one page match faqs; returns their ids.
+        """
+        chunks = {}
+        for faq in faqs:
+            # Keyed by question, so an edited answer replaces the old one
+            chunk_id = self.vector_store.chunk_id(faq["question"], url)
+            chunks.setdefault(chunk_id, f"Q: {faq['question']}\nA: {faq['answer']}")
+        collection = self.vector_store.collection
+        stored = collection.get(where={"source": url}, include=["documents"])
+        stored = dict(zip(stored["ids"], stored["documents"]))
+
+        changed = [chunk_id for chunk_id, document in chunks.items() if stored.get(chunk_id) != document]
+        if changed:
+            collection.upsert(ids=changed, documents=[chunks[chunk_id] for chunk_id in changed],
+                              metadatas=[dict(metadata, source=url)] * len(changed))
+        stale = [chunk_id for chunk_id in stored if chunk_id not in chunks]
+        if stale:
+            collection.delete(ids=stale)
+        if changed or stale:
+            self.vector_store.mark_changed()
+        self.stats["faqs"] += len(chunks)
+        self.stats["embedded"] += len(changed)
+        self.stats["deleted"] += len(stale)
+        return list(chunks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4, help="concurrent requests")
+    parser.add_argument("--state-file", default="./faq_crawl_state.json", help="ETag/Last-Modified state file")
+    parser.add_argument("--force", action="store_true", help="download every page, ignoring the saved validators")
+    args = parser.parse_args()
+
+    crawler = FAQCrawler(VectorStore(KNOWLEDGE_BASE), CrawlState(args.state_file), workers=args.workers)
+    crawler.crawl(force=args.force)
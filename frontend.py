@@ -1,62 +1,70 @@
 import streamlit as st
-import sounddevice as sd
-import numpy as np
-from scipy.io.wavfile import write
-from rag_llama_chroma import get_response
-from googletrans import Translator
-from deep_translator import GoogleTranslator
-from io import BytesIO
-from SpeechToText import SpeechToText  # Import your SpeechToText class
-from pdf_chunk import PDFTranslator
-
-
-pfd_translator = PDFTranslator()
-translator = Translator()
+from translation_service import get_translation_service
+
+
+@st.cache_resource
+def load_rag_engine():
+    """Build the RAG engine once per process and share it across sessions and reruns."""
+    # Chroma, the embedding model and the Ollama client load on the first query, not the first render
+    from rag_llama_chroma import get_engine
+
+    engine = get_engine()
+    engine.warm_up()
+    return engine
+
 # Initialize session state for recording control
 if "recording" not in st.session_state:
     st.session_state.recording = False
-    st.session_state.audio_data = []
-
-def start_recording(samplerate=44100):
-    """Start recording audio."""
+    st.session_state.capture = None  # MicrophoneCapture while recording
+
+def get_speech_to_text(language):
+    """Reuse one SpeechToText per session and language; recognizers and models are shared process-wide."""
+    processors = st.session_state.setdefault("stt_processors", {})
+    if language not in processors:
+        from SpeechToText import SpeechToText  # Speech recognition is only loaded for voice input
+        processors[language] = SpeechToText(language=language)
+    return processors[language]
+
+def start_recording(language):
+    """Start recording audio in the background; speech is transcribed while the user talks."""
+    from audio_capture import MicrophoneCapture
+
+    stt_processor = get_speech_to_text(language)
+
+    def transcribe(samples, sample_rate):
+        text = stt_processor.recognize_speech_from_samples(samples, sample_rate)
+        if text.startswith("[Error"):
+            print(f"Segment not transcribed: {text}")
+            return ""
+        return text
+
+    capture = MicrophoneCapture(transcribe)
+    capture.start()
+    st.session_state.capture = capture
     st.session_state.recording = True
-    st.session_state.audio_data = []  # Store audio chunks
-
-    with sd.InputStream(samplerate=samplerate, channels=1, dtype="int16") as stream:
-        st.info("Recording... Click 'Stop Recording' to end.")
-        while st.session_state.recording:
-            audio_chunk, _ = stream.read(1024)
-            st.session_state.audio_data.append(audio_chunk)
+    st.info("Recording... Click 'Stop Recording' to end.")
 
 def stop_recording(language):
-    """Stop recording and process audio."""
+    """Stop recording and process the transcript."""
     st.session_state.recording = False
-    if st.session_state.audio_data:
-        audio_data = np.concatenate(st.session_state.audio_data, axis=0)
-        process_audio(audio_data, language)
-
+    capture, st.session_state.capture = st.session_state.capture, None
+    if capture is not None:
+        process_audio(capture.stop(), language)
 
-def process_audio(audio_data, language):
-    """Process recorded audio and generate AI response."""
-    audio_buffer = BytesIO()
-    write(audio_buffer, 44100, audio_data)  # Save as WAV
-    audio_buffer.seek(0)
+def process_audio(transcribed_text, language):
+    """Process the transcript of a recording and generate AI response."""
+    transcribed_text = transcribed_text or "[Error: Could not understand audio]"
 
-    stt_processor = SpeechToText(language=language)
-    transcribed_text = stt_processor.recognize_speech_from_file(audio_buffer)
-    
     st.text_area("Transcribed Text", transcribed_text, height=150)
 
     if transcribed_text and not transcribed_text.startswith("[Error"):
         # Generate AI response using your GenAI class
         if language == 'kn-IN':
             # Translate to English for processing
-            translated_text = GoogleTranslator(source='kn', target='en').translate(transcribed_text)
-            # transcribed_text = translator.translate(transcribed_text, src='kn', dest='en').text
-            
-        
-        gen_ai_response = get_response(translated_text)
-        st.text_area("AI Response", gen_ai_response, height=150)
+            transcribed_text = get_translation_service().translate(transcribed_text, 'kn', 'en')
+
+        st.subheader("AI Response")
+        st.write_stream(load_rag_engine().stream_response(transcribed_text))
 
 # Streamlit app setup
 st.set_page_config(
@@ -120,7 +128,7 @@ if input_mode == "🎙️ Voice Input":
     col1, col2 = st.columns(2)
     with col1:
         if st.button("🎙️ Start Recording"):
-            start_recording()
+            start_recording(language=language_code)
 
     with col2:
         if st.button("🛑 Stop Recording"):
@@ -132,8 +140,8 @@ elif input_mode == "⌨️ Text Input":
         if st.button("Submit Text"):
             if user_text:
                 # Process manually entered text
-                gen_ai_response = get_response(user_query=user_text)
-                st.text_area("AI Response", gen_ai_response, height=150)
+                st.subheader("AI Response")
+                st.write_stream(load_rag_engine().stream_response(user_text))
             else:
                 st.warning("Please enter some text before submitting.")
     else:
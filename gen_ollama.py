@@ -1,66 +1,93 @@
+import time
+
 import ollama
 
 '''
 # ollama.pull('llama3.2:1b')
 '''
 
+# Kept constant (no per-query text) so the prompt prefix is cached by Ollama
+SYSTEM_PROMPT = """
+You are a Wildlife and Environmental Law assistant specializing in Human-Wildlife Conflict Resolution. You provide legally sound, ethical, and practical advice based on national wildlife laws, environmental regulations.
+
+**USE THE CONTEXT GIVEN WITH THE USER'S QUERY FOR ANSWERING IT**
+**DO NOT DEVIATE FROM THE CONTEXT**
+**DO NOT ADD ANYTHING NEW APART FROM THE GIVEN CONTEXT**
+The context appears between CONTEXT START and CONTEXT END, followed by the user's query.
+
+The context provided is crucial for generating accurate and relevant responses. So please ensure to use it effectively.
+Provide a step-by-step approach for the user to follow.
+
+Include the monetary compensation amount in INR if applicable and available in the context.
+"""
+
 
 class OllamaChat:
     """
     A class to interact
     with the Ollama chat model.
     """
-    def __init__(self, model_name='llama3.2:1b'):
+    def __init__(self, model_name='llama3.2:1b', client=None):
         """
         Initialize the OllamaChat with a model name.    
+        A single ollama.Client is kept so its HTTP connection is reused across calls.
         """
         self.model_name = model_name
+        self.client = client or ollama.Client()
+        self.last_timing = {}
 
     def chat(self, messages):
         """
         Interact with the Ollama chat model.
         """
-        response = ollama.chat(model=self.model_name, messages=messages)
+        response = self.client.chat(model=self.model_name, messages=messages)
         return response
 
-    def get_response(self, query, context):
+    def chat_stream(self, messages):
         """
-        Get a response from the Ollama chat model based on a query and context.
+        Interact with the Ollama chat model, yielding content pieces as they arrive.
         """
-        response = self.chat(messages = [{
-            'role': 'system',
-            'content': f"""
-            You are a Wildlife and Environmental Law assistant specializing in Human-Wildlife Conflict Resolution. You provide legally sound, ethical, and practical advice based on national wildlife laws, environmental regulations.
+        for chunk in self.client.chat(model=self.model_name, messages=messages, stream=True):
+            yield chunk['message']['content']
 
-            **USE THIS CONTEXT FOR ANSWERING THE USER'S QUERY**
-            **DO NOT DEVIATE FROM THE CONTEXT**
-            **DO NOT ADD ANYTHING NEW APART FROM THE GIVEN CONTEXT**
-            CONTEXT START
-            {context}
-            CONTEXT END
-            
-            The context provided is crucial for generating accurate and relevant responses. So please ensure to use it effectively.
-            Provide a step-by-step approach for the user to follow.
+    def build_messages(self, query, context):
+        """
+        Build the system and user messages for a query and its context.
 
-            Include the monetary compensation amount in INR if applicable and available in the context.
+        The system prompt is the same for every query and the context goes
+        into the user message, so Ollama can reuse the evaluated system
+        prompt (its KV cache prefix) across requests.
+        """
+        return [
+            {'role': 'system', 'content': SYSTEM_PROMPT},
+            {'role': 'user', 'content': f"CONTEXT START\n{context}\nCONTEXT END\n\n{query}"},
+        ]
 
-            """
-                    },
-            {
-                'role': 'user',
-                'content': query
-            }])
+    def get_response(self, query, context):
+        """
+        Get a response from the Ollama chat model based on a query and context.
+        """
+        response = self.chat(messages=self.build_messages(query, context))
         return response['message']['content'].replace("**", "").replace("*", "")
-    
-    def get_state_name_from_user_query(self, query):
+
+    def stream_response(self, query, context):
         """
-        Extract the state name from the user query.
+        Stream a response from the Ollama chat model token by token.
+
+        Markdown emphasis is stripped as tokens arrive; removing every '*'
+        per token gives the same text as get_response. Time to first token
+        and total latency are logged separately and kept in last_timing.
         """
-        response = ollama.chat(model=self.model_name, messages=[{'role': 'system', 
-                                                                'content': f"""
-                                                                You are a Indian State Recognition AI
-                                                                I will give you a text that may contain various pieces of information. Your task is to find the name of an Indian state in it and return just the state's name. If no state is mentioned, return 'None'. Here is the text: {query}
-                                                                """},
-                                                                ])
-        
-        return response['message']['content'].replace("**", "").replace("*", "")
\ No newline at end of file
+        start = time.perf_counter()
+        first_token = None
+        for token in self.chat_stream(self.build_messages(query, context)):
+            token = token.replace("*", "")
+            if not token:
+                continue
+            if first_token is None:
+                first_token = time.perf_counter() - start
+                print(f"Time to first token: {first_token:.2f}s")
+            yield token
+        total = time.perf_counter() - start
+        self.last_timing = {"time_to_first_token": first_token, "total": total}
+        print(f"Total generation time: {total:.2f}s")
@@ -0,0 +1,240 @@
+"""
+Manifest-driven, resumable ingestion of the PDF corpus into the knowledge base.
+
+Every document in the manifest (path, state, Tesseract lang, translate,
+src_lang) is split into (document, page) tasks on one shared work queue,
+so a process pool stays busy across document boundaries. Pages are
+checkpointed once their chunks are stored, and a rerun skips them and
+unchanged, finished documents. A page that fails is recorded in the
+checkpoint and reported without stopping the run; the rerun retries it.
+A manifest entry whose file is byte-identical to an earlier one is
+skipped. Progress and throughput are printed as pages complete, with how
+many pages came from a text layer, OCR, the cache or were blank.
+
+Usage:
+    python ingest.py [--manifest manifest.json] [--workers N] [--only STATE ...] [--restart]
+"""
+import argparse
+import json
+import os
+import time
+
+from ingest_writer import IngestionWriter
+from ocr_cache import OCRCache
+from pdf_chunk import PAGE_PATHS, PageTask, PDFTranslator
+from vector_store import KNOWLEDGE_BASE, VectorStore
+
+
+def load_manifest(path):
+    """Returns the manifest's documents with defaults filled in."""
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    documents = []
+    for entry in manifest["documents"]:
+        document = {"lang": "eng", "translate": False, "src_lang": "en",
+                    "dest_lang": manifest.get("dest_lang", "en")}
+        document.update(entry)
+        document.setdefault("language", document["src_lang"])
+        documents.append(document)
+    return documents
+
+
+class IngestCheckpoint:
+    """
+    Per-page ingestion progress, saved as JSON after every checkpoint.
+
+    Each document is recorded with its content hash and ingestion settings
+    and, per finished page, the ids of the chunks stored for it; pages that
+    failed are kept under "failed" with their error. A changed file or
+    changed settings start that document over.
+    """
+    def __init__(self, path="./ingest_checkpoint.json"):
+        """
+        Load the checkpoint file, if any.
+        """
+        self.path = path
+        self.documents = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.documents = json.load(f)
+
+    def document(self, source, file_hash, settings):
+        """Returns the checkpoint record for a document, reset if the file or settings changed."""
+        record = self.documents.get(source)
+        if record is None or record["hash"] != file_hash or record["settings"] != settings:
+            record = {"hash": file_hash, "settings": settings, "pages": {}, "done": False}
+            self.documents[source] = record
+        return record
+
+    def save(self):
+        """Writes the checkpoint atomically."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.documents, f)
+        os.replace(tmp_path, self.path)
+
+
+class CorpusIngestor:
+    """
+    Ingests manifest documents page by page with checkpoints.
+
+    Pages go through PDFTranslator.iter_pages, which runs OCR in a process
+    pool fed from a single queue of tasks across all documents and serves
+    pages already in the OCR cache in this process.
+    Chunks go through an IngestionWriter, so embedding overlaps with OCR.
+    Every checkpoint_every pages the writer is flushed and the finished
+    pages are recorded.
+    """
+    def __init__(self, translator, vector_store, checkpoint, workers=1, checkpoint_every=10, report_every=5.0):
+        """
+        Initialize the ingestor.
+        """
+        self.translator = translator
+        self.vector_store = vector_store
+        self.writer = IngestionWriter(vector_store)
+        self.checkpoint = checkpoint
+        self.workers = workers
+        self.checkpoint_every = checkpoint_every
+        self.report_every = report_every
+        self._unsaved = []  # (source, page_no, ids) stored by the writer but not yet checkpointed
+        self.duplicates = []  # sources skipped as copies of an earlier document
+        self.stats = {"pages": 0, "skipped_pages": 0, "failed_pages": 0, "chunks": 0, "total_pages": 0,
+                      "paths": dict.fromkeys(PAGE_PATHS, 0)}
+
+    def plan(self, documents):
+        """Returns the PageTasks still to do and the documents' checkpoint records."""
+        tasks, records, seen = [], {}, {}
+        for document in documents:
+            source = document["path"]
+            file_hash = OCRCache.file_hash(source)
+            if file_hash in seen:
+                # The same file listed twice would only store every chunk again
+                print(f"{source}: identical to {seen[file_hash]}, skipped")
+                self.checkpoint.documents.pop(source, None)
+                self.duplicates.append(source)
+                continue
+            seen[file_hash] = source
+            settings = {key: document[key] for key in ("state", "lang", "translate", "src_lang", "dest_lang", "language")}
+            settings["chunker"] = self.translator.chunker.settings()
+            settings["extraction"] = self.translator.extraction_settings()
+            record = self.checkpoint.document(source, file_hash, settings)
+            records[source] = record
+            num_pages = self.translator.page_count(source)
+            self.stats["total_pages"] += num_pages
+            if record["done"]:
+                self.stats["skipped_pages"] += num_pages
+                print(f"{source}: unchanged and complete, skipped")
+                continue
+            todo = [page_no for page_no in range(1, num_pages + 1) if str(page_no) not in record["pages"]]
+            self.stats["skipped_pages"] += num_pages - len(todo)
+            record["num_pages"] = num_pages
+            if len(todo) < num_pages:
+                print(f"{source}: resuming, {num_pages - len(todo)} of {num_pages} pages already stored")
+            tasks.extend(PageTask(source, page_no, document["lang"], document["translate"], document["src_lang"],
+                                  document["dest_lang"]) for page_no in todo)
+        return tasks, records
+
+    def run(self, documents):
+        """
+        Ingest the documents; returns the stats.
+        """
+        tasks, records = self.plan(documents)
+        by_source = {document["path"]: document for document in documents}
+        print(f"{len(tasks)} pages to process across {len(records)} documents with {self.workers} worker(s)")
+        self._start = self._last_report = time.perf_counter()
+        try:
+            for result in self.translator.iter_pages(tasks, workers=self.workers):
+                if result.error is not None:
+                    self._fail(result.task, result.error)
+                    continue
+                self.stats["paths"][result.path] += 1
+                self._store(by_source[result.task.pdf_path], result.task.page_no, result.data)
+            self._checkpoint()
+        finally:
+            self.writer.flush()
+
+        for source in self.duplicates:
+            deleted = self.writer.prune_source(source, set())
+            if deleted:
+                print(f"{source}: removed {deleted} chunks stored from a duplicate")
+
+        for source, record in records.items():
+            if not record["done"] and len(record["pages"]) == record["num_pages"]:
+                keep = {chunk_id for ids in record["pages"].values() for chunk_id in ids}
+                deleted = self.writer.prune_source(source, keep)
+                record["done"] = True
+                if deleted:
+                    print(f"{source}: removed {deleted} chunks no longer produced")
+        self.checkpoint.save()
+        if self.stats["pages"] or self.writer.stats["deleted"]:
+            self.vector_store.rebuild_lexical_index()
+        self._report(final=True)
+        for source, record in records.items():
+            for page_no, error in sorted(record.get("failed", {}).items(), key=lambda item: int(item[0])):
+                print(f"Failed: {source} page {page_no}: {error}")
+        return self.stats
+
+    def _store(self, document, page_no, data):
+        metadata = {"state": document["state"], "language": document["language"]}
+        ids = self.writer.add_page(page_no, data, document["path"], metadata)
+        self._unsaved.append((document["path"], page_no, ids))
+        self.stats["pages"] += 1
+        self.stats["chunks"] += len(ids)
+        if len(self._unsaved) >= self.checkpoint_every:
+            self._checkpoint()
+        if time.perf_counter() - self._last_report >= self.report_every:
+            self._report()
+
+    def _fail(self, task, error):
+        """Record a failed page; its document stays unfinished so a rerun retries it."""
+        self.stats["failed_pages"] += 1
+        self.checkpoint.documents[task.pdf_path].setdefault("failed", {})[str(task.page_no)] = repr(error)
+        self.checkpoint.save()
+
+    def _checkpoint(self):
+        """Wait for the writer, then record every page whose chunks are now stored."""
+        if not self._unsaved:
+            return
+        self.writer.flush()
+        for source, page_no, ids in self._unsaved:
+            record = self.checkpoint.documents[source]
+            record["pages"][str(page_no)] = ids
+            record.get("failed", {}).pop(str(page_no), None)
+        self._unsaved = []
+        self.checkpoint.save()
+
+    def _report(self, final=False):
+        self._last_report = time.perf_counter()
+        elapsed = self._last_report - self._start
+        done = self.stats["pages"] + self.stats["skipped_pages"]
+        rate = self.stats["pages"] / elapsed if elapsed else 0.0
+        remaining = self.stats["total_pages"] - done
+        eta = f", ETA {remaining / rate:.0f}s" if rate and not final else ""
+        print(f"{'Done: ' if final else ''}{done}/{self.stats['total_pages']} pages, "
+              f"{rate:.2f} pages/s, {self.stats['chunks'] / elapsed if elapsed else 0.0:.1f} chunks/s "
+              f"({self.writer.stats['embedded']} embedded, {self.writer.stats['unchanged']} unchanged){eta}")
+        if final:
+            if self.stats["failed_pages"]:
+                print(f"{self.stats['failed_pages']} pages failed; rerun to retry them")
+            print("Pages by path: " + ", ".join(f"{count} {path.replace('_', ' ')}"
+                                                for path, count in self.stats["paths"].items()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--manifest", default="manifest.json", help="JSON manifest of documents to ingest")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="OCR worker processes")
+    parser.add_argument("--only", nargs="+", metavar="STATE", help="ingest only these states")
+    parser.add_argument("--checkpoint", default="./ingest_checkpoint.json", help="checkpoint file")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and start over")
+    args = parser.parse_args()
+
+    documents = load_manifest(args.manifest)
+    if args.only:
+        documents = [document for document in documents if document["state"] in args.only]
+    if args.restart and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    ingestor = CorpusIngestor(PDFTranslator(cache=OCRCache()), VectorStore(KNOWLEDGE_BASE),
+                              IngestCheckpoint(args.checkpoint), workers=args.workers)
+    ingestor.run(documents)
@@ -0,0 +1,130 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class IngestionWriter:
+    """
+    Batches chunks across pages and writes them to a VectorStore in bulk.
+
+    Pages are consumed from a (page_no, data) stream, usually
+    PDFTranslator.process_pdf(stream=True), in the calling thread.
+    Finished batches are embedded and upserted on a thread pool, so
+    embedding overlaps with OCR of the following pages. Batches are capped
+    at Chroma's maximum batch size. At most max_pending batches are in
+    flight, so a slow embedder applies backpressure to OCR.
+    """
+    def __init__(self, vector_store, batch_size=256, embed_workers=2, max_pending=4):
+        """
+        Initialize the writer for a vector store.
+        """
+        self.vector_store = vector_store
+        self.batch_size = min(batch_size, vector_store.client.get_max_batch_size())
+        self._executor = ThreadPoolExecutor(max_workers=embed_workers)
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._write_lock = threading.Lock()
+        self._futures = []
+        self._buffer = {}  # chunk_id -> (document, metadata), not yet submitted
+        self.stats = {"chunks": 0, "embedded": 0, "unchanged": 0, "deleted": 0,
+                      "batches": 0, "embed_seconds": 0.0, "elapsed": 0.0}
+
+    def write_pages(self, pages, source, metadata=None):
+        """
+        Ingest a page stream for one source incrementally.
+
+        Chunks already stored under the same id are not re-embedded. Chunks
+        of this source that are no longer produced (changed text or removed
+        pages) are deleted at the end. metadata (e.g. state and language) is
+        stored with every chunk. Returns the writer's stats.
+        """
+        start = time.perf_counter()
+        seen_ids = set()
+        for page_no, data in pages:
+            seen_ids.update(self.add_page(page_no, data, source, metadata))
+        self.flush()
+        self.prune_source(source, seen_ids)
+        self.vector_store.rebuild_lexical_index()
+        self.stats["elapsed"] += time.perf_counter() - start
+        return self.stats
+
+    def add_page(self, page_no, data, source, metadata=None):
+        """
+        Buffer one page's chunks, submitting full batches; returns the page's chunk ids.
+
+        Pages of different sources may be interleaved. Call flush() before
+        relying on the chunks being stored.
+        """
+        documents = [data] if isinstance(data, str) else data
+        ids = []
+        for document in documents:
+            if not document or not document.strip():
+                continue
+            chunk_id = self.vector_store.chunk_id(document, source, page_no)
+            if chunk_id in ids:
+                continue
+            ids.append(chunk_id)
+            self._buffer[chunk_id] = (document, dict(metadata or {}, source=source, page=page_no))
+            if len(self._buffer) >= self.batch_size:
+                self._submit(self._buffer)
+                self._buffer = {}
+        return ids
+
+    def prune_source(self, source, keep_ids):
+        """
+        Delete the source's stored chunks whose ids are not in keep_ids; returns how many.
+        """
+        keep_ids = set(keep_ids)
+        stored = self.vector_store.collection.get(where={"source": source}, include=[])["ids"]
+        stale = [chunk_id for chunk_id in stored if chunk_id not in keep_ids]
+        if stale:
+            for i in range(0, len(stale), self.batch_size):
+                self.vector_store.collection.delete(ids=stale[i:i + self.batch_size])
+            self.vector_store.mark_changed()
+        self.stats["deleted"] += len(stale)
+        return len(stale)
+
+    def flush(self):
+        """
+        Submit any buffered chunks and wait for every batch to be written.
+        """
+        if self._buffer:
+            self._submit(self._buffer)
+            self._buffer = {}
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def chunks_per_second(self):
+        """Returns ingested chunks per second of wall time."""
+        return self.stats["chunks"] / self.stats["elapsed"] if self.stats["elapsed"] else 0.0
+
+    def _submit(self, batch):
+        self._pending.acquire()  # Blocks OCR while too many batches are in flight
+        future = self._executor.submit(self._write_batch, batch)
+        future.add_done_callback(lambda _: self._pending.release())
+        self._futures.append(future)
+
+    def _write_batch(self, batch):
+        collection = self.vector_store.collection
+        ids = list(batch)
+        existing = set(collection.get(ids=ids, include=[])["ids"])
+        new_ids = [chunk_id for chunk_id in ids if chunk_id not in existing]
+
+        embeddings = []
+        if new_ids:
+            start = time.perf_counter()
+            embeddings = self.vector_store.embedding_function([batch[chunk_id][0] for chunk_id in new_ids])
+            embed_seconds = time.perf_counter() - start
+            with self._write_lock:
+                collection.upsert(ids=new_ids,
+                                  embeddings=embeddings,
+                                  documents=[batch[chunk_id][0] for chunk_id in new_ids],
+                                  metadatas=[batch[chunk_id][1] for chunk_id in new_ids])
+                self.vector_store.mark_changed()
+                self.stats["embed_seconds"] += embed_seconds
+
+        with self._write_lock:
+            self.stats["chunks"] += len(ids)
+            self.stats["embedded"] += len(new_ids)
+            self.stats["unchanged"] += len(ids) - len(new_ids)
+            self.stats["batches"] += 1
@@ -0,0 +1,157 @@
+import math
+import os
+import re
+import unicodedata
+from collections import Counter
+
+import numpy as np
+
+# Word characters as in state_router: letters, digits and combining marks. \w alone
+# excludes the marks, so it would split Indic words at every vowel sign and virama.
+_MARKS = "".join(chr(c) for c in range(0x10000) if unicodedata.category(chr(c)).startswith("M"))
+_TOKEN = re.compile(r"[\w" + re.escape(_MARKS) + "]+")
+MAX_TOKEN_LENGTH = 40  # Longer "words" are OCR noise
+TOKENIZER_VERSION = "2"  # Saved with an index; bump when tokenize() changes
+
+
+def tokenize(text):
+    """
+    Lowercased word and number tokens; GO numbers like '114 FWL 2022' keep every part,
+    and Kannada, Tamil and other Indic words stay whole.
+    """
+    text = unicodedata.normalize("NFC", text).lower()
+    return [token for token in _TOKEN.findall(text) if len(token) <= MAX_TOKEN_LENGTH]
+
+
+class BM25Index:
+    """
+    An Okapi BM25 inverted index over a collection's chunks.
+
+    Postings are stored in flat numpy arrays: for the term with index t,
+    postings_docs[offsets[t]:offsets[t + 1]] are the documents containing it
+    and postings_tf the matching term frequencies. Only the term -> index
+    dict is a Python object, so the index stays small even for large
+    collections and saves to and loads from a single .npz file.
+
+    revision records which state of the collection the index was built
+    from (see VectorStore.revision), so a saved index can be checked
+    before it is reused.
+    """
+    def __init__(self, ids, doc_lengths, terms, offsets, postings_docs, postings_tf, k1=1.5, b=0.75, revision=None):
+        """
+        Initialize the index from its arrays; use build() or load() to create one.
+        """
+        self.ids = ids
+        self.doc_lengths = doc_lengths
+        self.terms = terms
+        self.offsets = offsets
+        self.postings_docs = postings_docs
+        self.postings_tf = postings_tf
+        self.k1 = k1
+        self.b = b
+        self.revision = revision
+        self.vocabulary = {term: i for i, term in enumerate(terms.tolist())}
+        self._positions = None  # id -> document index, built on the first mask()
+        self.average_length = float(doc_lengths.mean()) if len(doc_lengths) else 0.0
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, ids, documents, revision=None):
+        """
+        Build an index for documents with the given ids.
+        """
+        postings = {}  # term -> ([doc], [tf])
+        doc_lengths = np.zeros(len(documents), dtype=np.int32)
+        for doc, document in enumerate(documents):
+            tokens = tokenize(document or "")
+            doc_lengths[doc] = len(tokens)
+            for term, tf in Counter(tokens).items():
+                entry = postings.setdefault(term, ([], []))
+                entry[0].append(doc)
+                entry[1].append(tf)
+
+        terms = sorted(postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        for i, term in enumerate(terms):
+            offsets[i + 1] = offsets[i] + len(postings[term][0])
+        postings_docs = np.empty(offsets[-1], dtype=np.int32)
+        postings_tf = np.empty(offsets[-1], dtype=np.uint16)
+        for i, term in enumerate(terms):
+            docs, tfs = postings[term]
+            postings_docs[offsets[i]:offsets[i + 1]] = docs
+            postings_tf[offsets[i]:offsets[i + 1]] = np.minimum(tfs, np.iinfo(np.uint16).max)
+
+        return cls(np.array(ids, dtype=str), doc_lengths, np.array(terms, dtype=str),
+                   offsets, postings_docs, postings_tf, revision=revision)
+
+    def mask(self, ids):
+        """Returns a boolean array selecting the indexed documents whose id is in ids."""
+        if self._positions is None:
+            self._positions = {chunk_id: doc for doc, chunk_id in enumerate(self.ids.tolist())}
+        selected = np.zeros(len(self.ids), dtype=bool)
+        docs = [self._positions[chunk_id] for chunk_id in ids if chunk_id in self._positions]
+        selected[docs] = True
+        return selected
+
+    def search(self, query, n=10, mask=None):
+        """
+        Return up to n (id, score) pairs for the best matching documents.
+
+        mask (see mask()) restricts the results to the selected documents;
+        term statistics still come from the whole index.
+        """
+        if not len(self.ids):
+            return []
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        total = len(self.ids)
+        for term in set(tokenize(query)):
+            t = self.vocabulary.get(term)
+            if t is None:
+                continue
+            start, end = self.offsets[t], self.offsets[t + 1]
+            docs = self.postings_docs[start:end]
+            tf = self.postings_tf[start:end].astype(np.float32)
+            df = end - start
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[docs] / self.average_length)
+            scores[docs] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        if mask is not None:
+            scores[~mask] = 0.0
+        matched = np.flatnonzero(scores)
+        if len(matched) > n:
+            matched = matched[np.argpartition(-scores[matched], n)[:n]]
+        matched = matched[np.argsort(-scores[matched], kind="stable")]
+        return [(str(self.ids[doc]), float(scores[doc])) for doc in matched]
+
+    def save(self, path):
+        """
+        Write the index to a .npz file atomically.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, ids=self.ids, doc_lengths=self.doc_lengths, terms=self.terms, offsets=self.offsets,
+                     postings_docs=self.postings_docs, postings_tf=self.postings_tf,
+                     revision=np.array(self.revision or ""), tokenizer=np.array(TOKENIZER_VERSION))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index written by save().
+        """
+        with np.load(path, allow_pickle=False) as data:
+            # Indexes saved before revisions were recorded, or by another tokenizer, are rebuilt
+            revision = (str(data["revision"]) or None) if "revision" in data.files else None
+            if "tokenizer" not in data.files or str(data["tokenizer"]) != TOKENIZER_VERSION:
+                revision = None
+            return cls(data["ids"], data["doc_lengths"], data["terms"], data["offsets"],
+                       data["postings_docs"], data["postings_tf"], revision=revision)
+
+    def nbytes(self):
+        """Returns the memory held by the index arrays."""
+        return sum(array.nbytes for array in (self.ids, self.doc_lengths, self.terms, self.offsets,
+                                              self.postings_docs, self.postings_tf))
@@ -0,0 +1,91 @@
+"""
+Migrate per-state collections (<state>_knowledge_base) into the unified
+knowledge_base collection.
+
+Documents, embeddings and metadata are copied as they are, so nothing is
+re-embedded; each chunk gains state and language metadata. Running the
+migration again only copies chunks that are not there yet.
+
+Usage:
+    python migrate_collections.py [--db ./chroma_db] [--drop-old]
+"""
+import argparse
+import os
+
+import chromadb
+
+from vector_store import KNOWLEDGE_BASE, VectorStore
+
+SUFFIX = "_knowledge_base"
+
+# Original language of each state's documents, as they were ingested
+STATE_LANGUAGES = {"karnataka": "kn", "kerala": "en", "tamilnadu": "ta", "telangana": "en"}
+
+
+def migrate_collection(client, old_name, target, batch_size):
+    """Copy one per-state collection into the target VectorStore; returns the number of chunks copied."""
+    state = old_name[:-len(SUFFIX)]
+    old = client.get_collection(old_name)
+    copied = 0
+    for offset in range(0, old.count(), batch_size):
+        batch = old.get(include=["documents", "embeddings", "metadatas"], offset=offset, limit=batch_size)
+        ids, documents, embeddings, metadatas = [], [], [], []
+        for chunk_id, document, embedding, metadata in zip(batch["ids"], batch["documents"],
+                                                           batch["embeddings"], batch["metadatas"]):
+            metadata = dict(metadata or {})
+            if "source" not in metadata:
+                # Chunks added before sources were recorded
+                metadata["source"] = old_name
+                chunk_id = VectorStore.chunk_id(document, old_name, metadata.get("page"))
+            metadata["state"] = state
+            metadata.setdefault("language", STATE_LANGUAGES.get(state, "en"))
+            ids.append(chunk_id)
+            documents.append(document)
+            embeddings.append(embedding)
+            metadatas.append(metadata)
+
+        existing = set(target.collection.get(ids=ids, include=[])["ids"])
+        new = [i for i, chunk_id in enumerate(ids) if chunk_id not in existing]
+        if new:
+            target.collection.upsert(ids=[ids[i] for i in new],
+                                     documents=[documents[i] for i in new],
+                                     embeddings=[embeddings[i] for i in new],
+                                     metadatas=[metadatas[i] for i in new])
+            target.mark_changed()
+        copied += len(new)
+    print(f"{old_name}: {copied} of {old.count()} chunks copied as state '{state}'.")
+    return copied
+
+
+def migrate(db_path="./chroma_db", drop_old=False):
+    """
+    Copy every <state>_knowledge_base collection in db_path into knowledge_base.
+    """
+    client = chromadb.PersistentClient(db_path)
+    target = VectorStore(KNOWLEDGE_BASE, client=client)
+    old_names = sorted(name for name in client.list_collections() if name.endswith(SUFFIX) and name != KNOWLEDGE_BASE)
+    if not old_names:
+        print(f"No per-state collections found in {db_path}.")
+        return
+
+    batch_size = client.get_max_batch_size()
+    for old_name in old_names:
+        migrate_collection(client, old_name, target, batch_size)
+    target.rebuild_lexical_index()
+
+    if drop_old:
+        for old_name in old_names:
+            client.delete_collection(old_name)
+            index_path = os.path.join(os.path.dirname(target.index_path), old_name + ".npz") if target.index_path else None
+            if index_path and os.path.exists(index_path):
+                os.remove(index_path)
+        print(f"Dropped {', '.join(old_names)}.")
+    print(f"{KNOWLEDGE_BASE} now holds {target.collection.count()} chunks.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default="./chroma_db", help="Chroma directory")
+    parser.add_argument("--drop-old", action="store_true", help="delete the per-state collections afterwards")
+    args = parser.parse_args()
+    migrate(args.db, args.drop_old)
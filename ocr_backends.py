@@ -0,0 +1,98 @@
+import importlib.util
+import os
+import threading
+from multiprocessing.util import Finalize
+
+import numpy as np
+
+
+class PytesseractBackend:
+    """
+    OCR through the tesseract command line, via pytesseract.
+
+    Every call writes the image to a temporary file and starts a new
+    tesseract process, which loads the language's traineddata again.
+    """
+    name = "pytesseract"
+
+    def __init__(self, tessdata_prefix=None, dpi=200):
+        self.tessdata_prefix = tessdata_prefix
+        self.dpi = dpi
+
+    def image_to_text(self, image, lang):
+        """Returns the text of a page image (PIL image or uint8 array)."""
+        import pytesseract
+        return pytesseract.image_to_string(image, lang=lang)
+
+
+class TesserocrBackend:
+    """
+    OCR with an in-process Tesseract engine, via tesserocr.
+
+    One initialized engine is kept per language for the life of the
+    process (so per pool worker), and page arrays are handed to it as
+    in-memory buffers: no temporary files and no traineddata reloads. The
+    page segmentation and engine modes are Tesseract's defaults, as with
+    the command line.
+    """
+    name = "tesserocr"
+
+    def __init__(self, tessdata_prefix=None, dpi=200):
+        self.tessdata_prefix = tessdata_prefix
+        self.dpi = dpi
+        self._engines = {}
+        self._lock = threading.Lock()
+        # Pool workers skip atexit hooks; end the engines when the process exits
+        Finalize(self, _end_engines, args=(self._engines,), exitpriority=5)
+
+    def engine(self, lang):
+        """Returns the engine for a language, initializing it on first use."""
+        if lang not in self._engines:
+            from tesserocr import PyTessBaseAPI
+            path = self.tessdata_prefix.rstrip("/") + "/" if self.tessdata_prefix else None
+            self._engines[lang] = PyTessBaseAPI(path=path, lang=lang) if path else PyTessBaseAPI(lang=lang)
+        return self._engines[lang]
+
+    def image_to_text(self, image, lang):
+        """Returns the text of a page image (uint8 array or PIL image)."""
+        pixels = np.ascontiguousarray(np.asarray(image), dtype=np.uint8)
+        height, width = pixels.shape[:2]
+        channels = 1 if pixels.ndim == 2 else pixels.shape[2]
+        with self._lock:
+            engine = self.engine(lang)
+            engine.SetImageBytes(pixels.tobytes(), width, height, channels, width * channels)
+            engine.SetSourceResolution(self.dpi)
+            return engine.GetUTF8Text()
+
+    def close(self):
+        """Releases every engine."""
+        with self._lock:
+            _end_engines(self._engines)
+
+
+def _end_engines(engines):
+    for engine in engines.values():
+        engine.End()
+    engines.clear()
+
+
+BACKENDS = {"pytesseract": PytesseractBackend, "tesserocr": TesserocrBackend}
+
+
+def default_backend_name():
+    """
+    The OCR_BACKEND environment variable if set, else tesserocr when it is
+    installed, else pytesseract.
+    """
+    name = os.environ.get("OCR_BACKEND")
+    if name:
+        return name
+    return "tesserocr" if importlib.util.find_spec("tesserocr") else "pytesseract"
+
+
+def make_ocr_backend(name=None, tessdata_prefix=None, dpi=200):
+    """Builds an OCR backend by name (default: default_backend_name())."""
+    name = name or default_backend_name()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown OCR backend '{name}'; choose from {', '.join(BACKENDS)}")
+    return BACKENDS[name](tessdata_prefix=tessdata_prefix, dpi=dpi)
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+
+
+class OCRCache:
+    """
+    A content-addressed on-disk cache for page OCR and translation results.
+
+    Entries are keyed by the PDF's content hash, page number, DPI,
+    preprocessing parameters, Tesseract language and extraction settings
+    (text layer and blank-page detection), so re-ingesting an unchanged PDF
+    skips both Tesseract and translation. Raw OCR text and
+    translated text are stored as separate files. When the cache grows past
+    max_bytes the least recently used files are evicted.
+    """
+    def __init__(self, cache_dir="./ocr_cache", max_bytes=512 * 1024 * 1024):
+        """
+        Initialize the cache directory and hit/miss counters.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = {"ocr_hits": 0, "ocr_misses": 0, "translation_hits": 0, "translation_misses": 0}
+        self._size = None  # Computed lazily on the first write
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def file_hash(path):
+        """Returns the SHA-256 hex digest of a file's contents."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def page_key(pdf_hash, page_no, dpi, preprocess_params, lang, extraction=None):
+        """Builds the cache key for one page's extracted text (text layer or OCR)."""
+        payload = json.dumps({
+            "pdf": pdf_hash,
+            "page": page_no,
+            "dpi": dpi,
+            "preprocess": preprocess_params,
+            "lang": lang,
+            "extraction": extraction,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_ocr(self, key):
+        """Returns cached OCR text for a page key, or None."""
+        return self._read(self._path(key, "ocr"), "ocr")
+
+    def put_ocr(self, key, text):
+        """Stores OCR text for a page key."""
+        self._write(self._path(key, "ocr"), text)
+
+    def get_translation(self, key, src, dest):
+        """Returns cached translated text for a page key and language pair, or None."""
+        return self._read(self._path(key, f"{src}-{dest}"), "translation")
+
+    def put_translation(self, key, src, dest, text):
+        """Stores translated text for a page key and language pair."""
+        self._write(self._path(key, f"{src}-{dest}"), text)
+
+    def add_stats(self, counts):
+        """Adds hit/miss counts recorded elsewhere, such as by a pool worker's copy of the cache."""
+        for name, count in counts.items():
+            self.stats[name] += count
+
+    def hit_rate(self):
+        """Returns the combined hit rate across OCR and translation lookups."""
+        hits = self.stats["ocr_hits"] + self.stats["translation_hits"]
+        total = hits + self.stats["ocr_misses"] + self.stats["translation_misses"]
+        return hits / total if total else 0.0
+
+    def _path(self, key, kind):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{kind}.txt")
+
+    def _read(self, path, kind):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            self.stats[f"{kind}_misses"] += 1
+            return None
+        os.utime(path)  # Mark as recently used for eviction
+        self.stats[f"{kind}_hits"] += 1
+        return text
+
+    def _write(self, path, text):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            replaced = os.path.getsize(path)  # Rewriting a key replaces its entry, not adds one
+        except FileNotFoundError:
+            replaced = 0
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)  # Atomic so concurrent workers never see partial entries
+
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += os.path.getsize(path) - replaced
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".txt"):
+                    path = os.path.join(root, name)
+                    st = os.stat(path)
+                    yield path, st.st_size, st.st_mtime
+
+    def _evict(self):
+        """Removes least recently used entries until the cache is under max_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        size = sum(entry[1] for entry in entries)
+        for path, entry_size, _ in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+        self._size = size
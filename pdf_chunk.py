@@ -1,119 +1,470 @@
-from pdf2image import convert_from_path
-import pytesseract
-from googletrans import Translator
-from deep_translator import GoogleTranslator
+from pdf2image import convert_from_path, pdfinfo_from_path
 import cv2
 import numpy as np
 import os
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing.util import Finalize
 from PIL import Image
+from chunker import TextChunker
+from ocr_backends import make_ocr_backend
+from ocr_cache import OCRCache
+from text_layer import TextLayerReader
+from translation_service import get_translation_service
+
+# Defaults for preprocess_image; every value is part of the OCR cache key
+DEFAULT_PREPROCESS_PARAMS = {
+    "skip": False,            # Send the raw grayscale page straight to Tesseract
+    "threshold_block": 15,    # Adaptive threshold neighbourhood size (odd)
+    "threshold_c": 5,         # Constant subtracted from the neighbourhood mean
+    "h_kernel": 40,           # Width of the horizontal line kernel
+    "v_kernel": 40,           # Height of the vertical line kernel
+    "iterations": 2,          # Morphological opening iterations
+    "blend_alpha": 0.5,       # Weight of the line-removed image in the blend
+}
+
+# How a page's text was obtained; see PDFTranslator.extract_page
+PAGE_PATHS = ("text_layer", "ocr", "blank", "cached")
+
+# One page to extract, and its outcome; see PDFTranslator.iter_pages
+PageTask = namedtuple("PageTask", ["pdf_path", "page_no", "lang", "translate", "src_lang", "dest_lang"])
+PageTask.__new__.__defaults__ = (False, 'auto', 'en')
+PageResult = namedtuple("PageResult", ["task", "data", "path", "error"])
+PageResult.__doc__ = """
+Result of one PageTask: data is the page's chunks and path one of
+PAGE_PATHS, or error is the exception that stopped the page (data and
+path are then None).
+"""
+
+class DebugImageWriter:
+    """
+    Writes the per-page original/processed debug JPEGs.
+
+    mode is "off" (write nothing), "sync" (write inline) or "async" (encode
+    and write on a background thread so OCR never waits on JPEG encoding).
+    With every=N only every Nth page is written.
+    """
+    def __init__(self, mode="off", every=1, max_pending=8):
+        if mode not in ("off", "sync", "async"):
+            raise ValueError(f"Unknown debug image mode: {mode}")
+        self.mode = mode
+        self.every = max(1, every)
+        self._queue = None
+        if mode == "async":
+            # Bounded so a slow disk applies backpressure instead of buffering every page
+            self._queue = queue.Queue(maxsize=max_pending)
+            threading.Thread(target=self._run, daemon=True).start()
+
+    def wants(self, page_no):
+        """Returns True if debug images should be written for this page."""
+        return self.mode != "off" and (page_no - 1) % self.every == 0
+
+    def save(self, image, path):
+        """Saves a PIL image or uint8 array as a JPEG, inline or in the background."""
+        if self._queue is not None:
+            self._queue.put((image, path))
+        else:
+            self._write(image, path)
+
+    def flush(self):
+        """Blocks until every queued image has been written."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def _write(self, image, path):
+        if isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
+        image.save(path)
+
+    def _run(self):
+        while True:
+            image, path = self._queue.get()
+            try:
+                self._write(image, path)
+            except Exception as e:
+                print(f"Debug image error for {path}: {e}")
+            finally:
+                self._queue.task_done()
+
 
 class PDFTranslator:
-    def __init__(self, tessdata_prefix='/opt/homebrew/share/tessdata/'):
+    def __init__(self, tessdata_prefix='/opt/homebrew/share/tessdata/', dpi=200, cache=None, preprocess_params=None,
+                 debug_images="off", debug_every=1, chunker=None, ocr_backend=None, text_layer=True, blank_std=3.0):
         self.tessdata_prefix = tessdata_prefix
-        self.translator = Translator()
+        self.translation_service = get_translation_service()
+        self.dpi = dpi
+        self.cache = cache  # Optional OCRCache shared across re-ingestions
+        self.preprocess_params = {**DEFAULT_PREPROCESS_PARAMS, **(preprocess_params or {})}
+        # page_N_original/processed.jpg are debugging aids only; nothing reads them back
+        self.debug_images = DebugImageWriter(debug_images, debug_every)
+        self.chunker = chunker or TextChunker()
         os.environ['TESSDATA_PREFIX'] = self.tessdata_prefix
+        # In-process Tesseract (tesserocr) when installed, else the pytesseract CLI
+        self.ocr_backend = make_ocr_backend(ocr_backend, tessdata_prefix=self.tessdata_prefix, dpi=self.dpi)
+        # Born-digital pages are read from their text layer instead of OCR'd (text_layer=False to always OCR)
+        self.text_layer = TextLayerReader() if text_layer is True else (text_layer or None)
+        # Rasterized pages with less pixel spread than this are blank (None to OCR every page)
+        self.blank_std = blank_std
+        self.page_paths = dict.fromkeys(PAGE_PATHS, 0)
 
     def convert_pdf_to_images(self, pdf_path):
         """Converts PDF pages to images."""
         return convert_from_path(pdf_path)
 
-    def remove_table_lines(self, image):
-        """Removes table lines using morphological operations."""
-        # Convert PIL image to OpenCV format
-        open_cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        gray = cv2.cvtColor(open_cv_image, cv2.COLOR_BGR2GRAY)
+    def rasterize_page(self, pdf_path, page_no):
+        """Converts a single PDF page to a grayscale image."""
+        return convert_from_path(pdf_path, dpi=self.dpi, first_page=page_no, last_page=page_no, grayscale=True)[0]
+
+    def iter_pdf_images(self, pdf_path):
+        """Yields (page_no, image) one page at a time so only one page is held in memory."""
+        for page_no in range(1, self.page_count(pdf_path) + 1):
+            yield page_no, self.rasterize_page(pdf_path, page_no)
+
+    def to_grayscale(self, image):
+        """Returns a page as a single-channel uint8 array, converting only if needed."""
+        if isinstance(image, np.ndarray):
+            return image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+        if image.mode != "L":
+            image = image.convert("L")
+        return np.asarray(image)
+
+    def remove_table_lines(self, gray):
+        """Removes table lines from a grayscale array using morphological operations."""
+        params = self.preprocess_params
 
         # Apply adaptive threshold to make the image binary
-        binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 15, 5)
+        binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV,
+                                       params["threshold_block"], params["threshold_c"])
 
         # Define kernels for horizontal and vertical line detection
-        kernel_horizontal = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))  # Detect horizontal lines
-        kernel_vertical = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 40))  # Detect vertical lines
+        kernel_horizontal = cv2.getStructuringElement(cv2.MORPH_RECT, (params["h_kernel"], 1))  # Detect horizontal lines
+        kernel_vertical = cv2.getStructuringElement(cv2.MORPH_RECT, (1, params["v_kernel"]))  # Detect vertical lines
 
         # Detect horizontal and vertical lines
-        horizontal_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel_horizontal, iterations=2)
-        vertical_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel_vertical, iterations=2)
+        horizontal_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel_horizontal, iterations=params["iterations"])
+        vertical_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel_vertical, iterations=params["iterations"])
+
+        # Combine the detected lines into a mask, reusing the horizontal buffer
+        table_mask = cv2.add(horizontal_lines, vertical_lines, dst=horizontal_lines)
 
-        # Combine the detected lines into a mask
-        table_mask = cv2.add(horizontal_lines, vertical_lines)
+        # Invert the page under the mask; everything else is zero
+        return cv2.bitwise_not(gray, mask=table_mask)
 
-        # Invert mask to white (background) and apply bitwise operation
-        no_table_image = cv2.bitwise_not(gray, mask=table_mask)
+    def preprocess_image(self, image):
+        """
+        Prepares a page for Tesseract, staying in single-channel uint8 throughout.
 
-        # Convert back to PIL image
-        processed_pil = Image.fromarray(cv2.cvtColor(no_table_image, cv2.COLOR_GRAY2RGB))
-        return processed_pil
+        Equivalent to blending the page with its line-removed version, as the
+        RGB pipeline did, but without any colour-space round trips.
+        """
+        gray = self.to_grayscale(image)
+        if self.preprocess_params["skip"]:
+            return gray
+        no_table_image = self.remove_table_lines(gray)
+        alpha = self.preprocess_params["blend_alpha"]
+        return cv2.addWeighted(gray, 1.0 - alpha, no_table_image, alpha, 0.0, dst=no_table_image)
+
+    def is_blank(self, image):
+        """
+        Returns True for a blank or near-blank page.
+
+        The standard deviation of every 4th pixel in each direction is enough:
+        a single line of text spreads the pixel values well past blank_std,
+        while an empty scan only has paper grain.
+        """
+        if self.blank_std is None:
+            return False
+        return float(self.to_grayscale(image)[::4, ::4].std()) < self.blank_std
 
     def extract_text_from_image(self, image, lang):
         """Extracts text from an image using Tesseract OCR."""
-        return pytesseract.image_to_string(image, lang=lang)
+        return self.ocr_backend.image_to_text(image, lang)
 
     def translate_text(self, text, src, dest):
-        """Translates text using Deep Translator (Google)."""
-        try:
-            return GoogleTranslator(source=src, target=dest).translate(text)
-        except Exception as e:
-            print(f"Translation Error: {e}")
-            return text  # Return original text if translation fails
-
-    # def translate_text(self, text, src, dest):
-    #     """Translates text from source language to destination language."""
-    #     return self.translator.translate(text, src=src, dest=dest).text
-        
+        """Translates text paragraph by paragraph using the shared TranslationService."""
+        return self.translation_service.translate(text, src, dest)  # Untranslated paragraphs are returned as-is
+
     def chunk_text(self, text):
-        """Splits text into meaningful chunks based on paragraphs."""
-        paragraphs = text.strip().split("\n\n")
-        chunks = [para.strip() for para in paragraphs if para.strip()]
-        return chunks
-
-    def process_pdf(self, pdf_path, lang, translate=False, src_lang='auto', dest_lang='en', output_folder="output_images"):
-        """Processes a PDF file, saves images, extracts text, and translates if required."""
-        os.makedirs(output_folder, exist_ok=True)
-        images = self.convert_pdf_to_images(pdf_path)
-        all_data = []
-
-        for i, image in enumerate(images):
-            # Save original image
-            original_image_path = os.path.join(output_folder, f"page_{i+1}_original.jpg")
-            image.save(original_image_path)
-            # print(f"Saved original image: {original_image_path}")
-
-            # Remove table lines
-            processed_image = self.remove_table_lines(image)
-            combined_image = Image.blend(image, processed_image, alpha=0.5)
-            processed_image = combined_image
-            processed_image_path = os.path.join(output_folder, f"page_{i+1}_processed.jpg")
-            processed_image.save(processed_image_path)
-            # print(f"Saved processed image: {processed_image_path}")
-
-            # Extract text
-            extracted_text = self.extract_text_from_image(processed_image, lang)
-            # print(f"Extracted text from page {i+1}:\n", extracted_text)
-
-            # Translate text if needed
-            if translate:
-                data = self.translate_text(extracted_text, src=src_lang, dest=dest_lang)
-                # chunks = self.chunk_text(translated_text)
-            else:
-                data = self.chunk_text(extracted_text)
-
-            all_data.append((i+1, data))
-
-        return all_data
+        """Splits text into sentence-aligned, overlapping chunks of about chunker.target_tokens tokens."""
+        return self.chunker.chunk(text)
+
+    def page_cache_key(self, pdf_hash, page_no, lang):
+        """Returns the OCRCache key for a page, or None when caching is disabled."""
+        if self.cache is None or pdf_hash is None:
+            return None
+        return self.cache.page_key(pdf_hash, page_no, self.dpi, self.preprocess_params, lang,
+                                   extraction=self.extraction_settings())
+
+    def extraction_settings(self):
+        """Returns the text-layer and blank-page settings, which decide which path a page takes."""
+        return {"text_layer": self.text_layer.settings() if self.text_layer is not None else None,
+                "blank_std": self.blank_std}
+
+    def cached_page(self, cache_key, page_no, translate=False, src_lang='auto', dest_lang='en'):
+        """
+        Returns (page_no, data) built from cached OCR text, or None if the page must be rasterized.
+
+        A cached OCR text with a missing translation is translated here, so
+        the page still skips rasterization and Tesseract.
+        """
+        if cache_key is None:
+            return None
+        extracted_text = self.cache.get_ocr(cache_key)
+        if extracted_text is None:
+            return None
+        return (page_no, self.finish_page(extracted_text, translate, src_lang, dest_lang, cache_key))
+
+    def finish_page(self, extracted_text, translate=False, src_lang='auto', dest_lang='en', cache_key=None):
+        """
+        Translates extracted page text if required, then chunks it.
+
+        Translated and untranslated pages are chunked the same way; the
+        translation cache holds the unchunked text so chunking can change
+        without re-translating.
+        """
+        if not translate or not extracted_text.strip():
+            return self.chunk_text(extracted_text)
+
+        if cache_key is not None:
+            translated = self.cache.get_translation(cache_key, src_lang, dest_lang)
+            if translated is not None:
+                return self.chunk_text(translated)
+
+        translated, ok = self.translation_service.translate_with_status(extracted_text, src_lang, dest_lang)
+        # Paragraphs that failed are left untranslated; only cache complete translations
+        if cache_key is not None and ok:
+            self.cache.put_translation(cache_key, src_lang, dest_lang, translated)
+        return self.chunk_text(translated)
+
+    def process_page(self, image, page_no, lang, translate=False, src_lang='auto', dest_lang='en', output_folder="output_images", cache_key=None):
+        """Processes a single page image and returns its (page_no, data) tuple."""
+        save_debug = self.debug_images.wants(page_no)
+        if save_debug:
+            self.debug_images.save(image, os.path.join(output_folder, f"page_{page_no}_original.jpg"))
+
+        # Remove table lines
+        processed_image = self.preprocess_image(image)
+        if save_debug:
+            self.debug_images.save(processed_image, os.path.join(output_folder, f"page_{page_no}_processed.jpg"))
+
+        # Extract text
+        extracted_text = self.extract_text_from_image(processed_image, lang)
+        if cache_key is not None:
+            self.cache.put_ocr(cache_key, extracted_text)
+
+        # Translate text if needed
+        data = self.finish_page(extracted_text, translate, src_lang, dest_lang, cache_key)
+
+        return (page_no, data)
+
+    def extract_page(self, pdf_path, page_no, lang, translate=False, src_lang='auto', dest_lang='en', output_folder="output_images", cache_key=None):
+        """
+        Extracts, translates and chunks one page by the cheapest path that works.
+
+        A usable text layer is taken as is. Otherwise the page is rasterized;
+        blank pages stop there and the rest are OCR'd. Returns
+        (page_no, data, path) with path one of "text_layer", "blank" or "ocr".
+        """
+        if self.text_layer is not None:
+            extracted_text = self.text_layer.page_text(pdf_path, page_no, lang)
+            if extracted_text is not None:
+                if cache_key is not None:
+                    self.cache.put_ocr(cache_key, extracted_text)
+                return (page_no, self.finish_page(extracted_text, translate, src_lang, dest_lang, cache_key), "text_layer")
+
+        image = self.rasterize_page(pdf_path, page_no)
+        if self.is_blank(image):
+            if cache_key is not None:
+                self.cache.put_ocr(cache_key, "")
+            return (page_no, [], "blank")
+        page_no, data = self.process_page(image, page_no, lang, translate=translate, src_lang=src_lang,
+                                          dest_lang=dest_lang, output_folder=output_folder, cache_key=cache_key)
+        return (page_no, data, "ocr")
+
+    def page_count(self, pdf_path):
+        """Returns the number of pages in a PDF without rasterizing it."""
+        return pdfinfo_from_path(pdf_path)["Pages"]
+
+    def process_pdf(self, pdf_path, lang, translate=False, src_lang='auto', dest_lang='en', output_folder="output_images", workers=1, stream=False):
+        """
+        Processes a PDF file, saves images, extracts text, and translates if required.
+
+        With workers > 1 pages are spread across a process pool; each worker
+        rasterizes only its own page, and results keep page order.
+        Use iter_pages to extract pages of several PDFs in one pool.
+        With stream=True a generator of (page_no, data) is returned instead of a list.
+        """
+        pages = self.iter_pdf(pdf_path, lang, translate=translate, src_lang=src_lang, dest_lang=dest_lang,
+                              output_folder=output_folder, workers=workers)
+        return pages if stream else list(pages)
+
+    def iter_pdf(self, pdf_path, lang, translate=False, src_lang='auto', dest_lang='en', output_folder="output_images", workers=1):
+        """
+        Yields (page_no, data) in page order, rasterizing one page at a time.
+
+        Raises the error of the first page that fails.
+        """
+        if self.debug_images.mode != "off":
+            os.makedirs(output_folder, exist_ok=True)
+        tasks = (PageTask(pdf_path, page_no, lang, translate, src_lang, dest_lang)
+                 for page_no in range(1, self.page_count(pdf_path) + 1))
+        ready, next_page = {}, 1
+        try:
+            # Pages finish out of order in the pool; hold them until their turn
+            for result in self.iter_pages(tasks, workers=workers, output_folder=output_folder):
+                if result.error is not None:
+                    raise result.error
+                ready[result.task.page_no] = result.data
+                while next_page in ready:
+                    yield (next_page, ready.pop(next_page))
+                    next_page += 1
+        finally:
+            self.debug_images.flush()
+
+    def iter_pages(self, tasks, workers=1, output_folder="output_images"):
+        """
+        Extracts pages of any number of PDFs; yields a PageResult as each page finishes.
+
+        tasks is an iterable of PageTask, consumed lazily. Pages in the OCR
+        cache are served in this process. With workers > 1 the rest go to a
+        process pool with at most 2 * workers pages in flight, so the pool
+        stays busy across document boundaries and results come in completion
+        order. A page that fails is yielded with its exception as error
+        instead of ending the run.
+        """
+        hashes = {}
+
+        def lookup(task):
+            cache_key = None
+            if self.cache is not None:
+                if task.pdf_path not in hashes:
+                    hashes[task.pdf_path] = OCRCache.file_hash(task.pdf_path)
+                cache_key = self.page_cache_key(hashes[task.pdf_path], task.page_no, task.lang)
+            return cache_key, self.cached_page(cache_key, task.page_no, task.translate, task.src_lang, task.dest_lang)
+
+        if not workers or workers <= 1:
+            for task in tasks:
+                try:
+                    cache_key, cached = lookup(task)
+                    if cached is not None:
+                        result = self._page_result(task, cached[1], "cached")
+                    else:
+                        _, data, path = self.extract_page(task.pdf_path, task.page_no, task.lang, task.translate,
+                                                          task.src_lang, task.dest_lang, output_folder, cache_key)
+                        result = self._page_result(task, data, path)
+                except Exception as e:
+                    result = self._page_failure(task, e)
+                yield result
+            return
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.worker_config(),)) as executor:
+            in_flight = {}
+            tasks = iter(tasks)
+            while True:
+                for task in tasks:
+                    try:
+                        cache_key, cached = lookup(task)
+                    except Exception as e:
+                        yield self._page_failure(task, e)
+                        continue
+                    if cached is not None:
+                        yield self._page_result(task, cached[1], "cached")
+                        continue
+                    worker_task = (task.pdf_path, task.page_no, task.lang, task.translate, task.src_lang,
+                                   task.dest_lang, output_folder, cache_key)
+                    in_flight[executor.submit(_process_page_in_worker, worker_task)] = task
+                    if len(in_flight) >= 2 * workers:
+                        break
+                if not in_flight:
+                    return
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = in_flight.pop(future)
+                    try:
+                        _, data, path, cache_stats = future.result()
+                    except Exception as e:
+                        yield self._page_failure(task, e)
+                        continue
+                    if cache_stats:
+                        self.cache.add_stats(cache_stats)
+                    yield self._page_result(task, data, path)
+
+    def _page_result(self, task, data, path):
+        self.page_paths[path] += 1
+        return PageResult(task, data, path, None)
+
+    @staticmethod
+    def _page_failure(task, error):
+        print(f"{task.pdf_path} page {task.page_no} failed: {error!r}")
+        return PageResult(task, None, None, error)
+
+    def worker_config(self):
+        """Returns the constructor arguments used to rebuild this translator in pool workers."""
+        return {
+            "tessdata_prefix": self.tessdata_prefix,
+            "dpi": self.dpi,
+            "cache": self.cache,
+            "preprocess_params": self.preprocess_params,
+            "debug_images": self.debug_images.mode,
+            "debug_every": self.debug_images.every,
+            "chunker": self.chunker,
+            "ocr_backend": self.ocr_backend.name,  # Each worker builds its own engines
+            "text_layer": self.text_layer or False,
+            "blank_std": self.blank_std,
+        }
+
+
+# Per-process PDFTranslator used by the process pool in process_pdf
+_worker_translator = None
+
+
+def _init_worker(config):
+    """Builds one PDFTranslator per worker process."""
+    global _worker_translator
+    # The pool already keeps every core busy; Tesseract's own OpenMP threads
+    # would only oversubscribe them. Set before any engine or CLI call reads it.
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    _worker_translator = PDFTranslator(**config)
+    # Pool workers exit without running atexit hooks; drain pending debug images first
+    Finalize(_worker_translator, _worker_translator.debug_images.flush, exitpriority=10)
+
+
+def _process_page_in_worker(task):
+    """
+    Extracts a single page inside a pool worker; returns (page_no, data, path, cache_stats).
+
+    cache_stats holds the cache hits and misses of this page alone (None
+    without a cache), for the parent to add to its own OCRCache.stats.
+    """
+    pdf_path, page_no, lang, translate, src_lang, dest_lang, output_folder, cache_key = task
+    cache = _worker_translator.cache
+    before = dict(cache.stats) if cache is not None else None
+    page_no, data, path = _worker_translator.extract_page(pdf_path, page_no, lang, translate=translate,
+                                                          src_lang=src_lang, dest_lang=dest_lang,
+                                                          output_folder=output_folder, cache_key=cache_key)
+    cache_stats = {name: count - before[name] for name, count in cache.stats.items()} if cache is not None else None
+    return (page_no, data, path, cache_stats)
 
 # Usage
 if __name__ == "__main__":
-    translator = PDFTranslator()
+    translator = PDFTranslator(cache=OCRCache())  # Re-runs skip OCR/translation for unchanged pages
     
     pdf_path = "karnataka.pdf"  # Change to your PDF file path
     lang = "kan"  # Kannada (Tesseract Language Code)
     src_lang = "kn"  # Google Translate Source Language
     dest_lang = "en"  # Translate to English
     
-    chunked_pages = translator.process_pdf(pdf_path, lang, translate=True, src_lang=src_lang, dest_lang=dest_lang)
+    workers = os.cpu_count() or 1  # Spread pages across all cores
+    
+    chunked_pages = translator.process_pdf(pdf_path, lang, translate=True, src_lang=src_lang, dest_lang=dest_lang, workers=workers)
 
     # Print extracted text chunks
     # for page_num, chunks in chunked_pages:
         # print(f"\nPage {page_num} Chunks:")
         # for j, chunk in enumerate(chunks, 1):
-            # print(f"Chunk {j}: {chunk}\n")
\ No newline at end of file
+            # print(f"Chunk {j}: {chunk}\n")
+    print(f"Page paths: {translator.page_paths}")
+    print(f"OCR cache stats: {translator.cache.stats}")
\ No newline at end of file
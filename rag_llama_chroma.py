@@ -1,37 +1,204 @@
+import threading
+
+import chromadb
+from chromadb.utils import embedding_functions
+
+from answer_cache import SemanticAnswerCache
+from context_builder import ContextAssembler
 from gen_ollama import OllamaChat
-from vector_store import VectorStore
+from state_router import get_state_router
+from vector_store import KNOWLEDGE_BASE, VectorStore
+
+
+class RagEngine:
+    """
+    A long-lived RAG engine.
+
+    Opens the Chroma client once, keeps the unified knowledge-base
+    collection and the embedding function loaded, and reuses a single
+    Ollama client, so a query pays only for retrieval and generation.
+    Every chunk carries state, source, page and language metadata; the
+    states are discovered from that metadata, and queries are filtered to
+    the states they mention (all states when they mention none).
+    """
+    def __init__(self, model_name='gemma2:2b', db_path="./chroma_db", cache_answers=True,
+                 collection_name=KNOWLEDGE_BASE):
+        """
+        Initialize the Chroma client, embedding function and Ollama model.
+        """
+        self.client = chromadb.PersistentClient(db_path)
+        # The same ONNX MiniLM model Chroma uses by default, loaded once
+        self.embedding_function = embedding_functions.DefaultEmbeddingFunction()
+        self.store = VectorStore(collection_name=collection_name, client=self.client,
+                                 embedding_function=self.embedding_function)
+        self.ollama_model = OllamaChat(model_name=model_name)
+        self.state_router = get_state_router()
+        # Answers to near-identical questions are served without retrieval or generation
+        self.answer_cache = SemanticAnswerCache() if cache_answers else None
+        # Keeps the prompt short: token budget, dedup and low-relevance trimming
+        self.context_assembler = ContextAssembler()
+        self.state_list = self.discover_states()
+
+    def discover_states(self):
+        """
+        Return the sorted states present in the knowledge base's metadata.
+        """
+        metadatas = self.store.collection.get(include=["metadatas"])["metadatas"]
+        states = sorted({metadata["state"] for metadata in metadatas if metadata and metadata.get("state")})
+        if not states:
+            print(f"No states found in {self.store.collection_name}; "
+                  f"run migrate_collections.py if you have per-state collections.")
+        self.state_list = states
+        return states
+
+    def warm_up(self):
+        """
+        Load the embedding model and BM25 index ahead of the first query.
+        """
+        self.embedding_function(["warm up"])
+        self.store.lexical_index()
+
+    def resolve_states(self, user_query):
+        """
+        Work out which states' documents a query refers to.
+
+        The local StateRouter finds the place names in the query. A query
+        naming several states is answered from all of them, and a query
+        naming none (or only states without documents) searches every state.
+        """
+        match = self.state_router.route(user_query)
+        if match.ambiguous:
+            # Ordinary-word aliases only add weight; they never name a state on their own
+            states = sorted({state for _, state, kind in match.matches if kind != "common"})
+        else:
+            states = [match.state] if match.state else []
+        return [state for state in states if state in self.state_list]
+
+    @staticmethod
+    def state_filter(states):
+        """
+        Return the Chroma where filter for a list of states (None for all states).
+        """
+        if not states:
+            return None
+        if len(states) == 1:
+            return {"state": states[0]}
+        return {"state": {"$in": list(states)}}
+
+    @staticmethod
+    def cache_scope(states):
+        """Returns the answer-cache key for a list of states."""
+        return ",".join(sorted(states)) or "*"
+
+    def embed_query(self, user_query):
+        """
+        Embed a query once for both the answer cache and the Chroma query.
+        """
+        return self.embedding_function([user_query])
+
+    def cached_answer(self, states, query_embeddings):
+        """
+        Return a cached answer for a similar query against the same states and collection, or None.
+        """
+        if self.answer_cache is None:
+            return None
+        answer = self.answer_cache.get(self.cache_scope(states), query_embeddings[0], self.store.fingerprint())
+        print(f"Answer cache {'hit' if answer is not None else 'miss'} "
+              f"(hit rate {self.answer_cache.hit_rate():.0%})")
+        return answer
+
+    def cache_answer(self, states, query_embeddings, answer):
+        """
+        Remember a generated answer for later similar queries.
+        """
+        if self.answer_cache is None:
+            return
+        self.answer_cache.put(self.cache_scope(states), query_embeddings[0], self.store.fingerprint(), answer)
+
+    def retrieve_context(self, user_query, states, query_embeddings=None):
+        """
+        Return the retrieved context for a query against the given states' documents, or None.
+        """
+        # Query the vector store for relevant documents
+        results = self.store.query_db(user_query, n_res=6, query_embeddings=query_embeddings,
+                                      where=self.state_filter(states))
+        documents = results.get('documents') or []
+        if not documents or not documents[0]:
+            return None
+
+        distances = results.get('distances') or [None]
+        return self.context_assembler.assemble(documents[0], distances[0])
+
+    def get_response(self, user_query):
+        """
+        Get a response from the AI model based on user input.
+        """
+        states = self.resolve_states(user_query)
+        print(f"States extracted from user query: {states or 'all'}")
+        query_embeddings = self.embed_query(user_query)
+
+        cached = self.cached_answer(states, query_embeddings)
+        if cached is not None:
+            return cached
+
+        context = self.retrieve_context(user_query, states, query_embeddings)
+        if context is None:
+            return "No relevant information found in the database."
+
+        # Get the AI model's response based on the query and context
+        answer = self.ollama_model.get_response(query=user_query, context=context)
+        self.cache_answer(states, query_embeddings, answer)
+        return answer
+
+    def stream_response(self, user_query):
+        """
+        Stream a response from the AI model token by token.
+        """
+        states = self.resolve_states(user_query)
+        print(f"States extracted from user query: {states or 'all'}")
+        query_embeddings = self.embed_query(user_query)
+
+        cached = self.cached_answer(states, query_embeddings)
+        if cached is not None:
+            yield cached
+            return
+
+        context = self.retrieve_context(user_query, states, query_embeddings)
+        if context is None:
+            yield "No relevant information found in the database."
+            return
+
+        tokens = []
+        for token in self.ollama_model.stream_response(query=user_query, context=context):
+            tokens.append(token)
+            yield token
+        self.cache_answer(states, query_embeddings, "".join(tokens))
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """
+    Return the process-wide RagEngine, creating it on first use.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = RagEngine()
+        return _engine
 
 
 def get_response(user_query):
     """
     Get a response from the AI model based on user input.
     """
-    # Initialize the vector store and Ollama model
-    state_list = ["kerala", "karnataka","telangana"]
-
-    ollama_model = OllamaChat(model_name='gemma2:2b')
-    state_name = ollama_model.get_state_name_from_user_query(user_query).lower()
-    for i in state_list:
-        if i in state_name:
-            state_name = i
-            break
-    if state_name not in state_list: state_name = "karnataka"
-    
-    print(f"State name extracted from user query: {state_name}")
-    collection_base_name = state_name + "_knowledge_base"
-
-    vector_store = VectorStore(collection_name=collection_base_name)
-    
-    # Query the vector store for relevant documents
-    ans = vector_store.query_db(user_query, n_res=10).get('documents', [])
-    
-    if not ans:
-        return "No relevant information found in the database."
-
-    context = " ".join(ans[0])
-    # print(f"Context retrieved: {context}")
-
-    # Get the AI model's response based on the query and context
-    chat_response = ollama_model.get_response(query=user_query, context=context)
-    
-    return chat_response
\ No newline at end of file
+    return get_engine().get_response(user_query)
+
+
+def stream_response(user_query):
+    """
+    Stream a response from the AI model token by token.
+    """
+    return get_engine().stream_response(user_query)
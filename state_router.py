@@ -0,0 +1,206 @@
+import re
+import unicodedata
+from collections import namedtuple
+
+# Place names per state: (alias, kind). Aliases cover common English spellings,
+# older names and Kannada/Malayalam/Telugu/Tamil script. Kinds are weighted below.
+# Names that are also ordinary English words or given names ("erode", "salem")
+# are of kind "common" and also listed as "<name> district".
+GAZETTEER = {
+    "karnataka": [
+        ("karnataka", "state"), ("karnatak", "state"), ("ಕರ್ನಾಟಕ", "state"),
+        ("bagalkot", "district"), ("bagalkote", "district"), ("ballari", "district"), ("bellary", "district"),
+        ("belagavi", "district"), ("belgaum", "district"), ("bengaluru", "district"), ("bangalore", "district"),
+        ("ಬೆಂಗಳೂರು", "district"), ("bidar", "district"), ("chamarajanagar", "district"),
+        ("chamarajanagara", "district"), ("ಚಾಮರಾಜನಗರ", "district"), ("chikkaballapur", "district"),
+        ("chikkamagaluru", "district"), ("chikmagalur", "district"), ("ಚಿಕ್ಕಮಗಳೂರು", "district"),
+        ("chitradurga", "district"), ("dakshina kannada", "district"), ("mangaluru", "district"),
+        ("mangalore", "district"), ("davanagere", "district"), ("davangere", "district"), ("ದಾವಣಗೆರೆ", "district"),
+        ("dharwad", "district"), ("gadag", "district"), ("hassan district", "district"), ("hassan", "common"),
+        ("ಹಾಸನ", "district"),
+        ("haveri", "district"), ("kalaburagi", "district"), ("gulbarga", "district"), ("kodagu", "district"),
+        ("coorg", "district"), ("ಕೊಡಗು", "district"), ("kolar", "district"), ("koppal", "district"),
+        ("mandya", "district"), ("ಮಂಡ್ಯ", "district"), ("mysuru", "district"), ("mysore", "district"),
+        ("ಮೈಸೂರು", "district"), ("raichur", "district"), ("ramanagara", "district"), ("shivamogga", "district"),
+        ("shimoga", "district"), ("ಶಿವಮೊಗ್ಗ", "district"), ("tumakuru", "district"), ("tumkur", "district"),
+        ("udupi", "district"), ("ಉಡುಪಿ", "district"), ("uttara kannada", "district"), ("karwar", "district"),
+        ("vijayapura", "district"), ("bijapur", "district"), ("yadgir", "district"), ("vijayanagara", "district"),
+        ("bandipur", "forest"), ("ಬಂಡೀಪುರ", "forest"), ("nagarhole", "forest"), ("ನಾಗರಹೊಳೆ", "forest"),
+        ("biligiri rangaswamy", "forest"), ("brt tiger reserve", "forest"), ("bhadra", "forest"),
+        ("kudremukh", "forest"), ("dandeli", "forest"), ("kali tiger reserve", "forest"),
+        ("male mahadeshwara", "forest"), ("mm hills", "forest"), ("cauvery wildlife sanctuary", "forest"),
+        ("madikeri", "forest"), ("virajpet", "forest"), ("hunsur", "forest"), ("sakleshpur", "forest"),
+    ],
+    "kerala": [
+        ("kerala", "state"), ("keralam", "state"), ("ಕೇರಳ", "state"), ("കേരളം", "state"), ("കേരള", "state"),
+        ("thiruvananthapuram", "district"), ("trivandrum", "district"), ("kollam", "district"),
+        ("quilon", "district"), ("pathanamthitta", "district"), ("alappuzha", "district"), ("alleppey", "district"),
+        ("kottayam", "district"), ("idukki", "district"), ("ernakulam", "district"), ("kochi", "district"),
+        ("cochin", "district"), ("thrissur", "district"), ("trichur", "district"), ("palakkad", "district"),
+        ("palghat", "district"), ("malappuram", "district"), ("kozhikode", "district"), ("calicut", "district"),
+        ("wayanad", "district"), ("wayanadu", "district"), ("ವಯನಾಡು", "district"), ("kannur", "district"),
+        ("cannanore", "district"), ("kasaragod", "district"), ("kasargod", "district"),
+        ("periyar", "forest"), ("thekkady", "forest"), ("silent valley", "forest"), ("parambikulam", "forest"),
+        ("munnar", "forest"), ("nilambur", "forest"), ("aralam", "forest"), ("chinnar", "forest"),
+        ("eravikulam", "forest"),
+    ],
+    "telangana": [
+        ("telangana", "state"), ("ತೆಲಂಗಾಣ", "state"), ("తెలంగాణ", "state"),
+        ("adilabad", "district"), ("bhadradri kothagudem", "district"), ("kothagudem", "district"),
+        ("hyderabad", "district"), ("jagtial", "district"), ("jangaon", "district"), ("bhupalpally", "district"),
+        ("jogulamba gadwal", "district"), ("gadwal", "district"), ("kamareddy", "district"),
+        ("karimnagar", "district"), ("khammam", "district"), ("kumuram bheem", "district"),
+        ("asifabad", "district"), ("mahabubabad", "district"), ("mahabubnagar", "district"),
+        ("mancherial", "district"), ("medak", "district"), ("medchal", "district"), ("mulugu", "district"),
+        ("nagarkurnool", "district"), ("nalgonda", "district"), ("narayanpet", "district"),
+        ("nirmal district", "district"), ("nirmal", "common"),
+        ("nizamabad", "district"), ("peddapalli", "district"), ("rajanna sircilla", "district"),
+        ("sircilla", "district"), ("rangareddy", "district"), ("ranga reddy", "district"),
+        ("sangareddy", "district"), ("siddipet", "district"), ("suryapet", "district"), ("vikarabad", "district"),
+        ("wanaparthy", "district"), ("warangal", "district"), ("hanamkonda", "district"),
+        ("yadadri", "district"), ("bhuvanagiri", "district"),
+        ("amrabad", "forest"), ("kawal", "forest"), ("eturnagaram", "forest"), ("pakhal", "forest"),
+        ("kinnerasani", "forest"), ("pranahita", "forest"),
+    ],
+    "tamilnadu": [
+        ("tamil nadu", "state"), ("tamilnadu", "state"), ("ತಮಿಳುನಾಡು", "state"), ("தமிழ்நாடு", "state"),
+        ("chennai", "district"), ("coimbatore", "district"), ("nilgiris", "district"), ("the nilgiris", "district"),
+        ("ooty", "district"), ("udhagamandalam", "district"), ("madurai", "district"), ("salem district", "district"),
+        ("salem", "common"), ("erode district", "district"), ("erode", "common"), ("dharmapuri", "district"), ("krishnagiri", "district"), ("vellore", "district"),
+        ("tirunelveli", "district"), ("theni", "district"), ("dindigul", "district"), ("tiruppur", "district"),
+        ("kanyakumari", "district"),
+        ("mudumalai", "forest"), ("anamalai", "forest"), ("sathyamangalam", "forest"), ("hosur", "forest"),
+        ("kalakad mundanthurai", "forest"),
+    ],
+}
+
+# "common" names weigh less than min_confidence and never pick a state on their own
+KIND_WEIGHTS = {"state": 1.0, "district": 0.8, "forest": 0.6, "common": 0.3}
+
+StateMatch = namedtuple("StateMatch", ["state", "confidence", "matches", "ambiguous"])
+StateMatch.__doc__ = """
+Result of StateRouter.route.
+
+state is the best-scoring state or None, confidence is its share of the
+total match weight (0.0 when nothing matched), matches lists the
+(alias, state, kind) hits, and ambiguous is True when confidence is below
+min_confidence, so the query should be answered from every matched state.
+"""
+
+
+def _normalize(text):
+    """Casefolds, NFC-normalizes and collapses punctuation to single spaces."""
+    text = unicodedata.normalize("NFC", text).casefold()
+    return re.sub(r"[\s\-_.,;:!?'\"()/]+", " ", text)
+
+
+def _is_word_char(ch):
+    # Indic vowel signs and viramas are combining marks, not letters
+    return ch.isalnum() or unicodedata.category(ch).startswith("M")
+
+
+class StateRouter:
+    """
+    A deterministic state router built on an Aho-Corasick automaton over
+    state, district and forest-division names.
+
+    The automaton is compiled once, and a query is scanned in a single pass.
+    Latin-script aliases must match whole words. Indic-script aliases only
+    need a word start, because case suffixes attach directly to the name
+    (e.g. ಕರ್ನಾಟಕದಲ್ಲಿ).
+    """
+    def __init__(self, gazetteer=None, min_confidence=0.6):
+        """
+        Compile the automaton for a {state: [(alias, kind), ...]} gazetteer.
+        """
+        self.min_confidence = min_confidence
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for state, aliases in (gazetteer or GAZETTEER).items():
+            for alias, kind in aliases:
+                self._add(_normalize(alias).strip(), state, kind)
+        self._build_failure_links()
+
+    def _add(self, alias, state, kind):
+        node = 0
+        for ch in alias:
+            if ch not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][ch] = len(self._goto) - 1
+            node = self._goto[node][ch]
+        self._output[node].append((alias, state, kind))
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, query):
+        """
+        Return the (alias, state, kind) matches in a query, longest first where they overlap.
+        """
+        text = _normalize(query)
+        hits = []
+        node = 0
+        for end, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for alias, state, kind in self._output[node]:
+                start = end - len(alias) + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if alias.isascii() and end + 1 < len(text) and _is_word_char(text[end + 1]):
+                    continue
+                hits.append((start, end + 1, alias, state, kind))
+
+        # Drop hits contained in a longer one (e.g. "bengaluru" inside "bengaluru rural")
+        hits.sort(key=lambda hit: (hit[0], -(hit[1] - hit[0])))
+        matches, covered_to = [], -1
+        for start, end, alias, state, kind in hits:
+            if end <= covered_to:
+                continue
+            matches.append((alias, state, kind))
+            covered_to = max(covered_to, end)
+        return matches
+
+    def route(self, query):
+        """
+        Route a query to a state with a confidence score.
+
+        Only states named by more than a "common" alias can be chosen; such
+        aliases just add weight to a state the query names otherwise.
+        """
+        matches = self.find(query)
+        candidates = {state for _, state, kind in matches if kind != "common"}
+        if not candidates:
+            return StateMatch(None, 0.0, matches, False)
+
+        scores = {}
+        for _, state, kind in matches:
+            scores[state] = scores.get(state, 0.0) + KIND_WEIGHTS[kind]
+        state = max(candidates, key=scores.get)
+        confidence = scores[state] / sum(scores.values())
+        return StateMatch(state, confidence, matches, confidence < self.min_confidence)
+
+
+_router = None
+
+
+def get_state_router():
+    """
+    Return the process-wide StateRouter, compiling it on first use.
+    """
+    global _router
+    if _router is None:
+        _router = StateRouter()
+    return _router
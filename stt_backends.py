@@ -0,0 +1,99 @@
+import importlib.util
+import os
+import threading
+
+import numpy as np
+import speech_recognition as sr
+
+
+class GoogleSTTBackend:
+    """
+    Speech recognition through the free Google Web Speech API.
+
+    Needs network access for every utterance. Raises sr.RequestError when
+    the service cannot be reached and sr.UnknownValueError when nothing was
+    understood.
+    """
+    name = "google"
+
+    def __init__(self):
+        self.recognizer = sr.Recognizer()
+
+    def transcribe(self, audio, language):
+        """Transcribes an sr.AudioData in the given language (e.g. 'kn-IN')."""
+        return self.recognizer.recognize_google(audio, language=language)
+
+
+class WhisperBackend:
+    """
+    Offline, CPU-only speech recognition with faster-whisper.
+
+    The multilingual Whisper models cover both English and Kannada. The
+    model is loaded on the first call and kept; use get_stt_backend() so
+    every SpeechToText in the process shares one copy. int8 weights keep
+    the small model at a few hundred MB of memory. Calls are serialized,
+    since one transcription already uses every cpu_threads core.
+    """
+    name = "whisper"
+    sample_rate = 16000
+
+    def __init__(self, model_size="small", cpu_threads=None, compute_type="int8", beam_size=1):
+        """
+        Initialize the backend; the model itself is loaded lazily.
+        """
+        self.model_size = model_size
+        self.cpu_threads = cpu_threads or os.cpu_count() or 4
+        self.compute_type = compute_type
+        self.beam_size = beam_size
+        self._model = None
+        self._lock = threading.Lock()
+
+    def model(self):
+        """Returns the WhisperModel, loading it on first use."""
+        if self._model is None:
+            from faster_whisper import WhisperModel
+            print(f"Loading Whisper model '{self.model_size}' ({self.compute_type}, {self.cpu_threads} threads)...")
+            self._model = WhisperModel(self.model_size, device="cpu", compute_type=self.compute_type,
+                                       cpu_threads=self.cpu_threads)
+        return self._model
+
+    def transcribe(self, audio, language):
+        """Transcribes an sr.AudioData; raises sr.UnknownValueError when no speech is found."""
+        raw = audio.get_raw_data(convert_rate=self.sample_rate, convert_width=2)
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        with self._lock:
+            segments, _ = self.model().transcribe(samples, language=language.split("-")[0].lower(),
+                                                  beam_size=self.beam_size)
+            text = " ".join(segment.text.strip() for segment in segments).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+BACKENDS = {"google": GoogleSTTBackend, "whisper": WhisperBackend}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def default_backend_name():
+    """
+    The STT_BACKEND environment variable if set, else the local Whisper
+    backend when faster-whisper is installed (it is an optional
+    requirement, so installing it opts in), else Google.
+    """
+    name = os.environ.get("STT_BACKEND")
+    if name:
+        return name
+    return "whisper" if importlib.util.find_spec("faster_whisper") else "google"
+
+
+def get_stt_backend(name=None):
+    """Returns the process-wide instance of a speech recognition backend, creating it on first use."""
+    name = name or default_backend_name()
+    with _backends_lock:
+        if name not in _backends:
+            if name not in BACKENDS:
+                raise ValueError(f"Unknown STT backend '{name}'; choose from {', '.join(BACKENDS)}")
+            _backends[name] = BACKENDS[name]()
+        return _backends[name]
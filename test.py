@@ -1,5 +1,5 @@
-from deep_translator import GoogleTranslator
+from translation_service import get_translation_service
 
 kannada_text = "ನಾನು ಕನ್ನಡದಿಂದ ಇಂಗ್ಲಿಷ್‌ಗೆ ಅನುವಾದ ಮಾಡುತ್ತಿದ್ದೇನೆ"
-translated_text = GoogleTranslator(source='kn', target='en').translate(kannada_text)
+translated_text = get_translation_service().translate(kannada_text, 'kn', 'en')
 print(translated_text) 
\ No newline at end of file
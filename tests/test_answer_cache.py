@@ -0,0 +1,79 @@
+import pytest
+
+from answer_cache import SemanticAnswerCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("answer_cache.time.time", clock)
+    return clock
+
+
+def test_similar_query_hits_and_dissimilar_misses(clock):
+    cache = SemanticAnswerCache(threshold=0.9)
+    cache.put("kerala", [1.0, 0.0], "rev-1", "answer")
+
+    assert cache.get("kerala", [10.0, 1.0], "rev-1") == "answer"  # cosine 0.995
+    assert cache.get("kerala", [1.0, 1.0], "rev-1") is None  # cosine 0.707
+    assert cache.get("karnataka", [1.0, 0.0], "rev-1") is None  # Other states have their own answers
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 2
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = SemanticAnswerCache(ttl=60)
+    cache.put("kerala", [1.0, 0.0], "rev-1", "answer")
+
+    clock.now += 59
+    assert cache.get("kerala", [1.0, 0.0], "rev-1") == "answer"
+    clock.now += 1
+    assert cache.get("kerala", [1.0, 0.0], "rev-1") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = SemanticAnswerCache(max_entries=2)
+    cache.put("kerala", [1.0, 0.0], "rev-1", "first")
+    clock.now += 1
+    cache.put("karnataka", [0.0, 1.0], "rev-1", "second")
+    clock.now += 1
+    assert cache.get("kerala", [1.0, 0.0], "rev-1") == "first"  # Now more recent than "second"
+    clock.now += 1
+
+    cache.put("kerala", [0.0, 1.0], "rev-1", "third")
+
+    assert cache.stats["evictions"] == 1
+    assert cache.get("karnataka", [0.0, 1.0], "rev-1") is None
+    assert cache.get("kerala", [1.0, 0.0], "rev-1") == "first"
+    assert cache.get("kerala", [0.0, 1.0], "rev-1") == "third"
+
+
+def test_changed_fingerprint_invalidates_the_state(clock):
+    cache = SemanticAnswerCache()
+    cache.put("kerala", [1.0, 0.0], (10, "rev-1"), "old answer")
+    cache.put("karnataka", [1.0, 0.0], (10, "rev-1"), "other state")
+
+    assert cache.get("kerala", [1.0, 0.0], (10, "rev-2")) is None
+    assert cache.stats["invalidations"] == 1
+    assert cache.get("kerala", [1.0, 0.0], (10, "rev-1")) is None  # Dropped, not kept aside
+    assert cache.get("karnataka", [1.0, 0.0], (10, "rev-1")) == "other state"
+
+
+def test_invalidate_drops_one_or_all_states(clock):
+    cache = SemanticAnswerCache()
+    cache.put("kerala", [1.0, 0.0], "rev-1", "kerala answer")
+    cache.put("karnataka", [1.0, 0.0], "rev-1", "karnataka answer")
+
+    cache.invalidate("kerala")
+    assert cache.get("kerala", [1.0, 0.0], "rev-1") is None
+    assert cache.get("karnataka", [1.0, 0.0], "rev-1") == "karnataka answer"
+
+    cache.invalidate()
+    assert cache.get("karnataka", [1.0, 0.0], "rev-1") is None
@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+from async_rag import AsyncRagEngine, ModelScheduler
+
+
+class SlowEngine:
+    """Blocking router and embedder, each taking `delay` seconds."""
+    def __init__(self, delay):
+        self.delay = delay
+
+    def resolve_states(self, user_query):
+        time.sleep(self.delay)
+        return ["kerala"]
+
+    def embed_query(self, user_query):
+        time.sleep(self.delay)
+        return [[0.0, 1.0]]
+
+
+async def contend(scheduler):
+    """Two requests for one slot, so the second has to wait on the semaphore."""
+    async def hold():
+        async with scheduler.slot():
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(hold(), hold())
+
+
+def test_scheduler_works_across_event_loops():
+    scheduler = ModelScheduler(max_concurrent=1)
+    asyncio.run(contend(scheduler))
+    asyncio.run(contend(scheduler))  # A semaphore made for the first loop would fail here
+    assert scheduler.stats["completed"] == 4
+    assert scheduler.stats["total_wait"] > 0.015  # Each run's second request waited for the first
+
+
+def test_route_and_embed_run_concurrently_off_the_loop():
+    engine = AsyncRagEngine(engine=SlowEngine(0.2))
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    async def main():
+        start = time.perf_counter()
+        result, _ = await asyncio.gather(engine.route_and_embed("elephant in Wayanad"), ticker())
+        return result, time.perf_counter() - start
+
+    (states, embeddings), elapsed = asyncio.run(main())
+
+    assert states == ["kerala"] and embeddings == [[0.0, 1.0]]
+    assert elapsed < 0.35  # 0.4 s if run one after the other
+    assert ticks[-1] - ticks[0] < 0.15  # The loop kept running meanwhile
+
+
+def test_async_client_is_created_per_event_loop():
+    engine = AsyncRagEngine(engine=SlowEngine(0))
+
+    async def clients():
+        return engine.client, engine.client
+
+    first, same = asyncio.run(clients())
+    second, _ = asyncio.run(clients())
+    assert first is same
+    assert second is not first
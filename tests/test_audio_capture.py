@@ -0,0 +1,104 @@
+import numpy as np
+
+from audio_capture import EnergyVAD, RingBuffer, StreamingResampler, to_int16
+
+RATE = 16000
+
+
+def tone(seconds, rate=RATE, frequency=440, level=0.3):
+    t = np.arange(int(seconds * rate)) / rate
+    return (level * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def silence(seconds, rate=RATE):
+    return np.zeros(int(seconds * rate), dtype=np.float32)
+
+
+def feed(vad, samples, block=1000):
+    segments = []
+    for start in range(0, len(samples), block):
+        segments += vad.process(samples[start:start + block])
+    return segments
+
+
+def test_ring_buffer_wraps_around():
+    buffer = RingBuffer(5)
+    buffer.write(np.array([0, 1, 2], dtype=np.float32))
+    assert buffer.read().tolist() == [0, 1, 2]
+
+    buffer.write(np.array([3, 4, 5, 6], dtype=np.float32))  # Wraps past the end of the array
+    assert buffer.read().tolist() == [3, 4, 5, 6]
+    assert buffer.read().tolist() == []
+    assert buffer.dropped == 0
+
+
+def test_ring_buffer_overrun_keeps_newest_samples_and_counts_drops():
+    buffer = RingBuffer(5)
+    buffer.write(np.arange(4, dtype=np.float32))
+    buffer.write(np.arange(4, 8, dtype=np.float32))
+
+    assert buffer.read().tolist() == [3, 4, 5, 6, 7]
+    assert buffer.dropped == 3
+
+    buffer.write(np.arange(12, dtype=np.float32))  # Longer than the buffer on its own
+    assert buffer.read().tolist() == [7, 8, 9, 10, 11]
+
+
+def test_resampler_output_length():
+    resampler = StreamingResampler(44100)
+    samples = tone(1, rate=44100)
+    total = sum(len(resampler.process(samples[i:i + 441])) for i in range(0, len(samples), 441))
+    assert total == RATE
+
+
+def test_resampler_blocks_join_without_seams():
+    samples = tone(1, rate=48000, frequency=300)
+    bounds = [0, 1000, 1357, 20000, 47999, 48000]
+
+    resampler = StreamingResampler(48000)
+    blocks = np.concatenate([resampler.process(samples[a:b]) for a, b in zip(bounds, bounds[1:])])
+    whole = StreamingResampler(48000).process(samples)
+
+    assert len(blocks) == len(whole) == RATE
+    assert np.allclose(blocks, whole, atol=1e-6)
+
+
+def test_resampler_passes_16k_through():
+    samples = tone(0.1)
+    assert StreamingResampler(RATE).process(samples) is samples
+
+
+def test_vad_segment_starts_with_preroll_and_ends_after_hangover():
+    vad = EnergyVAD(frame_ms=30, preroll_seconds=0.3, hangover_seconds=0.6)
+    frame = vad.frame
+
+    segments = feed(vad, np.concatenate([silence(1), tone(1), silence(1)]))
+
+    assert len(segments) == 1
+    speech = np.flatnonzero(segments[0])
+    # The speech frame is preceded by 0.3 s of preroll; the tone starts inside that frame
+    assert 0.3 * RATE <= speech[0] < 0.3 * RATE + frame
+    # The segment closes once more than 0.6 s of silence follows the last speech frame
+    trailing = len(segments[0]) - speech[-1] - 1
+    assert 0.6 * RATE < trailing <= 0.6 * RATE + 2 * frame
+    assert vad.flush() is None
+
+
+def test_vad_ignores_clicks_and_flushes_open_speech():
+    vad = EnergyVAD()
+    assert feed(vad, np.concatenate([silence(0.5), tone(0.06), silence(1)])) == []  # Shorter than min_speech
+
+    assert feed(vad, np.concatenate([silence(0.5), tone(1)])) == []
+    segment = vad.flush()
+    assert segment is not None and len(segment) >= RATE
+
+
+def test_vad_splits_speech_longer_than_max_segment():
+    vad = EnergyVAD(max_segment_seconds=1)
+    segments = feed(vad, np.concatenate([tone(2.5), silence(1)]))
+    assert len(segments) == 3
+    assert all(len(segment) <= RATE for segment in segments)
+
+
+def test_to_int16_clips():
+    assert to_int16(np.array([-2.0, 0.0, 0.5, 2.0], dtype=np.float32)).tolist() == [-32767, 0, 16383, 32767]
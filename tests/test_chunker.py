@@ -0,0 +1,66 @@
+import pytest
+
+from chunker import TextChunker, count_tokens
+
+
+def sentence(i):
+    return f"Sentence {i} has words."  # 5 tokens
+
+
+def test_count_tokens_counts_words_and_punctuation():
+    assert count_tokens("GO 114, dated 2022.") == 6
+
+
+def test_chunks_fill_to_target_and_overlap_by_whole_sentences():
+    chunker = TextChunker(target_tokens=20, overlap_tokens=5, min_tokens=3)
+    sentences = [sentence(i) for i in range(10)]
+
+    chunks = chunker.chunk(" ".join(sentences))
+
+    assert chunks == [
+        " ".join(sentences[0:4]),
+        " ".join(sentences[3:7]),  # Repeats the last sentence of the previous chunk
+        " ".join(sentences[6:10]),
+    ]
+    assert all(count_tokens(chunk) <= 20 for chunk in chunks)
+
+
+def test_overlap_never_splits_a_sentence():
+    chunker = TextChunker(target_tokens=20, overlap_tokens=4, min_tokens=3)
+    sentences = [sentence(i) for i in range(6)]
+
+    chunks = chunker.chunk(" ".join(sentences))
+
+    # A 5-token sentence does not fit in a 4-token overlap, so nothing is repeated
+    assert chunks == [" ".join(sentences[0:4]), " ".join(sentences[4:6])]
+
+
+def test_long_sentence_is_split_on_words():
+    chunker = TextChunker(target_tokens=10, overlap_tokens=2, min_tokens=1)
+    words = [f"w{i}" for i in range(25)]
+
+    chunks = chunker.chunk(" ".join(words))
+
+    assert [count_tokens(chunk) for chunk in chunks] == [10, 10, 5]
+    assert " ".join(chunks).split() == words
+
+
+def test_small_tail_is_merged_into_the_previous_chunk():
+    chunker = TextChunker(target_tokens=20, overlap_tokens=5, min_tokens=10)
+    sentences = [sentence(i) for i in range(4)] + ["Yes."]
+
+    chunks = chunker.chunk(" ".join(sentences))
+
+    assert chunks == [" ".join(sentences)]
+
+
+def test_paragraphs_wrapped_lines_and_dandas():
+    chunker = TextChunker(target_tokens=3, overlap_tokens=1, min_tokens=1)
+    assert chunker.sentences("One two।  Three\nfour।\n\nFive.") == \
+        [("One two।", 3), ("Three four।", 3), ("Five.", 2)]
+
+
+def test_empty_text_and_invalid_settings():
+    assert TextChunker().chunk("  \n ") == []
+    with pytest.raises(ValueError):
+        TextChunker(target_tokens=10, overlap_tokens=10)
@@ -0,0 +1,51 @@
+from chunker import count_tokens
+from context_builder import ContextAssembler
+
+ORDER = "GO 114 sets compensation for crop loss caused by wild elephants at 10000 rupees per acre."
+CATTLE = "Cattle killed by a tiger are compensated at the market rate after a veterinary report."
+SNAKE = "Death from snake bite is compensated after the post mortem report reaches the range office."
+
+
+def test_chunks_are_added_until_the_token_budget():
+    budget = count_tokens(ORDER) + count_tokens(CATTLE)
+    assembler = ContextAssembler(max_tokens=budget)
+
+    context = assembler.assemble([ORDER, CATTLE, SNAKE], [0.1, 0.12, 0.13])
+
+    assert context == f"{ORDER}\n\n{CATTLE}"
+    assert assembler.last_stats["tokens"] == budget and assembler.last_stats["over_budget"] == 1
+
+
+def test_best_chunk_over_budget_is_truncated():
+    assembler = ContextAssembler(max_tokens=5)
+    assert assembler.assemble([ORDER], [0.1]) == "GO 114 sets compensation for"
+
+
+def test_near_duplicates_are_skipped():
+    repeated_header = "Forest department. " + ORDER  # 14 of its 16 word shingles are shared
+    assembler = ContextAssembler()
+
+    context = assembler.assemble([ORDER, repeated_header, CATTLE], [0.1, 0.11, 0.12])
+
+    assert context == f"{ORDER}\n\n{CATTLE}"
+    assert assembler.last_stats["duplicates"] == 1
+
+
+def test_chunks_beyond_the_relative_margin_are_trimmed():
+    assembler = ContextAssembler(relative_margin=0.15)
+
+    context = assembler.assemble([ORDER, CATTLE, SNAKE], [0.30, 0.44, 0.46])
+
+    # 0.44 is within 0.30 + 0.15; 0.46 is not
+    assert context == f"{ORDER}\n\n{CATTLE}"
+    assert assembler.last_stats["trimmed"] == 1
+
+
+def test_keyword_matches_are_never_trimmed():
+    assembler = ContextAssembler(relative_margin=0.15, max_distance=0.5)
+    context = assembler.assemble([ORDER, SNAKE, CATTLE], [0.1, None, 0.9])
+    assert context == f"{ORDER}\n\n{SNAKE}"
+
+
+def test_nothing_to_assemble():
+    assert ContextAssembler().assemble(["", "  "], [0.1, 0.2]) is None
@@ -0,0 +1,90 @@
+import pytest
+
+from benchmarks.faq_crawl import fixture_server
+from faq_crawler import CrawlState, FAQCrawler
+from tests.test_vector_store import open_store
+
+
+def faq_page(faqs):
+    items = "".join(f"<li><strong>{question}</strong><p class='para'>{answer}</p></li>" for question, answer in faqs)
+    return f"<html><body><section class='faq-wrap'><ul>{items}</ul></section></body></html>"
+
+
+FAQS = [("How do I claim crop loss compensation?", "Apply at the range forest office."),
+        ("Who pays for cattle killed by a tiger?", "The forest department.")]
+
+
+@pytest.fixture
+def site():
+    """A local FAQ page, editable through the returned dict, and its crawl targets."""
+    pages = {"/faq": faq_page(FAQS)}
+    server, base_url = fixture_server(pages, latency=0)
+    yield pages, [{"url": f"{base_url}/faq", "state": "karnataka"}]
+    server.shutdown()
+
+
+def stored(store, url):
+    result = store.collection.get(where={"source": url}, include=["documents"])
+    return dict(zip(result["ids"], result["documents"]))
+
+
+def test_new_page_is_stored(site, tmp_path):
+    pages, targets = site
+    store = open_store(tmp_path / "chroma_db")
+
+    stats = FAQCrawler(store).crawl(targets)
+
+    assert stats["fetched"] == 1 and stats["embedded"] == 2
+    assert sorted(stored(store, targets[0]["url"]).values()) == sorted(f"Q: {q}\nA: {a}" for q, a in FAQS)
+
+
+def test_unchanged_page_is_not_downloaded_or_embedded(site, tmp_path):
+    pages, targets = site
+    store, state = open_store(tmp_path / "chroma_db"), CrawlState(None)
+    FAQCrawler(store, state).crawl(targets)
+
+    stats = FAQCrawler(store, state).crawl(targets)
+
+    assert stats["not_modified"] == 1 and stats["fetched"] == 0
+    assert stats["embedded"] == 0 and stats["deleted"] == 0
+
+
+def test_edited_answer_replaces_the_pair_in_place(site, tmp_path):
+    pages, targets = site
+    store, state = open_store(tmp_path / "chroma_db"), CrawlState(None)
+    FAQCrawler(store, state).crawl(targets)
+    before = stored(store, targets[0]["url"])
+
+    pages["/faq"] = faq_page([(FAQS[0][0], "Apply online within 14 days."), FAQS[1]])
+    stats = FAQCrawler(store, state).crawl(targets)
+
+    after = stored(store, targets[0]["url"])
+    assert stats["embedded"] == 1 and stats["deleted"] == 0
+    assert set(after) == set(before)
+    assert f"Q: {FAQS[0][0]}\nA: Apply online within 14 days." in after.values()
+
+
+def test_removed_question_is_deleted(site, tmp_path):
+    pages, targets = site
+    store, state = open_store(tmp_path / "chroma_db"), CrawlState(None)
+    FAQCrawler(store, state).crawl(targets)
+
+    pages["/faq"] = faq_page(FAQS[:1])
+    stats = FAQCrawler(store, state).crawl(targets)
+
+    assert stats["deleted"] == 1
+    assert list(stored(store, targets[0]["url"]).values()) == [f"Q: {FAQS[0][0]}\nA: {FAQS[0][1]}"]
+
+
+def test_page_whose_items_no_longer_parse_keeps_its_pairs(site, tmp_path):
+    pages, targets = site
+    store, state = open_store(tmp_path / "chroma_db"), CrawlState(None)
+    FAQCrawler(store, state).crawl(targets)
+    validators = state.pages[targets[0]["url"]]
+
+    pages["/faq"] = "<html><body><section class='faq-wrap'><ul><li>Moved</li></ul></section></body></html>"
+    stats = FAQCrawler(store, state).crawl(targets)
+
+    assert stats["deleted"] == 0
+    assert len(stored(store, targets[0]["url"])) == 2
+    assert state.pages[targets[0]["url"]] == validators  # So the next crawl downloads the page again
@@ -0,0 +1,102 @@
+import os
+
+from ingest import CorpusIngestor, IngestCheckpoint
+from ocr_cache import OCRCache
+from pdf_chunk import PageResult, PageTask, PDFTranslator
+from tests.test_vector_store import open_store
+
+
+class FakeTranslator:
+    """Serves fixed pages without OCR; pages in `broken` fail."""
+    def __init__(self, num_pages=3, broken=()):
+        self.num_pages = num_pages
+        self.broken = set(broken)
+        self.chunker = PDFTranslator().chunker
+
+    def extraction_settings(self):
+        return {}
+
+    def page_count(self, pdf_path):
+        return self.num_pages
+
+    def iter_pages(self, tasks, workers=1, output_folder="output_images"):
+        for task in tasks:
+            if (task.pdf_path, task.page_no) in self.broken:
+                yield PageResult(task, None, None, RuntimeError("unreadable page"))
+            else:
+                yield PageResult(task, [f"Page {task.page_no} of {task.pdf_path}."], "text_layer", None)
+
+
+def write_pdf(path, content):
+    path.write_bytes(content)
+    return str(path)
+
+
+def document(path):
+    return {"path": path, "state": "karnataka", "lang": "eng", "translate": False, "src_lang": "en",
+            "dest_lang": "en", "language": "en"}
+
+
+def test_failed_page_is_recorded_and_retried(tmp_path):
+    pdf = write_pdf(tmp_path / "order.pdf", b"order")
+    store = open_store(tmp_path / "chroma_db")
+    checkpoint = IngestCheckpoint(str(tmp_path / "checkpoint.json"))
+
+    stats = CorpusIngestor(FakeTranslator(broken={(pdf, 2)}), store, checkpoint).run([document(pdf)])
+
+    assert stats["pages"] == 2 and stats["failed_pages"] == 1
+    record = IngestCheckpoint(checkpoint.path).documents[pdf]
+    assert sorted(record["pages"]) == ["1", "3"] and list(record["failed"]) == ["2"]
+    assert not record["done"]
+
+    checkpoint = IngestCheckpoint(checkpoint.path)
+    stats = CorpusIngestor(FakeTranslator(), store, checkpoint).run([document(pdf)])
+
+    assert stats["pages"] == 1 and stats["failed_pages"] == 0
+    record = checkpoint.documents[pdf]
+    assert record["done"] and not record["failed"]
+
+
+def test_identical_documents_are_ingested_once(tmp_path, capsys):
+    first = write_pdf(tmp_path / "order.pdf", b"order")
+    copy = write_pdf(tmp_path / "order-copy.pdf", b"order")
+    store = open_store(tmp_path / "chroma_db")
+    checkpoint = IngestCheckpoint(str(tmp_path / "checkpoint.json"))
+
+    stats = CorpusIngestor(FakeTranslator(), store, checkpoint).run([document(first), document(copy)])
+
+    assert stats["pages"] == 3
+    assert f"{copy}: identical to {first}, skipped" in capsys.readouterr().out
+    assert not store.collection.get(where={"source": copy})["ids"]
+    assert copy not in checkpoint.documents
+
+
+def test_iter_pages_yields_failures_and_continues(monkeypatch):
+    translator = PDFTranslator()
+
+    def extract_page(pdf_path, page_no, *args):
+        if page_no == 2:
+            raise RuntimeError("unreadable page")
+        return page_no, [f"page {page_no}"], "ocr"
+
+    monkeypatch.setattr(translator, "extract_page", extract_page)
+    results = list(translator.iter_pages(PageTask("order.pdf", page_no, "eng") for page_no in (1, 2, 3)))
+
+    assert [result.task.page_no for result in results] == [1, 2, 3]
+    assert [result.path for result in results] == ["ocr", None, "ocr"]
+    assert isinstance(results[1].error, RuntimeError)
+    assert translator.page_paths["ocr"] == 2
+
+
+def test_pool_worker_cache_lookups_reach_the_parent_stats(tmp_path):
+    cache = OCRCache(str(tmp_path / "ocr_cache"))
+    translator = PDFTranslator(cache=cache)
+    pdf = os.path.join(os.path.dirname(__file__), "..", "source", "telangana.pdf")  # Page 1 has a usable text layer, so no OCR is needed
+    key = translator.page_cache_key(OCRCache.file_hash(pdf), 1, "eng")
+    cache.put_translation(key, "te", "en", "Compensation is paid within 30 days.")
+
+    results = list(translator.iter_pages([PageTask(pdf, 1, "eng", True, "te", "en")], workers=2))
+
+    assert results[0].error is None and results[0].path == "text_layer"
+    assert cache.stats["ocr_misses"] == 1  # Looked up in this process
+    assert cache.stats["translation_hits"] == 1  # Looked up in the worker
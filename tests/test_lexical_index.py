@@ -0,0 +1,74 @@
+import numpy as np
+
+from lexical_index import BM25Index, tokenize
+
+DOCUMENTS = {
+    "go": "GO 114 FWL 2022 revises the compensation for crop loss.",
+    "crop": "Crop loss compensation is paid per acre of crop damaged.",
+    "cattle": "Cattle killed by a tiger are compensated at market rates.",
+    "kannada": "ಕರ್ನಾಟಕದಲ್ಲಿ ಆನೆ ದಾಳಿಗೆ ಪರಿಹಾರ",
+}
+
+
+def build(revision=None):
+    return BM25Index.build(list(DOCUMENTS), list(DOCUMENTS.values()), revision=revision)
+
+
+def test_tokenize_keeps_indic_words_whole():
+    assert tokenize("ಕರ್ನಾಟಕದಲ್ಲಿ ಆನೆ") == ["ಕರ್ನಾಟಕದಲ್ಲಿ", "ಆನೆ"]
+    assert tokenize("யானை தாக்குதல்") == ["யானை", "தாக்குதல்"]
+    assert tokenize("GO 114 FWL 2022") == ["go", "114", "fwl", "2022"]
+
+
+def test_search_ranks_by_bm25():
+    index = build()
+    assert [chunk_id for chunk_id, _ in index.search("114")] == ["go"]
+    # "crop" occurs twice in the crop document and once in the GO document
+    assert [chunk_id for chunk_id, _ in index.search("crop")] == ["crop", "go"]
+    assert [chunk_id for chunk_id, _ in index.search("ಆನೆ ದಾಳಿಗೆ")] == ["kannada"]
+    assert index.search("leopard") == []
+
+
+def test_search_returns_at_most_n_best():
+    hits = build().search("compensation crop loss", n=2)
+    assert [chunk_id for chunk_id, _ in hits] == ["crop", "go"]
+    assert hits[0][1] >= hits[1][1]
+
+
+def test_mask_restricts_results():
+    index = build()
+    assert [chunk_id for chunk_id, _ in index.search("crop", mask=index.mask(["go", "unknown"]))] == ["go"]
+    assert index.search("crop", mask=index.mask([])) == []
+
+
+def test_save_and_load_keep_arrays_and_revision(tmp_path):
+    index = build(revision="rev-1")
+    path = str(tmp_path / "kb.npz")
+    index.save(path)
+
+    loaded = BM25Index.load(path)
+
+    assert loaded.revision == "rev-1"
+    assert loaded.search("crop") == index.search("crop")
+    assert np.array_equal(loaded.postings_docs, index.postings_docs)
+
+
+def test_index_saved_by_another_tokenizer_loads_as_unknown(tmp_path, monkeypatch):
+    path = str(tmp_path / "kb.npz")
+    monkeypatch.setattr("lexical_index.TOKENIZER_VERSION", "1")
+    build(revision="rev-1").save(path)
+    monkeypatch.undo()
+    assert BM25Index.load(path).revision is None
+
+
+def test_index_saved_without_revision_loads_as_unknown(tmp_path):
+    path = str(tmp_path / "kb.npz")
+    build().save(path)
+    assert BM25Index.load(path).revision is None
+
+    index = build()
+    with open(path, "wb") as f:
+        # The layout written before revisions were recorded
+        np.savez(f, ids=index.ids, doc_lengths=index.doc_lengths, terms=index.terms, offsets=index.offsets,
+                 postings_docs=index.postings_docs, postings_tf=index.postings_tf)
+    assert BM25Index.load(path).revision is None
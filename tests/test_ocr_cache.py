@@ -0,0 +1,41 @@
+from ocr_cache import OCRCache
+
+
+def cache_size(cache):
+    return sum(size for _, size, _ in cache._entries())
+
+
+def test_rewriting_a_key_does_not_grow_the_size(tmp_path, monkeypatch):
+    cache = OCRCache(str(tmp_path / "ocr_cache"), max_bytes=250)
+    cache.put_ocr("a" * 64, "x" * 100)
+    cache.put_ocr("b" * 64, "y" * 100)
+    evictions = []
+    monkeypatch.setattr(cache, "_evict", lambda: evictions.append(1))
+
+    for _ in range(5):
+        cache.put_ocr("b" * 64, "z" * 100)
+
+    assert cache._size == cache_size(cache) == 200
+    assert not evictions  # Each eviction pass walks the whole cache directory
+
+
+def test_least_recently_used_entries_are_evicted_over_max_bytes(tmp_path):
+    cache = OCRCache(str(tmp_path / "ocr_cache"), max_bytes=250)
+    cache.put_ocr("a" * 64, "x" * 100)
+    cache.put_ocr("b" * 64, "y" * 100)
+    cache.put_ocr("c" * 64, "z" * 100)
+
+    assert cache_size(cache) <= 250
+    assert cache.get_ocr("a" * 64) is None
+    assert cache.get_ocr("c" * 64) == "z" * 100
+
+
+def test_hit_and_miss_counts(tmp_path):
+    cache = OCRCache(str(tmp_path / "ocr_cache"))
+    cache.put_translation("a" * 64, "kn", "en", "text")
+    cache.get_translation("a" * 64, "kn", "en")
+    cache.get_ocr("a" * 64)
+    cache.add_stats({"ocr_hits": 2})
+
+    assert cache.stats == {"ocr_hits": 2, "ocr_misses": 1, "translation_hits": 1, "translation_misses": 0}
+    assert cache.hit_rate() == 0.75
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from SpeechToText import RecognizerPool
+
+
+class SlowRecognizer:
+    """Stands in for sr.Recognizer; calibration takes `delay` seconds and can be made to fail."""
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.fail = False
+        self.calibrations = 0
+        self.energy_threshold = 300
+
+    def adjust_for_ambient_noise(self, source, duration=1):
+        time.sleep(self.delay)
+        if self.fail:
+            raise OSError("device unavailable")
+        self.calibrations += 1
+
+
+def pool_with(*devices):
+    pool = RecognizerPool()
+    for device in devices:
+        pool._recognizers[device] = SlowRecognizer()
+    return pool
+
+
+def run_together(*calls):
+    threads = [threading.Thread(target=call) for call in calls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_same_device_is_calibrated_once():
+    pool = pool_with(1)
+    run_together(lambda: pool.calibrate(None, 1), lambda: pool.calibrate(None, 1))
+    assert pool.recognizer(1).calibrations == 1
+
+
+def test_other_devices_are_not_blocked_by_a_calibration():
+    pool = pool_with(1, 2)
+    start = time.perf_counter()
+    worker = threading.Thread(target=pool.calibrate, args=(None, 1))
+    worker.start()
+    time.sleep(0.05)
+
+    assert pool.recognizer(2) is not None
+    lookup = time.perf_counter() - start
+    pool.calibrate(None, 2)
+    worker.join()
+
+    assert lookup < 0.15
+    assert time.perf_counter() - start < 0.35  # 0.4 s if the two calibrations ran one after the other
+
+
+def test_failed_calibration_is_retried():
+    pool = pool_with(1)
+    pool.recognizer(1).fail = True
+    with pytest.raises(OSError):
+        pool.calibrate(None, 1)
+
+    pool.recognizer(1).fail = False
+    pool.calibrate(None, 1)
+    assert pool.recognizer(1).calibrations == 1
@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import pytest
+
+from rag_llama_chroma import RagEngine
+from state_router import StateRouter
+
+
+@pytest.fixture(scope="module")
+def router():
+    return StateRouter()
+
+
+@pytest.mark.parametrize("query", [
+    "Heavy rains erode my farm soil",
+    "Can Salem help",
+    "Hassan's cow was taken by a leopard",
+    "Nirmal lost his goats to wild dogs",
+])
+def test_common_words_do_not_route(router, query):
+    match = router.route(query)
+    assert match.state is None
+    assert match.confidence == 0.0
+
+
+@pytest.mark.parametrize("query, state", [
+    ("Elephants raided fields in Erode district", "tamilnadu"),
+    ("Leopard attack in Salem near Mudumalai", "tamilnadu"),
+    ("Elephant crop raids in Hassan district", "karnataka"),
+    ("Sloth bear seen in Nirmal district", "telangana"),
+    ("Can Salem help with an elephant attack in Wayanad", "kerala"),
+])
+def test_qualified_or_confirmed_names_route(router, query, state):
+    match = router.route(query)
+    assert match.state == state
+    assert not match.ambiguous
+
+
+def test_plain_district_still_routes(router):
+    assert router.route("Wild boar damaged crops in Chamarajanagar district").state == "karnataka"
+
+
+def test_ambiguous_query_searches_only_named_states(router):
+    engine = SimpleNamespace(state_router=router, state_list=["karnataka", "kerala", "tamilnadu", "telangana"])
+    states = RagEngine.resolve_states(engine, "Elephants in Wayanad and Kodagu, can Salem help")
+    assert states == ["karnataka", "kerala"]
@@ -0,0 +1,106 @@
+from ocr_cache import OCRCache
+from pdf_chunk import PDFTranslator
+from translation_service import EchoBackend, TranslationService
+
+
+class FailingBackend(EchoBackend):
+    """Echo backend that raises for any payload containing `fail`."""
+    def __init__(self, fail="FAIL", max_chars=4500):
+        super().__init__(tag="en:")
+        self.fail = fail
+        self.max_chars = max_chars
+        self.payloads = []
+
+    def translate(self, text, src, dest):
+        self.payloads.append(text)
+        if self.fail in text:
+            self.calls += 1
+            raise RuntimeError("service unavailable")
+        return super().translate(text, src, dest)
+
+
+class SeparatorDroppingBackend(EchoBackend):
+    """Joins paragraphs with a single newline, as some providers do."""
+    def translate(self, text, src, dest):
+        return super().translate(text, src, dest).replace("\n\n", "\n")
+
+
+def service(backend, **kwargs):
+    return TranslationService(backend, backoff=0, **kwargs)
+
+
+def test_paragraphs_are_batched_into_one_request():
+    backend = EchoBackend(tag="en:")
+    translation = service(backend)
+
+    result = translation.translate("ಒಂದು\n\nಎರಡು\n\nಮೂರು", "kn", "en")
+
+    assert result == "en:ಒಂದು\n\nen:ಎರಡು\n\nen:ಮೂರು"
+    assert backend.calls == 1
+
+
+def test_batches_respect_max_chars():
+    backend = FailingBackend(max_chars=25)
+    paragraphs = [f"paragraph number {i}" for i in range(4)]  # 18 characters each
+
+    results = service(backend).translate_many(paragraphs, "kn", "en")
+
+    assert results == [f"en:{para}" for para in paragraphs]
+    assert len(backend.payloads) == 4
+    assert all(len(payload) <= 25 for payload in backend.payloads)
+
+
+def test_oversize_text_is_split_on_sentences():
+    backend = FailingBackend(max_chars=30)
+    text = "The first sentence is here. The second one follows. And a third."
+
+    result = service(backend).translate(text, "kn", "en")
+
+    assert all(len(payload) <= 30 for payload in backend.payloads)
+    assert len(backend.payloads) > 1
+    assert result.replace("en:", "") == text
+
+
+def test_lost_separators_fall_back_to_one_request_per_paragraph():
+    backend = SeparatorDroppingBackend(tag="en:")
+
+    results = service(backend).translate_many(["ಒಂದು", "ಎರಡು"], "kn", "en")
+
+    assert results == ["en:ಒಂದು", "en:ಎರಡು"]
+    assert backend.calls == 3  # The batch, then each paragraph
+
+
+def test_failed_paragraph_keeps_its_text_and_reports_failure():
+    backend = FailingBackend()
+    translation = service(backend, retries=2)
+
+    # The failed batch is retried one paragraph at a time
+    text, ok = translation.translate_with_status("ಒಂದು\n\nFAIL ಎರಡು", "kn", "en")
+
+    assert not ok
+    assert text == "en:ಒಂದು\n\nFAIL ಎರಡು"
+    assert translation.stats["failures"] == 2  # The batch, then the paragraph
+    assert translation.translate_with_status("ಒಂದು", "kn", "en") == ("en:ಒಂದು", True)  # Cached
+
+
+def test_failures_are_not_cached():
+    backend = FailingBackend()
+    translation = service(backend, retries=1)
+    translation.translate("FAIL", "kn", "en")
+    backend.fail = "never"
+
+    assert translation.translate_with_status("FAIL", "kn", "en") == ("en:FAIL", True)
+
+
+def test_partly_failed_page_translation_is_not_cached(tmp_path):
+    cache = OCRCache(str(tmp_path / "ocr_cache"))
+    translator = PDFTranslator(cache=cache)
+    backend = FailingBackend()
+    translator.translation_service = service(backend, retries=1)
+
+    translator.finish_page("ಒಂದು\n\nFAIL ಎರಡು", translate=True, src_lang="kn", dest_lang="en", cache_key="page")
+    assert cache.get_translation("page", "kn", "en") is None
+
+    backend.fail = "never"
+    translator.finish_page("ಒಂದು\n\nFAIL ಎರಡು", translate=True, src_lang="kn", dest_lang="en", cache_key="page")
+    assert cache.get_translation("page", "kn", "en") == "en:ಒಂದು\n\nen:FAIL ಎರಡು"
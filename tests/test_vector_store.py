@@ -0,0 +1,132 @@
+import hashlib
+
+import chromadb
+import numpy as np
+from chromadb.api.types import EmbeddingFunction
+
+from vector_store import VectorStore
+
+
+class HashEmbedding(EmbeddingFunction):
+    """Deterministic bag-of-words embedding, so the tests need no model download."""
+    def __init__(self):
+        pass
+
+    def __call__(self, input):
+        embeddings = []
+        for text in input:
+            vector = np.zeros(64, dtype=np.float32)
+            for word in text.lower().split():
+                vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % 64] += 1
+            embeddings.append(vector / (np.linalg.norm(vector) or 1.0))
+        return embeddings
+
+
+def open_store(path):
+    """A VectorStore on the Chroma directory at path, as a separate process would open it."""
+    return VectorStore("test_kb", client=chromadb.PersistentClient(str(path)), embedding_function=HashEmbedding())
+
+
+def test_fingerprint_changes_when_another_store_replaces_a_chunk(tmp_path):
+    reader = open_store(tmp_path / "chroma_db")
+    writer = open_store(tmp_path / "chroma_db")
+    reader.add_documents(["Compensation is 10000 rupees.", "Report attacks to the range officer."],
+                         source="order.pdf", page=1)
+    before = reader.fingerprint()
+
+    writer.sync_page("order.pdf", 1, ["Compensation is 20000 rupees.", "Report attacks to the range officer."])
+
+    assert writer.collection.count() == 2
+    assert reader.fingerprint() != before
+
+
+def test_fingerprint_is_stable_without_writes(tmp_path):
+    store = open_store(tmp_path / "chroma_db")
+    store.add_documents(["Compensation is 10000 rupees."], source="order.pdf", page=1)
+    assert store.fingerprint() == open_store(tmp_path / "chroma_db").fingerprint()
+
+
+def test_saved_lexical_index_is_rebuilt_after_a_same_count_replacement(tmp_path):
+    path = tmp_path / "chroma_db"
+    store = open_store(path)
+    store.add_documents(["Compensation is 10000 rupees.", "Report attacks to the range officer."],
+                        source="order.pdf", page=1)
+    store.rebuild_lexical_index()
+
+    # Another process re-ingests the page; the chunk count does not change
+    open_store(path).sync_page("order.pdf", 1, ["Compensation is 20000 rupees.", "Report attacks to the range officer."])
+
+    restarted = open_store(path)
+    hits = restarted.lexical_index().search("20000", 5)
+    assert [restarted.collection.get(ids=[chunk_id])["documents"][0] for chunk_id, _ in hits] == \
+        ["Compensation is 20000 rupees."]
+    assert restarted.lexical_index().search("10000", 5) == []
+
+
+def test_saved_lexical_index_is_reused_when_nothing_changed(tmp_path, capsys):
+    path = tmp_path / "chroma_db"
+    store = open_store(path)
+    store.add_documents(["Compensation is 10000 rupees."], source="order.pdf", page=1)
+    saved = store.rebuild_lexical_index()
+    capsys.readouterr()
+
+    restarted = open_store(path)
+    assert restarted.lexical_index().revision == saved.revision
+    assert restarted.lexical_index().search("10000", 5)
+    assert "BM25 index for" not in capsys.readouterr().out  # Loaded, not rebuilt
+
+
+class TopicEmbedding(EmbeddingFunction):
+    """Counts words per topic, so a chunk can be near a query without sharing its words."""
+    TOPICS = [("tiger", "leopard"), ("elephant",), ("go", "114")]
+
+    def __init__(self):
+        pass
+
+    def __call__(self, input):
+        embeddings = []
+        for text in input:
+            words = text.lower().replace(".", "").split()
+            vector = np.array([sum(words.count(word) for word in topic) for topic in self.TOPICS] + [0.1],
+                              dtype=np.float32)
+            embeddings.append(vector / np.linalg.norm(vector))
+        return embeddings
+
+
+def test_hybrid_query_fuses_vector_and_bm25_ranks(tmp_path):
+    store = VectorStore("test_kb", client=chromadb.PersistentClient(str(tmp_path / "chroma_db")),
+                        embedding_function=TopicEmbedding())
+    near = "Leopard GO."  # Nearest by vector, but shares no word with the query
+    exact = "GO 114 on tiger attacks."  # Second by vector, first by BM25
+    store.add_documents([near, exact, "Elephant crossing."], source="order.pdf", page=1)
+
+    results = store.query_db("tiger 114", n_res=2)
+
+    # 1/(k+1) + 1/(k+2) from both lists beats 1/(k+1) from the vector list alone
+    assert results["documents"][0] == [exact, near]
+    # Ranked higher lexically than by vector, so it must not be trimmed as a distant match
+    assert results["distances"][0][0] is None and results["distances"][0][1] is not None
+
+
+class ConstantEmbedding(EmbeddingFunction):
+    """Every text gets the same vector, so only BM25 can tell chunks apart."""
+    def __init__(self):
+        pass
+
+    def __call__(self, input):
+        return [np.full(8, 8 ** -0.5, dtype=np.float32) for _ in input]
+
+
+def test_filtered_hybrid_query_finds_lexical_hits_of_a_small_state(tmp_path):
+    store = VectorStore("test_kb", client=chromadb.PersistentClient(str(tmp_path / "chroma_db")),
+                        embedding_function=ConstantEmbedding())
+    # Many other-state chunks that outscore the wanted one on the query term
+    store.add_documents([f"Compensation compensation paid in district {i}." for i in range(100)],
+                        source="karnataka.pdf", page=1, metadata={"state": "karnataka"})
+    wanted = "Compensation for crop loss is paid after the range officer inspects the field and files a report."
+    store.add_documents([f"Report wildlife sighting number {i} to the range officer." for i in range(9)] + [wanted],
+                        source="kerala.pdf", page=1, metadata={"state": "kerala"})
+
+    results = store.query_db("compensation", n_res=1, where={"state": "kerala"})
+
+    assert results["documents"][0] == [wanted]
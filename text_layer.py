@@ -0,0 +1,92 @@
+import re
+import unicodedata
+
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LTFigure, LTImage, LTTextContainer
+
+# Unicode ranges of the letters each Tesseract language should produce
+SCRIPT_RANGES = {
+    "eng": [(0x0041, 0x005A), (0x0061, 0x007A), (0x00C0, 0x024F)],
+    "hin": [(0x0900, 0x097F)],
+    "kan": [(0x0C80, 0x0CFF)],
+    "mal": [(0x0D00, 0x0D7F)],
+    "tam": [(0x0B80, 0x0BFF)],
+    "tel": [(0x0C00, 0x0C7F)],
+}
+
+_CID = re.compile(r"\(cid:\d+\)")  # pdfminer's stand-in for glyphs without a Unicode mapping
+
+
+class TextLayerReader:
+    """
+    Reads the embedded text layer of born-digital PDF pages with pdfminer.
+
+    A page's text layer is used instead of OCR only when it passes four
+    checks:
+    - length: at least min_chars non-space characters;
+    - quality: at most 1 - min_quality of them are unmapped glyphs,
+      replacement or private-use characters;
+    - script: at least min_script of the letters are in the script of the
+      page's Tesseract language. Many Indian government PDFs use legacy
+      (non-Unicode) fonts whose text layer decodes to Latin gibberish;
+      those pages fail here and are OCR'd;
+    - coverage: text boxes take up at least min_coverage of the page area
+      covered by text and images together, so a scan with a stamped header
+      or a page number still goes to OCR.
+    """
+    def __init__(self, min_chars=100, min_quality=0.95, min_script=0.6, min_coverage=0.5):
+        """
+        Initialize the reader with its acceptance thresholds.
+        """
+        self.min_chars = min_chars
+        self.min_quality = min_quality
+        self.min_script = min_script
+        self.min_coverage = min_coverage
+
+    def settings(self):
+        """Returns the thresholds, which decide what text a page yields."""
+        return {"min_chars": self.min_chars, "min_quality": self.min_quality,
+                "min_script": self.min_script, "min_coverage": self.min_coverage}
+
+    def page_text(self, pdf_path, page_no, lang):
+        """Returns the text layer of a page (1-based) if it is usable, else None."""
+        page = next(iter(extract_pages(pdf_path, page_numbers=[page_no - 1])), None)
+        if page is None:
+            return None
+        texts, text_area, image_area = [], 0.0, 0.0
+        for element in page:
+            if isinstance(element, LTTextContainer):
+                texts.append(element.get_text())
+                text_area += self._area(element, page)
+            elif isinstance(element, (LTFigure, LTImage)):
+                image_area += self._area(element, page)
+        text = "\n".join(texts).strip()
+        coverage = text_area / (text_area + image_area) if text_area + image_area else 0.0
+        return text if self.usable(text, lang, coverage) else None
+
+    @staticmethod
+    def _area(element, page):
+        # Clip to the page; scanned images often overhang it
+        width = min(element.x1, page.x1) - max(element.x0, page.x0)
+        height = min(element.y1, page.y1) - max(element.y0, page.y0)
+        return max(width, 0.0) * max(height, 0.0)
+
+    def usable(self, text, lang, coverage=1.0):
+        """Returns True if extracted text passes the length, quality, script and coverage checks."""
+        if coverage < self.min_coverage:
+            return False
+        unmapped = len(_CID.findall(text))
+        chars = [c for c in _CID.sub("", text) if not c.isspace()]
+        if len(chars) + unmapped < self.min_chars:
+            return False
+        bad = unmapped + sum(1 for c in chars if c == "\ufffd" or unicodedata.category(c) in ("Co", "Cc"))
+        if 1 - bad / (len(chars) + unmapped) < self.min_quality:
+            return False
+        ranges = [r for code in lang.split("+") for r in SCRIPT_RANGES.get(code, [])]
+        letters = [ord(c) for c in chars if c.isalpha()]
+        if not ranges:
+            return True  # No script to check for this language
+        if not letters:
+            return False
+        in_script = sum(1 for c in letters if any(low <= c <= high for low, high in ranges))
+        return in_script / len(letters) >= self.min_script
@@ -0,0 +1,233 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class GoogleBackend:
+    """
+    Translation backend using Deep Translator (Google).
+
+    One GoogleTranslator is kept per language pair instead of being built
+    on every call.
+    """
+    # deep_translator rejects payloads of 5000 characters or more
+    max_chars = 4500
+
+    def __init__(self):
+        self._translators = {}
+        self._lock = threading.Lock()
+
+    def _translator(self, src, dest):
+        with self._lock:
+            if (src, dest) not in self._translators:
+                from deep_translator import GoogleTranslator
+                self._translators[(src, dest)] = GoogleTranslator(source=src, target=dest)
+            return self._translators[(src, dest)]
+
+    def translate(self, text, src, dest):
+        """Translates one payload; raises on failure so the service can retry."""
+        return self._translator(src, dest).translate(text)
+
+
+class EchoBackend:
+    """
+    Offline stand-in backend for tests and benchmarks.
+
+    Returns the input unchanged (optionally tagged) after a fixed delay that
+    simulates a network round trip.
+    """
+    max_chars = 4500
+
+    def __init__(self, latency=0.0, tag=""):
+        self.latency = latency
+        self.tag = tag
+        self.calls = 0
+
+    def translate(self, text, src, dest):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if not self.tag:
+            return text
+        return "\n\n".join(f"{self.tag}{para}" for para in text.split("\n\n"))
+
+
+class TranslationService:
+    """
+    A shared translation engine that batches paragraphs, runs requests
+    concurrently with retries, and memoizes results by (text, src, dest).
+
+    Paragraphs are packed into payloads of up to backend.max_chars characters,
+    joined with a blank line, and split back apart after translation. If the
+    provider does not preserve the paragraph separators, the batch is retried
+    one paragraph at a time.
+    """
+    separator = "\n\n"
+
+    def __init__(self, backend=None, max_workers=4, retries=3, backoff=0.5, cache_size=10000):
+        """
+        Initialize the service with a backend and concurrency/retry settings.
+        """
+        self.backend = backend or GoogleBackend()
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.stats = {"hits": 0, "misses": 0, "requests": 0, "failures": 0}
+
+    def translate(self, text, src, dest):
+        """
+        Translates a block of text paragraph by paragraph.
+
+        Returns the original text for any paragraph that could not be translated.
+        """
+        return self.translate_with_status(text, src, dest)[0]
+
+    def translate_with_status(self, text, src, dest):
+        """
+        Like translate, but returns (text, ok); ok is False if any paragraph
+        could not be translated and was kept in the original language.
+        """
+        if not text or not text.strip() or src == dest:
+            return text, True
+        paragraphs = [para.strip() for para in text.split(self.separator) if para.strip()]
+        results, ok = self._translate_many(paragraphs, src, dest)
+        return self.separator.join(results), ok
+
+    def translate_many(self, texts, src, dest):
+        """Translates a list of texts, returning results in the same order."""
+        return self._translate_many(texts, src, dest)[0]
+
+    def _translate_many(self, texts, src, dest):
+        """Returns (results, ok); failed pieces keep their original text and make ok False."""
+        ok = True
+        results = [None] * len(texts)
+        missing = {}
+        with self._lock:
+            for i, text in enumerate(texts):
+                key = (text, src, dest)
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    results[i] = self._cache[key]
+                    self.stats["hits"] += 1
+                else:
+                    missing.setdefault(text, []).append(i)
+                    self.stats["misses"] += 1
+
+        if missing:
+            # Long texts are split into pieces that each fit in one request
+            pieces = {text: self._split_long(text, self.backend.max_chars) for text in missing}
+            unique_pieces = list(dict.fromkeys(piece for text in missing for piece in pieces[text]))
+            batches = self._make_batches(unique_pieces, self.backend.max_chars)
+            futures = [self._executor.submit(self._translate_batch, batch, src, dest) for batch in batches]
+            translated = {}
+            for batch, future in zip(batches, futures):
+                translated.update(zip(batch, future.result()))
+            ok = all(translated[piece] is not None for piece in unique_pieces)
+            for text, indices in missing.items():
+                # Keep the original text of any piece that failed
+                result = " ".join(piece if translated[piece] is None else translated[piece] for piece in pieces[text])
+                for i in indices:
+                    results[i] = result
+        return results, ok
+
+    def _make_batches(self, texts, max_chars):
+        """Packs texts into batches whose joined length stays within max_chars."""
+        batches, current, length = [], [], 0
+        for text in texts:
+            added = len(text) + (len(self.separator) if current else 0)
+            if current and length + added > max_chars:
+                batches.append(current)
+                current, length = [], 0
+                added = len(text)
+            current.append(text)
+            length += added
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _split_long(text, max_chars):
+        """Splits a text longer than max_chars on line or sentence boundaries."""
+        if len(text) <= max_chars:
+            return [text]
+        pieces, current = [], ""
+        for part in re.split(r"(?<=[\n.!?।])\s*", text):
+            while len(part) > max_chars:  # No boundary to split on; cut hard
+                if current:
+                    pieces.append(current)
+                    current = ""
+                pieces.append(part[:max_chars])
+                part = part[max_chars:]
+            if current and len(current) + len(part) + 1 > max_chars:
+                pieces.append(current)
+                current = part
+            else:
+                current = f"{current} {part}" if current else part
+        if current:
+            pieces.append(current)
+        return pieces
+
+    def _translate_batch(self, batch, src, dest):
+        """
+        Translates one batch, falling back to one request per text if separators are lost.
+
+        Returns one result per text, None where translation failed.
+        """
+        translated = self._call_with_retry(self.separator.join(batch), src, dest)
+        if len(batch) == 1:
+            parts = [translated]
+        else:
+            parts = translated.split(self.separator) if translated is not None else []
+            if len(parts) != len(batch):
+                parts = [self._call_with_retry(text, src, dest) for text in batch]
+
+        results = []
+        with self._lock:
+            for text, result in zip(batch, parts):
+                if result is None:
+                    results.append(None)
+                    continue
+                result = result.strip()
+                self._remember(text, src, dest, result)
+                results.append(result)
+        return results
+
+    def _call_with_retry(self, payload, src, dest):
+        """Calls the backend with exponential backoff; returns None after the last failure."""
+        for attempt in range(self.retries):
+            try:
+                with self._lock:  # Batches run on several threads
+                    self.stats["requests"] += 1
+                return self.backend.translate(payload, src, dest)
+            except Exception as e:
+                if attempt == self.retries - 1:
+                    with self._lock:
+                        self.stats["failures"] += 1
+                    print(f"Translation Error: {e}")
+                    return None
+                time.sleep(self.backoff * (2 ** attempt))
+
+    def _remember(self, text, src, dest, result):
+        self._cache[(text, src, dest)] = result
+        self._cache.move_to_end((text, src, dest))
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_translation_service():
+    """Returns the process-wide TranslationService, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = TranslationService()
+        return _service
@@ -1,97 +1,328 @@
 import chromadb
+import hashlib
+import json
+import os
+import threading
 import uuid
-from pdf_chunk import PDFTranslator
+from chromadb.utils import embedding_functions
+from lexical_index import BM25Index
+
+# The unified collection: every state's chunks, told apart by metadata
+KNOWLEDGE_BASE = "knowledge_base"
 
 class VectorStore:
     """
     A class to represent a vector store using ChromaDB.
     """
-    def __init__(self, collection_name):
+    # Reciprocal rank fusion constant; 60 is the usual choice
+    rrf_k = 60
+
+    def __init__(self, collection_name, client=None, embedding_function=None, index_dir=None):
         """
         Initialize the vector store with a collection name.
+        Pass an existing client and embedding function to share them across stores.
+        The BM25 index is kept in index_dir, by default next to the Chroma
+        directory (./chroma_db_bm25 for ./chroma_db), together with the
+        collection's revision marker.
         """
         self.collection_name = collection_name
-        self.client = chromadb.PersistentClient("./chroma_db")
+        self.client = client or chromadb.PersistentClient("./chroma_db")
+        # Chroma's default ONNX MiniLM model unless another is configured
+        self.embedding_function = embedding_function or embedding_functions.DefaultEmbeddingFunction()
         self.collection = self.client.create_collection(name=self.collection_name, metadata={
-        "hnsw:space": "cosine"}, get_or_create=True)
+        "hnsw:space": "cosine"}, get_or_create=True, embedding_function=self.embedding_function)
+        self.version = 0  # Bumped on every write made through this store
+
+        if index_dir is None and self.client.get_settings().is_persistent:
+            index_dir = self.client.get_settings().persist_directory.rstrip("/\\") + "_bm25"
+        self.index_path = os.path.join(index_dir, collection_name + ".npz") if index_dir else None
+        # Replaced by every writer, in any process; see mark_changed()
+        self.revision_path = os.path.join(index_dir, collection_name + ".rev") if index_dir else None
+        if self.revision_path and not os.path.exists(self.revision_path):
+            self._write_revision()  # Unknown history: start a revision, so derived state is rebuilt once
+        self._lexical_index = None  # Loaded on the first hybrid query
+        self._lexical_masks = (None, {})  # (index, {where: BM25 mask of the chunks passing the filter})
+        self._lexical_lock = threading.Lock()
         
     
-    def add_documents(self, documents):
+    @staticmethod
+    def chunk_id(document, source=None, page=None):
         """
-        Add documents to the vector store.
+        Return a deterministic id for a chunk from its source, page and content.
         """
+        key = f"{source or ''}\x00{page if page is not None else ''}\x00{document}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+    def add_documents(self, documents, source=None, page=None, metadata=None):
+        """
+        Add documents to the vector store.
 
+        Ids are content hashes, so re-adding the same chunk is a no-op and
+        only chunks not already in the collection are embedded.
+        metadata (e.g. {"state": "kerala", "language": "en"}) is stored with
+        every chunk alongside source and page.
+        Returns the ids of the documents.
+        """
+        # Identical chunks collapse to one id; keep the first occurrence
+        chunks = {}
+        for document in documents:
+            chunks.setdefault(self.chunk_id(document, source, page), document)
+        ids = list(chunks)
 
-        ids = []
+        existing = set(self.collection.get(ids=ids, include=[])["ids"]) if ids else set()
+        new_ids = [chunk_id for chunk_id in ids if chunk_id not in existing]
+        if not new_ids:
+            return ids
 
-        for i in range(len(documents)):
-            ids.append(str(uuid.uuid4()))
+        metadata = dict(metadata or {})
+        if source is not None:
+            metadata["source"] = source
+        if page is not None:
+            metadata["page"] = page
 
-        
         # insert documents into the collection
-        self.collection.add(
-            documents=documents,
-            ids=ids)
+        self.collection.upsert(
+            documents=[chunks[chunk_id] for chunk_id in new_ids],
+            ids=new_ids,
+            metadatas=[metadata] * len(new_ids) if metadata else None)
 
-        print("Documents added to the vector store.")
+        self.mark_changed()
+        print(f"{len(new_ids)} documents added to the vector store ({len(ids) - len(new_ids)} unchanged).")
+        return ids
 
-    def query_db(self, query, n_res = 3):
+    def sync_page(self, source, page, documents, metadata=None):
         """
-        Query the vector store.
+        Make the stored chunks for one source page match `documents`.
+
+        New or changed chunks are embedded and upserted, and chunks that are
+        no longer on the page are deleted. Returns the number of deleted chunks.
         """
-        results = self.collection.query(query_texts=query, n_results=n_res)
-        return results
-    
-    def delete_collection(self, collection_name = None):
-        if collection_name is None:
-            return "Please provide a collection name to delete."
-        else:
-            self.client.delete_collection(collection_name)
-    
+        ids = set(self.add_documents(documents, source=source, page=page, metadata=metadata)) if documents else set()
+        stored = self.collection.get(where={"$and": [{"source": source}, {"page": page}]}, include=[])["ids"]
+        stale = [chunk_id for chunk_id in stored if chunk_id not in ids]
+        if stale:
+            self.collection.delete(ids=stale)
+            self.mark_changed()
+        return len(stale)
 
-if __name__ == "__main__":
-    # Example usage
-    translator = PDFTranslator()
+    def prune_source(self, source, pages):
+        """
+        Delete chunks of `source` whose page is not in `pages` (e.g. the PDF got shorter).
+        """
+        where = {"source": source} if not pages else {"$and": [{"source": source}, {"page": {"$nin": list(pages)}}]}
+        stale = self.collection.get(where=where, include=[])["ids"]
+        if stale:
+            self.collection.delete(ids=stale)
+            self.mark_changed()
+            print(f"Removed {len(stale)} chunks from pages no longer in {source}.")
+        return len(stale)
 
-    # kerala_vector_store = VectorStore(collection_name="kerala_knowledge_base")
-    # chunks = translator.process_pdf("source/kerala.pdf", lang="eng", translate=False, src_lang="en", dest_lang="en")
-    # for _, chunk in chunks:
-    #     kerala_vector_store.add_documents(chunk)
-    # print("Kerala vector store populated.")
+    def add_pages(self, pages, source=None, metadata=None):
+        """
+        Add (page_no, data) results to the vector store as they arrive.
 
+        Accepts the generator from PDFTranslator.process_pdf(stream=True), so
+        each page is stored before the next one is rasterized. With a source,
+        ingestion is incremental: each page is synced with sync_page, and
+        pages that disappeared from the source are pruned at the end.
+        """
+        seen_pages = []
+        for page_no, data in pages:
+            documents = [data] if isinstance(data, str) else data
+            documents = [doc for doc in documents if doc and doc.strip()]
+            seen_pages.append(page_no)
+            if source is not None:
+                self.sync_page(source, page_no, documents, metadata=metadata)
+            elif documents:
+                self.add_documents(documents, page=page_no, metadata=metadata)
+            if not documents:
+                print(f"Page {page_no}: no text to add.")
+        if source is not None:
+            self.prune_source(source, seen_pages)
+        self.rebuild_lexical_index()
 
-    # karnataka_vector_store = VectorStore(collection_name="karnataka_knowledge_base")
-    # ktaka_coll = karnataka_vector_store.client.get_collection("karnataka_knowledge_base")
-    # chunks = translator.process_pdf("karnataka.pdf", lang="kan", translate=True, src_lang="kn", dest_lang="en")
-    # print(chunks)
-    # for _, chunk in chunks:
-    #     ktaka_coll.add(
-    #         documents=chunk,
-    #         ids=[str(uuid.uuid4())]
-    #     )
-    # print("Karnataka vector store populated.")
+    def mark_changed(self):
+        """
+        Record a write to the collection; call after every upsert or delete.
 
-    # tamilnadu_vector_store = VectorStore(collection_name="tamilnadu_knowledge_base")
-    # chunks = translator.process_pdf("source/tamil-nadu.pdf", "tam", translate=True, src_lang="ta", dest_lang="en")
-    # for _, chunk in chunks:
-    #     tamilnadu_vector_store.add_documents(chunk)
-    # print("Tamil Nadu vector store populated.")
+        Bumps the in-process version and writes a new revision marker, so
+        other processes sharing the Chroma directory (an ingestion run, the
+        FAQ crawler, a migration) see the change even when the number of
+        chunks stays the same.
+        """
+        self.version += 1
+        if self.revision_path:
+            self._write_revision()
 
+    def _write_revision(self):
+        os.makedirs(os.path.dirname(self.revision_path), exist_ok=True)
+        tmp_path = f"{self.revision_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(uuid.uuid4().hex)
+        os.replace(tmp_path, self.revision_path)
 
-    telangana_vector_store = VectorStore(collection_name="telangana_knowledge_base")
-    chunks = translator.process_pdf("source/telangana.pdf", "eng", translate=False, src_lang="te", dest_lang="en")
-    print(chunks)
-    for _, chunk in chunks:
-        telangana_vector_store.add_documents(chunk)
+    def revision(self):
+        """
+        Return the collection's current revision, as last recorded by any writer.
+        Stores without a directory (in-memory clients) use the local version.
+        """
+        if not self.revision_path:
+            return str(self.version)
+        try:
+            with open(self.revision_path, encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
 
+    def fingerprint(self):
+        """
+        Return a cheap token that changes when the collection's contents change,
+        including writes made by other processes.
+        """
+        return (self.collection.count(), self.revision())
+
+    def lexical_index(self):
+        """
+        Return the collection's BM25 index, loading or rebuilding it when needed.
+
+        The index in memory, or else the saved one, is used if it was built
+        at the collection's current revision. After any write, by this store
+        or by another process, it is rebuilt from the collection's documents.
+        """
+        with self._lexical_lock:
+            revision = self.revision()
+            index = self._lexical_index
+            if index is not None and revision is not None and index.revision == revision:
+                return index
+            if self.index_path and os.path.exists(self.index_path):
+                index = BM25Index.load(self.index_path)
+                if revision is not None and index.revision == revision:
+                    self._lexical_index = index
+                    return index
+            return self._rebuild_lexical_index()
+
+    def rebuild_lexical_index(self):
+        """
+        Rebuild and save the BM25 index from the collection's current documents.
+        Called at the end of ingestion.
+        """
+        with self._lexical_lock:
+            return self._rebuild_lexical_index()
 
+    def _rebuild_lexical_index(self):
+        # Read before the documents: a write in between leaves the index a revision behind, not wrongly current
+        revision = self.revision()
+        stored = self.collection.get(include=["documents"])
+        index = BM25Index.build(stored["ids"], stored["documents"], revision=revision)
+        if self.index_path:
+            index.save(self.index_path)
+        self._lexical_index = index
+        print(f"BM25 index for {self.collection_name}: {len(index)} chunks, {index.nbytes() / 2**20:.1f} MiB")
+        return index
 
+    def query_db(self, query, n_res = 3, query_embeddings=None, hybrid=True, where=None):
+        """
+        Query the vector store.
+        Pass precomputed query_embeddings to skip embedding the query text again,
+        and a Chroma where filter (e.g. {"state": "kerala"}) to restrict the search.
 
+        With hybrid=True the vector results are fused with BM25 results by
+        reciprocal rank fusion, so exact terms such as GO numbers, amounts
+        and species names are found even when OCR noise hurts the embedding.
+        Results keep Chroma's shape and fused order. Distances are None for
+        chunks that rank higher lexically than by vector, so the context
+        assembler does not trim keyword matches as low relevance.
+        """
+        if not hybrid:
+            if query_embeddings is not None:
+                return self.collection.query(query_embeddings=query_embeddings, n_results=n_res, where=where)
+            results = self.collection.query(query_texts=query, n_results=n_res, where=where)
+            return results
+
+        count = self.collection.count()
+        candidates = min(max(4 * n_res, 20), count)
+        if not candidates:
+            return {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+        if query_embeddings is not None:
+            vector = self.collection.query(query_embeddings=query_embeddings, n_results=candidates, where=where)
+        else:
+            vector = self.collection.query(query_texts=query, n_results=candidates, where=where)
+        index = self.lexical_index()
+        # The BM25 index covers the whole collection; filter before ranking, so a
+        # small state's hits are not crowded out by other states'
+        mask = self._lexical_mask(index, where) if where is not None else None
+        lexical = index.search(query, candidates, mask=mask)
 
+        vector_ranks = {chunk_id: rank for rank, chunk_id in enumerate(vector["ids"][0])}
+        lexical_ranks = {chunk_id: rank for rank, (chunk_id, _) in enumerate(lexical)}
+        fused = {}
+        for ranks in (vector_ranks, lexical_ranks):
+            for chunk_id, rank in ranks.items():
+                fused[chunk_id] = fused.get(chunk_id, 0.0) + 1.0 / (self.rrf_k + rank + 1)
+        top = sorted(fused, key=fused.get, reverse=True)[:n_res]
+
+        found = {chunk_id: (document, metadata, distance) for chunk_id, document, metadata, distance in
+                 zip(vector["ids"][0], vector["documents"][0], vector["metadatas"][0], vector["distances"][0])}
+        missing = [chunk_id for chunk_id in top if chunk_id not in found]
+        if missing:
+            stored = self.collection.get(ids=missing, include=["documents", "metadatas"])
+            for chunk_id, document, metadata in zip(stored["ids"], stored["documents"], stored["metadatas"]):
+                found[chunk_id] = (document, metadata, None)
+        top = [chunk_id for chunk_id in top if chunk_id in found]
+        distances = [None if lexical_ranks.get(chunk_id, candidates) < vector_ranks.get(chunk_id, candidates)
+                     else found[chunk_id][2] for chunk_id in top]
+
+        return {"ids": [top],
+                "documents": [[found[chunk_id][0] for chunk_id in top]],
+                "metadatas": [[found[chunk_id][1] for chunk_id in top]],
+                "distances": [distances]}
+    
+    def _lexical_mask(self, index, where):
+        """Returns the BM25 mask of the chunks matching a where filter, cached until the index changes."""
+        masked_index, masks = self._lexical_masks
+        if masked_index is not index or len(masks) >= 64:
+            masks = {}
+            self._lexical_masks = (index, masks)
+        key = json.dumps(where, sort_keys=True)
+        if key not in masks:
+            masks[key] = index.mask(self.collection.get(where=where, include=[])["ids"])
+        return masks[key]
+
+    def delete_collection(self, collection_name = None):
+        if collection_name is None:
+            return "Please provide a collection name to delete."
+        else:
+            self.client.delete_collection(collection_name)
+    
+
+if __name__ == "__main__":
+    # Example usage
+    from ingest_writer import IngestionWriter
+    from ocr_cache import OCRCache
+    from pdf_chunk import PDFTranslator
 
+    translator = PDFTranslator(cache=OCRCache())
+    # Every state goes into one collection; state and language are stored as chunk metadata
+    vector_store = VectorStore(collection_name=KNOWLEDGE_BASE)
 
+    # Re-running a block only embeds chunks that are new or changed since the last run
+    # chunks = translator.process_pdf("source/kerala.pdf", lang="eng", translate=False, src_lang="en", dest_lang="en", stream=True)
+    # vector_store.add_pages(chunks, source="source/kerala.pdf", metadata={"state": "kerala", "language": "en"})
+    # print("Kerala documents added.")
 
 
+    # chunks = translator.process_pdf("karnataka.pdf", lang="kan", translate=True, src_lang="kn", dest_lang="en", stream=True)
+    # vector_store.add_pages(chunks, source="karnataka.pdf", metadata={"state": "karnataka", "language": "kn"})
+    # print("Karnataka documents added.")
 
+    # chunks = translator.process_pdf("source/tamil-nadu.pdf", "tam", translate=True, src_lang="ta", dest_lang="en", stream=True)
+    # vector_store.add_pages(chunks, source="source/tamil-nadu.pdf", metadata={"state": "tamilnadu", "language": "ta"})
+    # print("Tamil Nadu documents added.")
 
 
+    chunks = translator.process_pdf("source/telangana.pdf", "eng", translate=False, src_lang="te", dest_lang="en", stream=True)
+    # Embeds cross-page batches in the background while the next pages are OCR'd
+    writer = IngestionWriter(vector_store)
+    writer.write_pages(chunks, source="source/telangana.pdf", metadata={"state": "telangana", "language": "en"})
+    print(f"Ingested {writer.stats['chunks']} chunks at {writer.chunks_per_second():.1f} chunks/s")
+    print(f"OCR cache stats: {translator.cache.stats}")